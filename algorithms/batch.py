@@ -0,0 +1,95 @@
+# algorithms/batch.py
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from algorithms.metrics import as_int_array
+from algorithms.process_table import ProcessTable
+
+# Llegada de las posiciones de relleno: se ordenan al final de cada traza
+PADDING_ARRIVAL = np.iinfo(np.int64).max // 4
+
+
+def fifo_batch(arrival, burst, lengths: Optional[Sequence[int]] = None) -> Dict[str, np.ndarray]:
+    """
+    FIFO para muchas trazas a la vez: `arrival` y `burst` son matrices
+    (trazas × procesos) y cada fila se simula de forma independiente, con
+    el mismo resultado que fifo_scheduler.
+
+    En FIFO el fin del k-ésimo proceso (en orden de llegada) es
+    fin_k = max(fin_{k-1}, llegada_k) + burst_k, que se despliega como
+    fin_k = C_k + max(0, max_{j<=k}(llegada_j - C_{j-1})) con C la suma
+    acumulada de los bursts. Así toda la simulación es un ordenamiento, dos
+    sumas acumuladas y un máximo acumulado por fila, sin ciclos de Python.
+
+    Con `lengths`, la fila r solo tiene lengths[r] procesos válidos y el
+    resto es relleno que no cuenta en los promedios.
+
+    Devuelve matrices en el orden original de los procesos ('start', 'end',
+    'waiting_time') y por traza 'avg_waiting_time' y 'makespan' (fin del
+    último proceso). En las posiciones de relleno 'waiting_time' vale 0.
+    """
+    arrival = np.array(arrival, dtype=np.int64, ndmin=2)
+    burst = np.array(burst, dtype=np.int64, ndmin=2)
+    if arrival.shape != burst.shape or arrival.ndim != 2:
+        raise ValueError("arrival y burst deben ser matrices del mismo tamaño (trazas × procesos)")
+    traces, n = arrival.shape
+
+    valid = None
+    if lengths is not None:
+        lengths = np.asarray(lengths, dtype=np.int64)
+        valid = np.arange(n) < lengths[:, None]
+        # El relleno llega al final y no ocupa la CPU
+        arrival = np.where(valid, arrival, PADDING_ARRIVAL)
+        burst = np.where(valid, burst, 0)
+
+    # Orden de llegada estable por fila, como ProcessTable.arrival_order
+    order = np.argsort(arrival, axis=1, kind="stable")
+    a = np.take_along_axis(arrival, order, axis=1)
+    b = np.take_along_axis(burst, order, axis=1)
+
+    c = np.cumsum(b, axis=1)
+    offset = np.maximum.accumulate(a - (c - b), axis=1)
+    end_sorted = c + np.maximum(offset, 0)
+
+    rows = np.arange(traces)[:, None]
+    end = np.empty_like(end_sorted)
+    end[rows, order] = end_sorted
+    start = end - burst
+    waiting = start - arrival
+
+    if valid is None:
+        count = np.full(traces, n)
+        makespan = end_sorted[:, -1] if n else np.zeros(traces, dtype=np.int64)
+    else:
+        count = lengths
+        waiting = np.where(valid, waiting, 0)
+        start = np.where(valid, start, 0)
+        end = np.where(valid, end, 0)
+        makespan = end.max(axis=1) if n else np.zeros(traces, dtype=np.int64)
+
+    avg = waiting.sum(axis=1) / np.maximum(count, 1)
+    return {
+        'start': start,
+        'end': end,
+        'waiting_time': waiting,
+        'avg_waiting_time': avg,
+        'makespan': makespan
+    }
+
+
+def stack_tables(tables: Sequence[ProcessTable]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Junta varias ProcessTable (de cualquier largo) en las matrices
+    (arrival, burst, lengths) que recibe fifo_batch, con relleno al final.
+    """
+    lengths = np.array([len(t) for t in tables], dtype=np.int64)
+    n = int(lengths.max()) if len(tables) else 0
+    arrival = np.zeros((len(tables), n), dtype=np.int64)
+    burst = np.zeros((len(tables), n), dtype=np.int64)
+    for r, table in enumerate(tables):
+        k = len(table)
+        arrival[r, :k] = as_int_array(table.arrival_time)
+        burst[r, :k] = as_int_array(table.burst_time)
+    return arrival, burst, lengths
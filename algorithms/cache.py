@@ -0,0 +1,236 @@
+# algorithms/cache.py
+
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from algorithms.process_table import ProcessTable
+from algorithms.timeline import Timeline
+
+# Se incluye en el nombre de los archivos: al cambiar el formato de los
+# resultados basta con subirla para ignorar lo que haya en disco
+CACHE_VERSION = 1
+# Límites por defecto de la memoria y del directorio de la caché
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+DEFAULT_MAX_DISK_BYTES = 2 ** 30
+
+
+def table_digest(table: ProcessTable) -> str:
+    """
+    Huella del contenido de la tabla: dos tablas con los mismos procesos en
+    el mismo orden tienen la misma huella. Se calcula en una pasada sobre
+    los buffers de las columnas, sin convertirlas a dicts.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(len(table).to_bytes(8, "little"))
+    for column in (table.burst_time, table.arrival_time, table.priority):
+        h.update(column)
+    # Los pids vienen de líneas de archivo, así que no contienen saltos de línea
+    h.update("\n".join(str(pid) for pid in table.pid).encode("utf-8"))
+    return h.hexdigest()
+
+
+def result_key(digest: str, name: str, quantum: Optional[int] = None, **params) -> tuple:
+    """Clave de un resultado: huella de la tabla, algoritmo y parámetros."""
+    return (digest, name, quantum, tuple(sorted(params.items())))
+
+
+def result_size(value) -> int:
+    """
+    Tamaño aproximado en bytes de un resultado: los buffers de las columnas
+    de sus líneas de tiempo más el tamaño superficial de los demás valores.
+    La columna de pids de un Timeline es la de la tabla de procesos y no se
+    cuenta.
+    """
+    if isinstance(value, Timeline):
+        columns = [value.pid_index, value.start, value.end, getattr(value, 'core', None)]
+        return sum(len(column) * column.itemsize for column in columns if column is not None)
+    if isinstance(value, array):
+        return len(value) * value.itemsize
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(result_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(result_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _without_pids(result):
+    """Copia superficial de `result` con sus Timeline sin la columna de pids (las columnas no se copian)."""
+    if not isinstance(result, dict):
+        return result
+    stripped = dict(result)
+    for name, value in result.items():
+        if isinstance(value, Timeline):
+            stripped[name] = copy.copy(value)
+            stripped[name].pids = None
+    return stripped
+
+
+def _attach_pids(result, pids) -> None:
+    if isinstance(result, dict):
+        for value in result.values():
+            if isinstance(value, Timeline) and value.pids is None:
+                value.pids = pids
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados de simulación con a lo sumo `max_entries`
+    entradas y `max_bytes` bytes (según result_size) en memoria. Un
+    resultado más grande que `max_bytes` no se conserva en memoria.
+
+    Con `path`, cada resultado también se guarda en ese directorio (un
+    archivo pickle por clave) y los fallos en memoria se buscan ahí antes de
+    recalcular, así que sobrevive entre ejecuciones. Después de cada
+    escritura, si los archivos suman más de `max_disk_bytes` se borran los
+    usados hace más tiempo (nunca el recién escrito); None deja crecer el
+    directorio sin límite. `clear(disk=True)` lo vacía.
+
+    En disco los Timeline se guardan sin la columna de pids (la de la tabla
+    de procesos, que puede ser mucho más grande que el resultado): quien lee
+    pasa `pids` a `get` para volver a asociarla, así que los resultados en
+    memoria comparten la columna de la tabla.
+
+    Una misma instancia se puede usar desde varios hilos (p. ej. las
+    sesiones de Streamlit): el LRU, el contador de bytes y la poda del disco
+    están protegidos por un candado.
+
+    Los resultados se devuelven tal cual, sin copiar: quien los usa no debe
+    modificarlos.
+    """
+
+    def __init__(self, max_entries: int = 64, path: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_BYTES):
+        if max_entries < 1:
+            raise ValueError("El tamaño de la caché debe ser un entero mayor que 0")
+        if max_bytes < 1 or (max_disk_bytes is not None and max_disk_bytes < 1):
+            raise ValueError("El límite de bytes de la caché debe ser un entero mayor que 0")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.path = path
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self.lock:
+            if key in self.entries:
+                return True
+        return self.path is not None and os.path.exists(self._file(key))
+
+    def _file(self, key: Hashable) -> str:
+        name = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.path, f"v{CACHE_VERSION}-{name}.pkl")
+
+    def _remember(self, key: Hashable, result) -> None:
+        self.nbytes -= self.sizes.get(key, 0)
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        self.sizes[key] = size = result_size(result)
+        self.nbytes += size
+        while self.entries and (len(self.entries) > self.max_entries or self.nbytes > self.max_bytes):
+            old, _ = self.entries.popitem(last=False)
+            self.nbytes -= self.sizes.pop(old)
+
+    def _prune_disk(self, keep: str) -> None:
+        """Borra los archivos usados hace más tiempo (salvo `keep`) hasta volver a `max_disk_bytes`."""
+        files = []
+        total = 0
+        for entry in os.scandir(self.path):
+            if not entry.name.endswith(".pkl"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            total += stat.st_size
+            if entry.path != keep:
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        if total <= self.max_disk_bytes:
+            return
+        files.sort()
+        for _, size, name in files:
+            try:
+                os.unlink(name)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+
+    def get(self, key: Hashable, pids=None):
+        """
+        Resultado guardado para `key` o None. `pids` es la columna de pids
+        de la tabla, que se asocia a los Timeline leídos del disco.
+        """
+        with self.lock:
+            result = self.entries.get(key)
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return result
+        if self.path is not None:
+            name = self._file(key)
+            try:
+                with open(name, "rb") as f:
+                    result = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+                # Sin archivo o de una versión incompatible: se recalcula
+                result = None
+            if result is not None:
+                try:
+                    # La fecha de modificación marca el último uso para la poda
+                    os.utime(name)
+                except OSError:
+                    pass
+                _attach_pids(result, pids)
+                with self.lock:
+                    self._remember(key, result)
+                    self.hits += 1
+                return result
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: Hashable, result) -> None:
+        with self.lock:
+            self._remember(key, result)
+        if self.path is not None:
+            # Escritura atómica: nunca queda un archivo a medias con el nombre final
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(_without_pids(result), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._file(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            if self.max_disk_bytes is not None:
+                with self.lock:
+                    self._prune_disk(keep=self._file(key))
+
+    def clear(self, disk: bool = False) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.nbytes = 0
+            if disk and self.path is not None:
+                for name in os.listdir(self.path):
+                    if name.endswith(".pkl"):
+                        os.unlink(os.path.join(self.path, name))
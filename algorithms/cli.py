@@ -0,0 +1,168 @@
+# algorithms/cli.py
+"""
+Simulador de calendarización por línea de comandos, sin Streamlit.
+
+Ejemplos:
+
+    python -m algorithms.cli data/process_srtf.txt
+    python -m algorithms.cli data/process_round.txt -a rr -q 1 -q 2 --format json
+    python -m algorithms.cli traza.txt -a fifo -a srtf --metrics --timeline timeline.csv
+    python -m algorithms.cli traza.txt --cache-dir .cache
+
+Solo se importan los módulos necesarios: NumPy únicamente con --metrics y
+el pool de procesos únicamente con --jobs mayor que 1.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from algorithms.parsers import parse_processes
+from algorithms.registry import SCHEDULERS, expand_jobs, job_label, run_scheduler
+
+# Alias aceptados en la línea de comandos -> nombre del registro
+ALIASES = {
+    "fifo": "FIFO",
+    "sjf": "SJF",
+    "srtf": "SRTF",
+    "rr": "Round Robin",
+    "round-robin": "Round Robin",
+    "priority": "Priority"
+}
+
+METRIC_FIELDS = [
+    "avg_turnaround_time", "avg_response_time", "cpu_utilization",
+    "throughput", "context_switches", "total_time", "makespan"
+]
+
+
+def algorithm_name(value):
+    name = ALIASES.get(value.lower(), value)
+    if name not in SCHEDULERS:
+        raise argparse.ArgumentTypeError(
+            f"algoritmo desconocido: {value} (opciones: {', '.join(ALIASES)})"
+        )
+    return name
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms.cli",
+        description="Ejecuta algoritmos de calendarización sobre un archivo de procesos."
+    )
+    parser.add_argument("file", help="archivo de procesos (pid,burst_time,arrival_time,priority)")
+    parser.add_argument("-a", "--algorithm", action="append", type=algorithm_name,
+                        help="algoritmo a ejecutar; se puede repetir (por defecto: todos)")
+    parser.add_argument("-q", "--quantum", action="append", type=int,
+                        help="quantum para Round Robin; se puede repetir (por defecto: 2)")
+    parser.add_argument("-f", "--format", choices=["csv", "json"], default="csv",
+                        help="formato de salida (por defecto: csv)")
+    parser.add_argument("-o", "--output", help="archivo de salida (por defecto: stdout)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="incluir métricas completas (turnaround, respuesta, utilización, ...)")
+    parser.add_argument("--timeline", metavar="PATH",
+                        help="escribir la línea de tiempo; en JSON usar '-' para incluirla en la salida")
+    parser.add_argument("--max-errors", type=int, default=50,
+                        help="máximo de errores de validación a reportar (por defecto: 50)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="procesos en paralelo (por defecto: 1, sin pool)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="guardar los resultados en DIR y reutilizarlos si la traza no cambió")
+    parser.add_argument("--cache-size", type=int, default=1024, metavar="MB",
+                        help="tamaño máximo de --cache-dir; se borran los resultados usados hace más tiempo "
+                             "(por defecto: 1024, 0 = sin límite)")
+    return parser
+
+
+def run(table, jobs, workers, cache=None):
+    """Ejecuta las simulaciones y devuelve [(algoritmo, quantum, resultado)] en el orden pedido."""
+    if workers > 1 or cache is not None:
+        from algorithms.compare import run_comparison
+        results = dict(run_comparison(table, jobs, max_workers=workers, cache=cache))
+        return [(name, quantum, results[(name, quantum)]) for name, quantum in jobs]
+    return [(name, quantum, run_scheduler(name, table, quantum, compact=True)) for name, quantum in jobs]
+
+
+def summarize(table, results, with_metrics):
+    rows = []
+    if with_metrics:
+        from algorithms.metrics import compute_metrics
+    for name, quantum, result in results:
+        row = {"algorithm": name, "quantum": quantum, "avg_waiting_time": result["avg_waiting_time"]}
+        if with_metrics:
+            metricas = compute_metrics(table, result["timeline"])
+            row.update({field: metricas[field] for field in METRIC_FIELDS})
+            for metric, points in metricas["percentiles"].items():
+                for point, value in points.items():
+                    row[f"{metric}_{point}"] = value
+        rows.append(row)
+    return rows
+
+
+def write_timeline_csv(stream, results):
+    writer = csv.writer(stream)
+    writer.writerow(["algorithm", "quantum", "pid", "start", "end"])
+    for name, quantum, result in results:
+        for bloque in result["timeline"]:
+            writer.writerow([name, quantum, bloque["pid"], bloque["start"], bloque["end"]])
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    table, errores = parse_processes(args.file, max_errors=args.max_errors)
+    if errores:
+        print("Se detectaron errores en el archivo:", file=sys.stderr)
+        for err in errores:
+            print(f"- {err}", file=sys.stderr)
+        return 1
+    if not len(table):
+        print("No se cargaron procesos válidos.", file=sys.stderr)
+        return 1
+
+    algorithms = args.algorithm or list(SCHEDULERS)
+    quanta = args.quantum or [2]
+    if any(q < 1 for q in quanta):
+        print("El quantum debe ser un entero mayor que 0.", file=sys.stderr)
+        return 1
+    if args.timeline == "-" and args.format != "json":
+        print("--timeline - solo está disponible con --format json.", file=sys.stderr)
+        return 1
+    if args.cache_size < 0:
+        print("--cache-size no puede ser negativo.", file=sys.stderr)
+        return 1
+    jobs = expand_jobs(algorithms, quanta)
+
+    cache = None
+    if args.cache_dir:
+        from algorithms.cache import ResultCache
+        cache = ResultCache(path=args.cache_dir, max_disk_bytes=args.cache_size * 2 ** 20 or None)
+    results = run(table, jobs, args.jobs, cache)
+    rows = summarize(table, results, args.metrics)
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            for row, (name, quantum, result) in zip(rows, results):
+                row["label"] = job_label(name, quantum)
+                if args.timeline == "-":
+                    row["timeline"] = list(result["timeline"])
+            json.dump({"results": rows}, out, ensure_ascii=False, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.timeline and args.timeline != "-":
+        with open(args.timeline, "w", encoding="utf-8", newline="") as f:
+            write_timeline_csv(f, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+# algorithms/compare.py
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Sequence, Tuple
+
+from algorithms.cache import ResultCache, result_key, table_digest
+from algorithms.process_table import ProcessTable, as_process_table
+from algorithms.registry import run_scheduler
+
+# Separador de pids dentro del bloque compartido (no aparece en los archivos de entrada)
+PID_SEPARATOR = "\n"
+ITEM_SIZE = 8
+# burst_time, arrival_time, priority e índice de llegadas
+NUM_COLUMNS = 4
+# Con menos trabajo que esto (procesos × simulaciones) se corre en el
+# proceso actual: enviar la tabla al pool cuesta más que simular
+PARALLEL_MIN_WORK = 20_000
+
+# Pools reutilizables, uno por número de workers
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _start_context():
+    """
+    forkserver donde exista, si no spawn: hacer fork de un proceso con
+    hilos (como el servidor de Streamlit) puede dejar al hijo bloqueado en
+    un candado que otro hilo tenía tomado.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def shared_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Pool de procesos compartido por todas las llamadas con el mismo
+    `max_workers`: se crea la primera vez y se reutiliza, así que los
+    workers no se vuelven a lanzar en cada comparación.
+    """
+    with _POOLS_LOCK:
+        pool = _POOLS.get(max_workers)
+        if pool is None:
+            pool = _POOLS[max_workers] = ProcessPoolExecutor(max_workers=max_workers,
+                                                             mp_context=_start_context())
+        return pool
+
+
+def discard_pool(max_workers: Optional[int] = None) -> None:
+    """Cierra el pool compartido (p. ej. si se rompió); el próximo uso crea uno nuevo."""
+    with _POOLS_LOCK:
+        pool = _POOLS.pop(max_workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class SharedProcessTable:
+    """
+    Copia de una ProcessTable en un bloque de memoria compartida.
+
+    Las tres columnas numéricas y el índice de llegadas ordenadas se guardan
+    contiguos como int64, seguidos de los pids codificados en UTF-8. Los
+    procesos hijos se conectan con `attach_process_table(handle)` y leen las
+    columnas sin copiarlas ni volver a ordenar.
+    """
+
+    def __init__(self, processes):
+        table = as_process_table(processes)
+        n = len(table)
+        pid_blob = PID_SEPARATOR.join(str(pid) for pid in table.pid).encode("utf-8")
+        size = NUM_COLUMNS * n * ITEM_SIZE + len(pid_blob)
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.handle = (self.shm.name, n, len(pid_blob))
+
+        buf = self.shm.buf
+        columns = (table.burst_time, table.arrival_time, table.priority, table.arrival_order())
+        for k, column in enumerate(columns):
+            view = buf[k * n * ITEM_SIZE:(k + 1) * n * ITEM_SIZE].cast('q')
+            view[:] = memoryview(column)
+            view.release()
+        buf[NUM_COLUMNS * n * ITEM_SIZE:size] = pid_blob
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self) -> 'SharedProcessTable':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_process_table(handle) -> Tuple[ProcessTable, shared_memory.SharedMemory]:
+    """
+    Reconstruye la ProcessTable desde el bloque compartido. Las columnas
+    numéricas son vistas (memoryview) sobre la memoria compartida; hay que
+    llamar a `release_process_table` antes de cerrar el bloque.
+    """
+    name, n, blob_size = handle
+    shm = shared_memory.SharedMemory(name=name)
+
+    buf = shm.buf
+    columns = [buf[k * n * ITEM_SIZE:(k + 1) * n * ITEM_SIZE].cast('q') for k in range(NUM_COLUMNS)]
+    offset = NUM_COLUMNS * n * ITEM_SIZE
+    blob = bytes(buf[offset:offset + blob_size]).decode("utf-8")
+    pids = blob.split(PID_SEPARATOR) if n else []
+    burst, arrival, priority, order = columns
+    return ProcessTable(pids, burst, arrival, priority, arrival_order=order), shm
+
+
+def release_process_table(table: ProcessTable, shm: shared_memory.SharedMemory) -> None:
+    for column in (table.burst_time, table.arrival_time, table.priority, table.arrival_order()):
+        column.release()
+    shm.close()
+
+
+def _run_job(handle, name, quantum):
+    table, shm = attach_process_table(handle)
+    try:
+        result = run_scheduler(name, table, quantum, compact=True)
+    finally:
+        release_process_table(table, shm)
+    # Los pids se vuelven a asociar en el proceso principal; no se envían de vuelta
+    result['timeline'].pids = None
+    return result
+
+
+def run_comparison(processes, jobs: Sequence[Tuple[str, Optional[int]]],
+                   max_workers: Optional[int] = None,
+                   cache: Optional[ResultCache] = None) -> Iterator[Tuple[Tuple[str, Optional[int]], dict]]:
+    """
+    Ejecuta varias simulaciones (algoritmo, quantum) en paralelo sobre la
+    misma tabla de procesos, compartida entre los procesos del pool.
+
+    Es un generador: entrega ((algoritmo, quantum), resultado) en el orden en
+    que terminan. Los resultados usan la línea de tiempo compacta. Con
+    max_workers=1, una sola simulación o poco trabajo (PARALLEL_MIN_WORK)
+    todo se ejecuta en el proceso actual; si no, en el pool compartido
+    (shared_pool).
+
+    Con `cache`, las ejecuciones ya calculadas para una tabla con el mismo
+    contenido se entregan primero, sin recalcular, y solo las demás van al
+    pool; sus resultados se guardan en la caché.
+    """
+    table = as_process_table(processes)
+
+    if cache is not None:
+        digest = table_digest(table)
+        pending = []
+        for job in jobs:
+            result = cache.get(result_key(digest, *job), pids=table.pid)
+            if result is None:
+                pending.append(job)
+            else:
+                yield job, result
+        for job, result in run_comparison(table, pending, max_workers):
+            cache.put(result_key(digest, *job), result)
+            yield job, result
+        return
+
+    if max_workers == 1 or len(jobs) <= 1 or len(table) * len(jobs) < PARALLEL_MIN_WORK:
+        for name, quantum in jobs:
+            yield (name, quantum), run_scheduler(name, table, quantum, compact=True)
+        return
+
+    pool = shared_pool(max_workers)
+    with SharedProcessTable(table) as shared:
+        try:
+            futures = {
+                pool.submit(_run_job, shared.handle, name, quantum): (name, quantum)
+                for name, quantum in jobs
+            }
+        except BrokenProcessPool:
+            discard_pool(max_workers)
+            raise
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                result['timeline'].pids = table.pid
+                yield futures[future], result
+        except BrokenProcessPool:
+            discard_pool(max_workers)
+            raise
+        finally:
+            # Los que ya empezaron usan el bloque compartido: se esperan antes de cerrarlo
+            wait([future for future in futures if not future.cancel()])
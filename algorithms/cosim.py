@@ -0,0 +1,302 @@
+# algorithms/cosim.py
+
+import heapq
+from collections import deque
+from typing import Dict, List, Optional, Union
+
+from algorithms.deadlock import WaitForGraph
+from algorithms.policies import make_ready_queue
+from algorithms.process_table import ProcessTable, as_process_table
+from algorithms.sync import ACCESSED, FAILED, RELEASE, REQUEST, WAITING, SyncLog
+from algorithms.timeline import Timeline
+
+
+def _process_actions(table: ProcessTable, resources: Dict[str, int], actions: List[Dict],
+                     duration: int) -> List[List]:
+    """
+    Acciones de cada proceso como [(ciclo de CPU, acción, recurso, duración)]
+    ordenadas por ciclo de CPU (estable). El ciclo se limita al último ciclo
+    de CPU del proceso para que toda acción se emita antes de terminar.
+    Lanza ValueError si una acción usa un proceso o un recurso no definido.
+    """
+    pid_index = {}
+    for i, pid in enumerate(table.pid):
+        pid_index.setdefault(pid, i)
+    resource_index = {name: r for r, name in enumerate(resources)}
+
+    por_proceso = [[] for _ in range(len(table))]
+    for a, accion in enumerate(actions):
+        i = pid_index.get(accion['pid'])
+        if i is None:
+            raise ValueError(f"Proceso no definido: {accion['pid']}")
+        r = resource_index.get(accion['recurso'])
+        if r is None:
+            raise ValueError(f"Recurso no definido: {accion['recurso']}")
+        offset = min(max(accion['ciclo'], 0), max(table.burst_time[i] - 1, 0))
+        por_proceso[i].append((offset, a, r, accion.get('duracion', duration)))
+    for lista in por_proceso:
+        lista.sort(key=lambda t: t[0])
+    return por_proceso
+
+
+def cosimulate(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+               actions: List[Dict], algorithm: str, quantum: Optional[int] = None,
+               duration: int = 1, hold: str = "clock", compact: bool = False) -> Dict:
+    """
+    Co-simulación de calendarización y sincronización.
+
+    La política `algorithm` (FIFO, SJF, SRTF, Round Robin, Priority) decide
+    qué proceso tiene la CPU. El 'ciclo' de cada acción es el ciclo de CPU
+    del proceso en que se emite (0 = al empezar a ejecutar), así que las
+    acciones solo ocurren mientras su proceso está en la CPU. Cada acción
+    pide una unidad del recurso y la retiene 'duracion' ciclos; si no hay
+    unidades, el proceso se bloquea: sale de la CPU, entra a la cola FIFO
+    del recurso y vuelve a la cola de listos cuando recibe la unidad.
+
+    Con hold="clock" la unidad se libera tras 'duracion' ciclos de reloj,
+    corra o no el proceso. Con hold="cpu" se libera cuando el proceso
+    ejecutó 'duracion' ciclos de CPU más (o al terminar), así que un proceso
+    bloqueado conserva lo que tiene y puede haber interbloqueos: se detectan
+    con un grafo de espera incremental (algorithms/deadlock.py) en cada
+    bloqueo.
+
+    Orientada a eventos: el reloj salta entre llegadas, liberaciones, puntos
+    de acción, fin de quantum y finalizaciones. Sin acciones produce la
+    misma calendarización que el planificador correspondiente (con los
+    tramos contiguos del mismo proceso fusionados).
+
+    Devuelve {'timeline', 'avg_waiting_time', 'avg_blocked_time', 'sync',
+    'unfinished', 'deadlocks'}: 'sync' es la SyncLog de los recursos (la
+    duración de cada WAITING es el tiempo bloqueado), 'unfinished' los pids
+    que quedaron bloqueados para siempre y 'deadlocks' los interbloqueos
+    detectados, como dicts {'cycle', 'processes', 'chain'} donde 'chain' es
+    el ciclo de espera [(pid, recurso que espera), ...]. El tiempo de espera
+    incluye el tiempo bloqueado. Si algún proceso no termina, su espera no
+    está acotada y 'avg_waiting_time' y 'avg_blocked_time' valen None (no
+    se promedian solo los que terminaron, que daría una espera menor).
+    """
+    if duration < 1:
+        raise ValueError("La duración debe ser un entero mayor que 0")
+    if hold not in ("clock", "cpu"):
+        raise ValueError(f"Retención desconocida: {hold} (se espera 'clock' o 'cpu')")
+    por_cpu = hold == "cpu"
+    table = as_process_table(processes)
+    pids = table.pid
+    arrivals = table.arrival_time
+    n = len(table)
+    acts = _process_actions(table, resources, actions, duration)
+
+    remaining = list(table.burst_time)
+    policy = make_ready_queue(algorithm, table, remaining, quantum)
+    order = table.arrival_order()
+
+    names = list(resources)
+    available = [resources[name] for name in names]
+    colas = [deque() for _ in names]  # (proceso, acción, duración, posición del WAITING)
+    liberaciones = []  # heap de (ciclo de fin, secuencia, proceso, recurso, acción)
+    # Con hold="cpu": heap por proceso de (ciclo de CPU de liberación,
+    # secuencia, recurso, acción, posición del ACCESSED)
+    tenencias = [[] for _ in range(n)]
+    secuencia = 0
+    grafo = WaitForGraph()
+    deadlocks = []
+
+    timeline = Timeline(pids)
+    log = SyncLog(pids, names)
+    finish = [None] * n
+    siguiente_accion = [0] * n
+    next_arrival = 0
+
+    def proximo_evento():
+        """Ciclo de la próxima llegada o liberación, o None."""
+        t = arrivals[order[next_arrival]] if next_arrival < n else None
+        if liberaciones and (t is None or liberaciones[0][0] < t):
+            t = liberaciones[0][0]
+        return t
+
+    def otorgar(t, i, r, a, d):
+        nonlocal secuencia
+        available[r] -= 1
+        grafo.acquire(i, r)
+        acceso = log.append(t, i, r, ACCESSED, a, duration=d)
+        if por_cpu:
+            # La duración en reloj se conoce al liberar
+            ejecutado = table.burst_time[i] - remaining[i]
+            heapq.heappush(tenencias[i], (ejecutado + d, secuencia, r, a, acceso))
+        else:
+            heapq.heappush(liberaciones, (t + d, secuencia, i, r, a))
+        secuencia += 1
+
+    def liberar(t, i, r, a):
+        log.append(t, i, r, RELEASE, a)
+        grafo.release(i, r)
+        available[r] += 1
+        if colas[r]:
+            # La unidad pasa al primero de la cola, que se desbloquea
+            q, b, d, espera = colas[r].popleft()
+            log.duration[espera] = t - log.cycle[espera]
+            grafo.unblock(q)
+            otorgar(t, q, r, b, d)
+            policy.push(q)
+
+    def liberar_tenencias(t, i, hasta):
+        """hold="cpu": libera lo que el proceso i retiene hasta su ciclo de CPU `hasta`."""
+        propias = tenencias[i]
+        while propias and propias[0][0] <= hasta:
+            _, _, r, a, acceso = heapq.heappop(propias)
+            log.duration[acceso] = t - log.cycle[acceso]
+            liberar(t, i, r, a)
+
+    def admitir(t):
+        """Procesa en orden cronológico las llegadas y liberaciones hasta t."""
+        nonlocal next_arrival
+        while True:
+            ta = arrivals[order[next_arrival]] if next_arrival < n else None
+            tr = liberaciones[0][0] if liberaciones else None
+            if ta is not None and ta <= t and (tr is None or ta <= tr):
+                policy.push(order[next_arrival])
+                next_arrival += 1
+            elif tr is not None and tr <= t:
+                _, _, i, r, a = heapq.heappop(liberaciones)
+                liberar(tr, i, r, a)
+            else:
+                return
+
+    time = 0
+    running = None
+    slice_left = None
+    finished = 0
+
+    while finished < n:
+        admitir(time)
+        if running is None:
+            if not len(policy):
+                t = proximo_evento()
+                if t is None:
+                    # Solo quedan procesos bloqueados que nunca recibirán la unidad
+                    break
+                time = max(time, t)
+                continue
+            running = policy.pop()
+            slice_left = policy.quantum
+
+        i = running
+        ejecutado = table.burst_time[i] - remaining[i]
+
+        # Acciones que tocan en este punto de la ejecución
+        bloqueado = False
+        lista = acts[i]
+        while siguiente_accion[i] < len(lista) and lista[siguiente_accion[i]][0] <= ejecutado:
+            _, a, r, d = lista[siguiente_accion[i]]
+            siguiente_accion[i] += 1
+            log.append(time, i, r, REQUEST, a)
+            if available[r] > 0 and not colas[r]:
+                otorgar(time, i, r, a, d)
+            else:
+                colas[r].append((i, a, d, log.append(time, i, r, WAITING, a, duration=0)))
+                grafo.block(i, r)
+                bloqueado = True
+                break
+        if bloqueado:
+            running = None
+            if por_cpu:
+                interbloqueo = grafo.check(i)
+                if interbloqueo is not None:
+                    procesos, cadena = interbloqueo
+                    deadlocks.append({
+                        'cycle': time,
+                        'processes': [pids[q] for q in procesos],
+                        'chain': [(pids[q], names[r]) for q, r in cadena]
+                    })
+            continue
+
+        # Correr hasta terminar, la próxima acción, el fin del quantum o, si
+        # la política es expropiativa, la próxima llegada o liberación
+        run = remaining[i]
+        if siguiente_accion[i] < len(lista):
+            run = min(run, lista[siguiente_accion[i]][0] - ejecutado)
+        if slice_left is not None:
+            run = min(run, slice_left)
+        if tenencias[i]:
+            run = min(run, tenencias[i][0][0] - ejecutado)
+        if policy.preemptive:
+            t = proximo_evento()
+            if t is not None:
+                run = min(run, t - time)
+
+        timeline.extend(i, time, time + run)
+        time += run
+        remaining[i] -= run
+        if slice_left is not None:
+            slice_left -= run
+
+        # Los que llegaron o se liberaron durante el tramo van primero
+        admitir(time)
+        if por_cpu:
+            # Al terminar se libera todo lo que el proceso retenga
+            hasta = ejecutado + run if remaining[i] else float("inf")
+            liberar_tenencias(time, i, hasta)
+
+        if remaining[i] == 0:
+            finish[i] = time
+            finished += 1
+            running = None
+        elif slice_left == 0 or policy.preemptive:
+            policy.push(i)
+            running = None
+
+    # Pedidos que nunca se atendieron
+    for r, cola in enumerate(colas):
+        for q, a, _, espera in cola:
+            log.duration[espera] = time - log.cycle[espera]
+            log.append(time, q, r, FAILED, a)
+    log.cycles = time + 1
+
+    bloqueo = [0] * n
+    for k in range(len(log)):
+        if log.event[k] == WAITING:
+            bloqueo[log.pid_index[k]] += log.duration[k]
+
+    unfinished = [pids[i] for i in range(n) if finish[i] is None]
+    if unfinished:
+        # La espera de un proceso que nunca termina no está acotada
+        avg_waiting_time = avg_blocked_time = None
+    else:
+        avg_waiting_time = sum(finish[i] - arrivals[i] - table.burst_time[i] for i in range(n)) / max(n, 1)
+        avg_blocked_time = sum(bloqueo) / max(n, 1)
+    return {
+        'timeline': timeline if compact else timeline.to_dicts(),
+        'avg_waiting_time': avg_waiting_time,
+        'avg_blocked_time': avg_blocked_time,
+        'sync': log,
+        'unfinished': unfinished,
+        'deadlocks': deadlocks
+    }
+
+
+def contention_report(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+                      actions: List[Dict], algorithms: List[str], quantum: Optional[int] = None,
+                      duration: int = 1, hold: str = "clock") -> List[Dict]:
+    """
+    Cuánto aumenta la contención por recursos el tiempo de espera con cada
+    política: una fila por algoritmo con la espera promedio sin acciones y
+    con acciones, la diferencia y el tiempo bloqueado promedio. Con procesos
+    sin terminar ('unfinished' > 0) la espera, el aumento y el bloqueo
+    valen None.
+    """
+    table = as_process_table(processes)
+    rows = []
+    for name in algorithms:
+        base = cosimulate(table, resources, [], name, quantum, duration, hold, compact=True)
+        result = cosimulate(table, resources, actions, name, quantum, duration, hold, compact=True)
+        rows.append({
+            'algorithm': name,
+            'avg_waiting_time_alone': base['avg_waiting_time'],
+            'avg_waiting_time': result['avg_waiting_time'],
+            'inflation': (result['avg_waiting_time'] - base['avg_waiting_time']
+                          if result['avg_waiting_time'] is not None else None),
+            'avg_blocked_time': result['avg_blocked_time'],
+            'unfinished': len(result['unfinished']),
+            'deadlocks': len(result['deadlocks'])
+        })
+    return rows
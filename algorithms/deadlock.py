@@ -0,0 +1,94 @@
+# algorithms/deadlock.py
+
+from typing import Dict, List, Optional, Tuple
+
+
+class WaitForGraph:
+    """
+    Grafo de espera (wait-for) incremental para recursos con varias unidades.
+
+    Se mantiene con operaciones O(1) en cada evento: `acquire`/`release`
+    actualizan cuántas unidades de cada recurso tiene cada proceso, y
+    `block`/`unblock` el recurso por el que espera un proceso bloqueado (a lo
+    sumo uno). Las aristas p -> q (p espera un recurso que q tiene) no se
+    guardan: se derivan al recorrer.
+
+    Un interbloqueo solo puede formarse cuando un proceso se bloquea, y en
+    ese caso lo incluye; por eso `check(p)` se llama justo después de
+    `block(p, r)` y recorre únicamente lo alcanzable desde p. Si todo lo
+    alcanzable está bloqueado, nadie en ese conjunto puede liberar nada (con
+    una sola petición pendiente por proceso, es la condición de nudo) y
+    hay interbloqueo.
+    """
+
+    def __init__(self):
+        self.holders: Dict[int, Dict[int, int]] = {}  # recurso -> {proceso: unidades}
+        self.waiting: Dict[int, int] = {}  # proceso bloqueado -> recurso
+
+    def acquire(self, p: int, r: int) -> None:
+        holders = self.holders.setdefault(r, {})
+        holders[p] = holders.get(p, 0) + 1
+
+    def release(self, p: int, r: int) -> None:
+        holders = self.holders[r]
+        if holders[p] == 1:
+            del holders[p]
+        else:
+            holders[p] -= 1
+
+    def block(self, p: int, r: int) -> None:
+        self.waiting[p] = r
+
+    def unblock(self, p: int) -> None:
+        self.waiting.pop(p, None)
+
+    def check(self, p: int) -> Optional[Tuple[List[int], List[Tuple[int, int]]]]:
+        """
+        Busca un interbloqueo que incluya al proceso bloqueado p. Devuelve
+        (procesos interbloqueados, ciclo de espera como [(proceso, recurso
+        que espera)]) o None. Se detiene en cuanto alcanza un proceso que no
+        está bloqueado.
+        """
+        waiting, holders = self.waiting, self.holders
+        seen = {p}
+        stack = [p]
+        while stack:
+            q = stack.pop()
+            r = waiting.get(q)
+            if r is None:
+                return None
+            for h in holders.get(r, ()):
+                if h not in seen:
+                    seen.add(h)
+                    stack.append(h)
+
+        chain = self._find_cycle(p, seen)
+        if chain is None:
+            # Bloqueados sin ciclo: esperan recursos que nadie tiene
+            return None
+        return sorted(seen), chain
+
+    def _find_cycle(self, start: int, nodes) -> Optional[List[Tuple[int, int]]]:
+        """Ciclo dirigido dentro de `nodes` (DFS iterativo con colores)."""
+        waiting, holders = self.waiting, self.holders
+        state = {}  # 1 = en el camino actual, 2 = terminado
+        for root in [start, *nodes]:
+            if root in state:
+                continue
+            path = [root]
+            state[root] = 1
+            iters = [iter(holders.get(waiting[root], ()))]
+            while iters:
+                for h in iters[-1]:
+                    if state.get(h) == 1:
+                        cycle = path[path.index(h):]
+                        return [(q, waiting[q]) for q in cycle]
+                    if h not in state:
+                        state[h] = 1
+                        path.append(h)
+                        iters.append(iter(holders.get(waiting[h], ())))
+                        break
+                else:
+                    state[path.pop()] = 2
+                    iters.pop()
+        return None
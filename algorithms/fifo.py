@@ -1,20 +1,29 @@
 # algorithms/fifo.py
 
-from typing import List, Dict
+from typing import List, Dict, Union
 
-def fifo_scheduler(processes: List[Dict]) -> Dict:
+from algorithms.process_table import ProcessTable, as_process_table
+from algorithms.timeline import Timeline
+
+def fifo_scheduler(processes: Union[List[Dict], ProcessTable], compact: bool = False) -> Dict:
     """
     Simula el algoritmo FIFO.
+
+    Con compact=True 'timeline' es un Timeline columnar en lugar de una
+    lista de dicts.
     """
-    processes_sorted = sorted(processes, key=lambda p: p['arrival_time'])
+    table = as_process_table(processes)
+    pids = table.pid
+    bursts = table.burst_time
+    arrivals = table.arrival_time
+
     current_time = 0
-    timeline = []
+    timeline = Timeline(pids)
     waiting_times = []
 
-    for process in processes_sorted:
-        arrival = process['arrival_time']
-        burst = process['burst_time']
-        pid = process['pid']
+    for i in table.arrival_order():
+        arrival = arrivals[i]
+        burst = bursts[i]
 
         if current_time < arrival:
             current_time = arrival
@@ -24,17 +33,13 @@ def fifo_scheduler(processes: List[Dict]) -> Dict:
         waiting_time = start - arrival
         waiting_times.append(waiting_time)
 
-        timeline.append({
-            'pid': pid,
-            'start': start,
-            'end': end
-        })
+        timeline.append(i, start, end)
 
         current_time = end
 
     avg_waiting_time = sum(waiting_times) / len(waiting_times)
 
     return {
-        'timeline': timeline,
+        'timeline': timeline if compact else timeline.to_dicts(),
         'avg_waiting_time': avg_waiting_time
     }
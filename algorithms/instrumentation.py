@@ -0,0 +1,172 @@
+# algorithms/instrumentation.py
+"""
+Instrumentación opcional de los planificadores y de las simulaciones de
+sincronización: contadores de operaciones y tiempos de reloj por fase.
+
+Está desactivada por defecto. Los motores consultan `active()` una sola vez
+por llamada: si devuelve None el ciclo principal es exactamente el mismo de
+siempre, sin contadores ni condiciones extra, y `phase()` devuelve un
+contexto vacío. Con la instrumentación activa, las operaciones sobre el heap
+o la cola se hacen a través de funciones que cuentan cada llamada, y los
+despachos, expropiaciones, cambios de contexto y saltos de CPU ociosa se
+obtienen de la línea de tiempo (o de la bitácora) al terminar.
+
+    with instrumented() as inst:
+        with phase("schedule"):
+            srtf_scheduler(tabla)
+    inst.report()
+
+La instrumentación activa es propia del hilo (y de la sesión de Streamlit)
+que la abrió; las simulaciones que corren en otros procesos no se cuentan.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+# Instrumentación activa del contexto actual (None: desactivada)
+_ACTIVE = ContextVar('instrumentation', default=None)
+
+# Contexto vacío que devuelve `phase` con la instrumentación desactivada
+_NO_PHASE = nullcontext()
+
+
+class Instrumentation:
+    """
+    Contadores agrupados por ámbito (el motor que los produjo, p. ej. 'srtf'
+    o 'mutex') y tiempos acumulados por fase.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.phases: Dict[str, list] = {}  # fase -> [llamadas, total, máximo]
+        self.started = time.perf_counter()
+
+    def count(self, scope: str, name: str, n: int = 1) -> None:
+        counters = self.counters.setdefault(scope, {})
+        counters[name] = counters.get(name, 0) + n
+
+    def update(self, scope: str, values: Dict[str, int]) -> None:
+        for name, n in values.items():
+            self.count(scope, name, n)
+
+    def counting(self, scope: str, name: str, func: Callable) -> Callable:
+        """`func` envuelta para sumar 1 a `name` en cada llamada."""
+        counters = self.counters.setdefault(scope, {})
+        counters.setdefault(name, 0)
+
+        def wrapper(*args):
+            counters[name] += 1
+            return func(*args)
+        return wrapper
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def report(self) -> Dict:
+        """
+        Reporte serializable en JSON: tiempo total desde que se abrió,
+        {'phase', 'calls', 'total_s', 'mean_s', 'max_s'} por fase (en el
+        orden en que aparecieron) y los contadores por ámbito.
+        """
+        return {
+            'wall_time_s': time.perf_counter() - self.started,
+            'phases': [
+                {'phase': name, 'calls': calls, 'total_s': total, 'mean_s': total / calls, 'max_s': peak}
+                for name, (calls, total, peak) in self.phases.items()
+            ],
+            'counters': {scope: dict(values) for scope, values in self.counters.items()}
+        }
+
+
+def active() -> Optional[Instrumentation]:
+    """Instrumentación activa en este contexto, o None si está desactivada."""
+    return _ACTIVE.get()
+
+
+@contextmanager
+def instrumented(inst: Optional[Instrumentation] = None) -> Iterator[Instrumentation]:
+    """Activa la instrumentación (una nueva si no se pasa `inst`) dentro del bloque."""
+    inst = inst if inst is not None else Instrumentation()
+    token = _ACTIVE.set(inst)
+    try:
+        yield inst
+    finally:
+        _ACTIVE.reset(token)
+
+
+@contextmanager
+def _timed(inst: Instrumentation, name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        inst.add_phase(name, time.perf_counter() - t0)
+
+
+def phase(name: str):
+    """Mide el tiempo de reloj del bloque como la fase `name` (nada si está desactivada)."""
+    inst = _ACTIVE.get()
+    if inst is None:
+        return _NO_PHASE
+    return _timed(inst, name)
+
+
+def timed_iter(name: str, iterable: Iterable) -> Iterable:
+    """
+    Mide como la fase `name` el tiempo de producir cada elemento, p. ej. de
+    un generador que calcula resultados a medida que se piden. Sin
+    instrumentación devuelve `iterable` tal cual.
+    """
+    inst = _ACTIVE.get()
+    if inst is None:
+        return iterable
+
+    def generator():
+        iterator = iter(iterable)
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                inst.add_phase(name, time.perf_counter() - t0)
+                return
+            inst.add_phase(name, time.perf_counter() - t0)
+            yield item
+    return generator()
+
+
+def timeline_counters(timeline) -> Dict[str, int]:
+    """
+    Contadores que se deducen de un Timeline compacto de un solo núcleo:
+
+    - dispatches: tramos (cada vez que la CPU empieza a ejecutar un proceso).
+    - preemptions: tramos que terminan antes de que su proceso termine.
+    - context_switches: tramos consecutivos de procesos distintos (como
+      compute_metrics).
+    - idle_skips: huecos sin procesos listos que el reloj saltó.
+    """
+    import numpy as np
+
+    idx = np.frombuffer(timeline.pid_index, dtype=np.int64)
+    start = np.frombuffer(timeline.start, dtype=np.int64)
+    end = np.frombuffer(timeline.end, dtype=np.int64)
+    if not idx.size:
+        return {'dispatches': 0, 'preemptions': 0, 'context_switches': 0, 'idle_skips': 0}
+
+    last_end = np.zeros(int(idx.max()) + 1, dtype=np.int64)
+    np.maximum.at(last_end, idx, end)
+    previous_end = np.concatenate(([0], end[:-1]))
+    return {
+        'dispatches': int(idx.size),
+        'preemptions': int(np.count_nonzero(end < last_end[idx])),
+        'context_switches': int(np.count_nonzero(idx[1:] != idx[:-1])),
+        'idle_skips': int(np.count_nonzero(start > previous_end))
+    }
@@ -0,0 +1,155 @@
+# algorithms/metrics.py
+
+from array import array
+from typing import Dict, Tuple
+
+import numpy as np
+
+from algorithms.process_table import as_process_table
+from algorithms.sync import ACCESSED, FAILED, REQUEST, WAITING
+from algorithms.timeline import CoreTimeline, Timeline
+
+PERCENTILES = (50, 95, 99)
+
+
+def as_int_array(column) -> np.ndarray:
+    """Vista int64 de una columna; sin copia si la columna expone un buffer."""
+    if isinstance(column, (array, memoryview)):
+        return np.frombuffer(column, dtype=np.int64)
+    return np.asarray(column, dtype=np.int64)
+
+
+def timeline_arrays(timeline, table) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Devuelve (índice de proceso, inicio, fin) como arreglos de NumPy. Acepta
+    un Timeline compacto o la lista de dicts {'pid', 'start', 'end'}.
+    """
+    if isinstance(timeline, Timeline):
+        return as_int_array(timeline.pid_index), as_int_array(timeline.start), as_int_array(timeline.end)
+
+    # Lista de dicts: se resuelve cada pid a su índice en la tabla
+    index = {}
+    for i, pid in enumerate(table.pid):
+        index.setdefault(pid, i)
+    count = len(timeline)
+    idx = np.fromiter((index[b['pid']] for b in timeline), dtype=np.int64, count=count)
+    start = np.fromiter((b['start'] for b in timeline), dtype=np.int64, count=count)
+    end = np.fromiter((b['end'] for b in timeline), dtype=np.int64, count=count)
+    return idx, start, end
+
+
+def _percentiles(values: np.ndarray) -> Dict[str, float]:
+    if values.size == 0:
+        return {f"p{q}": 0.0 for q in PERCENTILES}
+    points = np.percentile(values, PERCENTILES)
+    return {f"p{q}": float(v) for q, v in zip(PERCENTILES, points)}
+
+
+def compute_metrics(processes, timeline) -> Dict:
+    """
+    Calcula las métricas de una simulación a partir de la tabla de procesos y
+    la línea de tiempo de cualquier planificador, sin ciclos de Python por
+    tramo.
+
+    Por proceso: tiempo de finalización, turnaround, espera y respuesta.
+    Globales: promedios, percentiles p50/p95/p99, utilización de CPU,
+    throughput, cambios de contexto y tiempo total.
+
+    Con la CoreTimeline de la simulación multinúcleo, la utilización es el
+    promedio entre núcleos y los cambios de contexto se cuentan por núcleo.
+    """
+    table = as_process_table(processes)
+    n = len(table)
+    arrival = as_int_array(table.arrival_time)
+    burst = as_int_array(table.burst_time)
+    idx, start, end = timeline_arrays(timeline, table)
+
+    # Primer inicio y último fin de cada proceso
+    first_start = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    finish = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+    np.minimum.at(first_start, idx, start)
+    np.maximum.at(finish, idx, end)
+
+    turnaround = finish - arrival
+    waiting = turnaround - burst
+    response = first_start - arrival
+
+    busy = int((end - start).sum())
+    total_time = int(end.max()) if end.size else 0
+    makespan = total_time - int(arrival.min()) if n else 0
+    cores = 1
+    if isinstance(timeline, CoreTimeline):
+        cores = timeline.cores
+        core = as_int_array(timeline.core)
+        order = np.lexsort((start, core))
+        by_core, same_core = idx[order], core[order]
+        context_switches = int(np.count_nonzero(
+            (by_core[1:] != by_core[:-1]) & (same_core[1:] == same_core[:-1])
+        ))
+    else:
+        # Cambio de contexto: tramos consecutivos de procesos distintos
+        context_switches = int(np.count_nonzero(idx[1:] != idx[:-1]))
+
+    return {
+        'per_process': {
+            'pid': table.pid,
+            'arrival_time': arrival,
+            'burst_time': burst,
+            'finish_time': finish,
+            'turnaround_time': turnaround,
+            'waiting_time': waiting,
+            'response_time': response
+        },
+        'avg_waiting_time': float(waiting.mean()) if n else 0.0,
+        'avg_turnaround_time': float(turnaround.mean()) if n else 0.0,
+        'avg_response_time': float(response.mean()) if n else 0.0,
+        'percentiles': {
+            'waiting_time': _percentiles(waiting),
+            'turnaround_time': _percentiles(turnaround),
+            'response_time': _percentiles(response)
+        },
+        'cpu_utilization': busy / (makespan * cores) if makespan > 0 else 0.0,
+        'throughput': n / makespan if makespan > 0 else 0.0,
+        'context_switches': context_switches,
+        'total_time': total_time,
+        'makespan': makespan
+    }
+
+
+def compute_sync_metrics(log, actions) -> Dict[str, Dict]:
+    """
+    Métricas de una bitácora de sincronización (SyncLog) agrupadas por tipo
+    de acción ('accion' de cada acción, p. ej. READ y WRITE).
+
+    Por tipo: pedidos, accesos, pedidos sin atender (FAILED), throughput
+    (accesos por ciclo simulado) y la espera por pedido (suma de las
+    duraciones de sus WAITING): promedio, máximo y percentiles. Una espera
+    máxima muy por encima del p50, o pedidos sin atender, indican inanición.
+    """
+    event = as_int_array(log.event)
+    action = as_int_array(log.action)
+    duration = as_int_array(log.duration)
+
+    # Espera total de cada acción
+    waiting = event == WAITING
+    wait = np.bincount(action[waiting], weights=duration[waiting], minlength=len(actions))
+
+    kinds, kind_of = np.unique(np.array([a['accion'] for a in actions], dtype=object), return_inverse=True)
+    requested = action[event == REQUEST]
+    accesses = np.bincount(kind_of[action[event == ACCESSED]], minlength=len(kinds))
+    failed = np.bincount(kind_of[action[event == FAILED]], minlength=len(kinds))
+    cycles = log.cycles
+
+    metrics = {}
+    for k, kind in enumerate(kinds):
+        waits = wait[requested[kind_of[requested] == k]]
+        metrics[kind] = {
+            'requests': int(waits.size),
+            'accesses': int(accesses[k]),
+            'failed': int(failed[k]),
+            'throughput': int(accesses[k]) / cycles if cycles > 0 else 0.0,
+            'avg_wait': float(waits.mean()) if waits.size else 0.0,
+            'max_wait': int(waits.max()) if waits.size else 0,
+            'wait_percentiles': _percentiles(waits)
+        }
+    return metrics
@@ -0,0 +1,56 @@
+import heapq
+
+from algorithms.process_table import as_process_table
+from algorithms.timeline import Timeline
+
+def nonpreemptive_scheduler(processes, key, compact=False):
+    """
+    Motor común para algoritmos no expropiativos (SJF, Priority).
+
+    Recorre las llegadas con un cursor ordenado y mantiene los procesos
+    disponibles en un min-heap por (key, arrival_time, orden de entrada),
+    lo que reproduce exactamente el desempate de la versión con listas.
+    `key` es el nombre de la columna: 'burst_time' o 'priority'. Con
+    compact=True 'timeline' es un Timeline columnar.
+    """
+    table = as_process_table(processes)
+    pids = table.pid
+    bursts = table.burst_time
+    arrivals = table.arrival_time
+    keys = getattr(table, key)
+
+    n = len(table)
+    order = table.arrival_order()
+    completed = Timeline(pids)
+    current_time = 0
+    waiting_times = []
+
+    ready_queue = []
+    next_arrival = 0
+
+    while next_arrival < n or ready_queue:
+        # Sin procesos disponibles: avanzar hasta la siguiente llegada
+        if not ready_queue:
+            current_time = max(current_time, arrivals[order[next_arrival]])
+
+        while next_arrival < n and arrivals[order[next_arrival]] <= current_time:
+            i = order[next_arrival]
+            heapq.heappush(ready_queue, (keys[i], arrivals[i], i))
+            next_arrival += 1
+
+        _, arrival, i = heapq.heappop(ready_queue)
+
+        start = current_time
+        end = start + bursts[i]
+        waiting_time = start - arrival
+        waiting_times.append(waiting_time)
+
+        completed.append(i, start, end)
+
+        current_time = end
+
+    avg_waiting_time = sum(waiting_times) / len(waiting_times)
+    return {
+        'timeline': completed if compact else completed.to_dicts(),
+        'avg_waiting_time': avg_waiting_time
+    }
@@ -0,0 +1,188 @@
+# algorithms/online.py
+
+import heapq
+from array import array
+from typing import Dict, Iterator, Optional
+
+from algorithms.policies import make_ready_queue
+from algorithms.process_table import INT_TYPECODE, ProcessTable
+from algorithms.timeline import Timeline
+
+# Versión del formato de `snapshot`
+SNAPSHOT_VERSION = 1
+
+
+class OnlineScheduler:
+    """
+    Planificador en línea para FIFO, SJF, SRTF, Round Robin y Priority: los
+    procesos se agregan de a poco con `push`, `advance(t)` simula hasta el
+    ciclo t y `pull()` entrega los tramos producidos desde la última vez.
+
+    Usa las mismas colas de listos que la co-simulación (algorithms/
+    policies.py) y el mismo orden de decisiones, así que agregar todos los
+    procesos y llamar a `advance()` da la misma calendarización que el
+    planificador correspondiente (con los tramos contiguos fusionados).
+
+    Un proceso no puede llegar antes del ciclo actual. Las decisiones del
+    ciclo en que se detiene `advance(t)` (llegadas, fin de quantum,
+    expropiación) se toman al continuar, de modo que un proceso agregado
+    después con llegada t se trata igual que si hubiera estado desde el
+    principio.
+
+    `snapshot()` devuelve el estado completo como un dict serializable en
+    JSON y `OnlineScheduler.restore(estado)` lo reconstruye, para guardar
+    una simulación larga y seguirla o extenderla sin repetirla.
+    """
+
+    def __init__(self, algorithm: str, quantum: Optional[int] = None):
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.table = ProcessTable()
+        self.remaining = []
+        self.finish = []
+        self.policy = make_ready_queue(algorithm, self.table, self.remaining, quantum)
+        self.pending = []  # heap de (llegada, índice) de los que aún no llegan
+        self.time = 0
+        self.running = None
+        self.slice_left = None
+        self.finished = 0
+        self.total_waiting = 0
+        self.slices = Timeline(self.table.pid)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def push(self, pid, burst_time: int, arrival_time: int, priority: int = 0) -> int:
+        """Agrega un proceso y devuelve su índice. Lanza ValueError si llega en el pasado."""
+        if arrival_time < self.time:
+            raise ValueError(
+                f"El proceso {pid} llega en el ciclo {arrival_time}, antes del ciclo actual ({self.time})"
+            )
+        if burst_time < 0:
+            raise ValueError(f"El burst de {pid} no puede ser negativo")
+        i = len(self.table)
+        self.table.append(pid, burst_time, arrival_time, priority)
+        self.remaining.append(burst_time)
+        self.finish.append(None)
+        heapq.heappush(self.pending, (arrival_time, i))
+        return i
+
+    def _settle(self) -> None:
+        """Decisiones del ciclo actual: llegadas, fin de quantum o expropiación y despacho."""
+        policy, pending = self.policy, self.pending
+        while pending and pending[0][0] <= self.time:
+            policy.push(heapq.heappop(pending)[1])
+        if self.running is not None and (self.slice_left == 0 or policy.preemptive):
+            policy.push(self.running)
+            self.running = None
+        if self.running is None and len(policy):
+            self.running = policy.pop()
+            self.slice_left = policy.quantum
+
+    def advance(self, until: Optional[int] = None) -> int:
+        """
+        Simula hasta el ciclo `until` (o hasta terminar todo lo agregado si
+        es None) y devuelve el ciclo actual. Los tramos quedan disponibles
+        en `pull()`; un tramo en curso se corta en `until` y sigue después.
+        """
+        if until is not None and until < self.time:
+            raise ValueError(f"No se puede retroceder al ciclo {until} desde el ciclo {self.time}")
+        pending, remaining = self.pending, self.remaining
+        preemptive = self.policy.preemptive
+
+        while until is None or self.time < until:
+            self._settle()
+            i = self.running
+            if i is None:
+                # CPU ociosa hasta la próxima llegada conocida
+                if not pending:
+                    break
+                if until is not None and pending[0][0] >= until:
+                    break
+                self.time = pending[0][0]
+                continue
+
+            run = remaining[i]
+            if self.slice_left is not None:
+                run = min(run, self.slice_left)
+            if preemptive and pending:
+                run = min(run, pending[0][0] - self.time)
+            if until is not None:
+                run = min(run, until - self.time)
+
+            self.slices.extend(i, self.time, self.time + run)
+            self.time += run
+            remaining[i] -= run
+            if self.slice_left is not None:
+                self.slice_left -= run
+            if remaining[i] == 0:
+                self.finish[i] = self.time
+                self.finished += 1
+                self.total_waiting += self.time - self.table.arrival_time[i] - self.table.burst_time[i]
+                self.running = None
+
+        if until is not None:
+            self.time = until
+        return self.time
+
+    def pull(self) -> Iterator[Dict]:
+        """Entrega los tramos {'pid', 'start', 'end'} producidos desde la última llamada."""
+        slices, self.slices = self.slices, Timeline(self.table.pid)
+        return iter(slices)
+
+    @property
+    def avg_waiting_time(self) -> float:
+        """Espera promedio de los procesos que ya terminaron."""
+        return self.total_waiting / self.finished if self.finished else 0.0
+
+    @property
+    def unfinished(self) -> int:
+        return len(self.table) - self.finished
+
+    def snapshot(self) -> Dict:
+        """Estado completo como dict de listas y números (serializable en JSON)."""
+        table = self.table
+        return {
+            'version': SNAPSHOT_VERSION,
+            'algorithm': self.algorithm,
+            'quantum': self.quantum,
+            'time': self.time,
+            'pid': list(table.pid),
+            'burst_time': table.burst_time.tolist(),
+            'arrival_time': table.arrival_time.tolist(),
+            'priority': table.priority.tolist(),
+            'remaining': list(self.remaining),
+            'finish': list(self.finish),
+            'pending': [i for _, i in self.pending],
+            'ready': self.policy.items(),
+            'running': self.running,
+            'slice_left': self.slice_left,
+            'total_waiting': self.total_waiting,
+            'slices': [self.slices.pid_index.tolist(), self.slices.start.tolist(), self.slices.end.tolist()]
+        }
+
+    @classmethod
+    def restore(cls, state: Dict) -> 'OnlineScheduler':
+        """Reconstruye un planificador a partir de `snapshot()`."""
+        if state.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Versión de estado no soportada: {state.get('version')}")
+        scheduler = cls(state['algorithm'], state['quantum'])
+        table = scheduler.table
+        for pid, bt, at, pr in zip(state['pid'], state['burst_time'], state['arrival_time'], state['priority']):
+            table.append(pid, bt, at, pr)
+        scheduler.remaining.extend(state['remaining'])
+        scheduler.finish.extend(state['finish'])
+        scheduler.pending = [(table.arrival_time[i], i) for i in state['pending']]
+        heapq.heapify(scheduler.pending)
+        for i in state['ready']:
+            scheduler.policy.push(i)
+        scheduler.time = state['time']
+        scheduler.running = state['running']
+        scheduler.slice_left = state['slice_left']
+        scheduler.finished = sum(f is not None for f in scheduler.finish)
+        scheduler.total_waiting = state['total_waiting']
+        pid_index, start, end = state['slices']
+        scheduler.slices.pid_index = array(INT_TYPECODE, pid_index)
+        scheduler.slices.start = array(INT_TYPECODE, start)
+        scheduler.slices.end = array(INT_TYPECODE, end)
+        return scheduler
@@ -0,0 +1,169 @@
+# algorithms/parsers.py
+
+import io
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from algorithms.process_table import ProcessTable
+
+# Mensajes (formato inválido, valor no entero) por tipo de archivo. {i} es el número de línea.
+# Los de procesos agregan valor negativo y pid repetido ({pid}).
+MENSAJES_PROCESOS = (
+    "Línea {i}: formato inválido (se esperan 4 valores separados por coma)",
+    "Línea {i}: burst time, arrival time y prioridad deben ser números enteros",
+    "Línea {i}: burst time y arrival time no pueden ser negativos",
+    "Línea {i}: el pid {pid} está repetido"
+)
+MENSAJES_PROCESOS_SYNC = (
+    "Línea {i} procesos: formato inválido (4 valores esperados)",
+    "Línea {i} procesos: burst_time, arrival_time y priority deben ser enteros",
+    "Línea {i} procesos: burst_time y arrival_time no pueden ser negativos",
+    "Línea {i} procesos: pid {pid} repetido"
+)
+MENSAJES_RECURSOS = (
+    "Línea {i} recursos: formato inválido (2 valores esperados)",
+    "Línea {i} recursos: contador debe ser entero"
+)
+MENSAJES_ACCIONES = (
+    "Línea {i} acciones: formato inválido (4 o 5 valores esperados)",
+    "Línea {i} acciones: ciclo debe ser entero y duración entera mayor que 0"
+)
+
+
+class ErrorLog(list):
+    """
+    Lista de mensajes de error con tope opcional: a partir de `max_errors`
+    solo se cuentan y al cerrar se agrega un resumen con los omitidos.
+    """
+
+    def __init__(self, max_errors: Optional[int] = None):
+        super().__init__()
+        self.max_errors = max_errors
+        self.total = 0
+
+    def add(self, mensaje: str) -> None:
+        self.total += 1
+        if self.max_errors is None or len(self) < self.max_errors:
+            self.append(mensaje)
+
+    def close(self) -> 'ErrorLog':
+        omitidos = self.total - len(self)
+        if omitidos:
+            self.append(f"... y {omitidos} errores más")
+        return self
+
+
+def iter_lines(source) -> Iterator[Tuple[int, str]]:
+    """
+    Recorre `source` línea a línea sin cargarlo completo en memoria y entrega
+    (número de línea, línea sin espacios), omitiendo las vacías.
+
+    `source` puede ser una ruta, un archivo binario (p. ej. el UploadedFile de
+    Streamlit, decodificado como UTF-8) o un archivo de texto.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_lines(f)
+        return
+
+    if isinstance(source, io.TextIOBase):
+        stream = source
+    else:
+        stream = io.TextIOWrapper(source, encoding="utf-8")
+    try:
+        for i, line in enumerate(stream, 1):
+            line = line.strip()
+            if line:
+                yield i, line
+    finally:
+        # No cerrar el archivo del llamador al liberar el wrapper
+        if stream is not source:
+            stream.detach()
+
+
+def iter_records(source, fields: int, mensajes: Tuple[str, str], errores: ErrorLog,
+                 optional: int = 0) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Entrega (línea, partes) de las líneas con `fields` valores separados por
+    coma, más hasta `optional` valores opcionales al final.
+    """
+    for i, line in iter_lines(source):
+        partes = [p.strip() for p in line.split(",")]
+        if not fields <= len(partes) <= fields + optional:
+            errores.add(mensajes[0].format(i=i))
+            continue
+        yield i, partes
+
+
+def parse_processes(source, max_errors: Optional[int] = None,
+                    mensajes: Tuple[str, str] = MENSAJES_PROCESOS) -> Tuple[ProcessTable, List[str]]:
+    """
+    Lee un archivo pid,burst_time,arrival_time,priority directamente a una
+    ProcessTable columnar. Las líneas con burst o llegada negativos o con un
+    pid ya visto se reportan como errores. Devuelve (tabla, errores).
+    """
+    table = ProcessTable()
+    errores = ErrorLog(max_errors)
+    vistos = set()
+    for i, (pid, bt, at, pr) in iter_records(source, 4, mensajes, errores):
+        try:
+            bt = int(bt)
+            at = int(at)
+            pr = int(pr)
+        except ValueError:
+            errores.add(mensajes[1].format(i=i))
+            continue
+        if bt < 0 or at < 0:
+            errores.add(mensajes[2].format(i=i))
+            continue
+        if pid in vistos:
+            errores.add(mensajes[3].format(i=i, pid=pid))
+            continue
+        vistos.add(pid)
+        table.append(pid, bt, at, pr)
+    return table, errores.close()
+
+
+def parse_resources(source, max_errors: Optional[int] = None,
+                    mensajes: Tuple[str, str] = MENSAJES_RECURSOS) -> Tuple[Dict[str, int], List[str]]:
+    """Lee un archivo nombre_recurso,cantidad. Devuelve (recursos, errores)."""
+    recursos = {}
+    errores = ErrorLog(max_errors)
+    for i, (nombre, contador) in iter_records(source, 2, mensajes, errores):
+        try:
+            contador = int(contador)
+        except ValueError:
+            errores.add(mensajes[1].format(i=i))
+            continue
+        recursos[nombre] = contador
+    return recursos, errores.close()
+
+
+def parse_actions(source, max_errors: Optional[int] = None,
+                  mensajes: Tuple[str, str] = MENSAJES_ACCIONES) -> Tuple[List[Dict], List[str]]:
+    """
+    Lee un archivo pid,acción,recurso,ciclo[,duración]. La duración (ciclos
+    que se retiene el recurso) es opcional y vale 1 si se omite.
+    Devuelve (acciones, errores).
+    """
+    acciones = []
+    errores = ErrorLog(max_errors)
+    for i, partes in iter_records(source, 4, mensajes, errores, optional=1):
+        pid, accion, recurso, ciclo = partes[:4]
+        try:
+            ciclo = int(ciclo)
+            duracion = int(partes[4]) if len(partes) > 4 else 1
+        except ValueError:
+            errores.add(mensajes[1].format(i=i))
+            continue
+        if duracion < 1:
+            errores.add(mensajes[1].format(i=i))
+            continue
+        acciones.append({
+            "pid": pid,
+            "accion": accion.upper(),
+            "recurso": recurso,
+            "ciclo": ciclo,
+            "duracion": duracion
+        })
+    return acciones, errores.close()
@@ -0,0 +1,139 @@
+# algorithms/policies.py
+
+import heapq
+from collections import deque
+from typing import List
+
+from algorithms.process_table import ProcessTable
+
+
+class ReadyQueue:
+    """
+    Cola de procesos listos de una política de calendarización, para los
+    simuladores que deciden paso a paso qué proceso corre (co-simulación,
+    SMP, planificador en línea).
+
+    `push(i)` agrega el índice i de la tabla y `pop()` devuelve el siguiente
+    a ejecutar. Si `preemptive` es verdadero el proceso en ejecución vuelve a
+    la cola en cada llegada para reelegir; si `quantum` no es None el proceso
+    vuelve a la cola al agotar su quantum.
+    """
+
+    preemptive = False
+    quantum = None
+
+    def __init__(self, table: ProcessTable, remaining: List[int]):
+        self.table = table
+        self.remaining = remaining
+
+    def push(self, i: int) -> None:
+        raise NotImplementedError
+
+    def pop(self) -> int:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def items(self) -> List[int]:
+        """
+        Índices en la cola. Volver a agregarlos con `push` en este orden
+        reconstruye una cola equivalente (para guardar y restaurar estado).
+        """
+        raise NotImplementedError
+
+
+class FifoQueue(ReadyQueue):
+    """FIFO: en orden de llegada a la cola."""
+
+    def __init__(self, table, remaining):
+        super().__init__(table, remaining)
+        self.queue = deque()
+
+    def push(self, i):
+        self.queue.append(i)
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def items(self):
+        return list(self.queue)
+
+
+class RoundRobinQueue(FifoQueue):
+    """Round Robin: FIFO y el proceso vuelve al final al agotar el quantum."""
+
+    def __init__(self, table, remaining, quantum):
+        super().__init__(table, remaining)
+        self.quantum = quantum
+
+
+class KeyQueue(ReadyQueue):
+    """
+    Min-heap por (columna, arrival_time, índice): el mismo desempate que
+    nonpreemptive_scheduler. `column` es 'burst_time' (SJF) o 'priority'.
+    """
+
+    def __init__(self, table, remaining, column):
+        super().__init__(table, remaining)
+        self.keys = getattr(table, column)
+        self.heap = []
+
+    def push(self, i):
+        heapq.heappush(self.heap, (self.keys[i], self.table.arrival_time[i], i))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    def __len__(self):
+        return len(self.heap)
+
+    def items(self):
+        return [entry[2] for entry in self.heap]
+
+
+class SrtfQueue(ReadyQueue):
+    """SRTF: min-heap por (tiempo restante, pid, índice), expropiativo."""
+
+    preemptive = True
+
+    def __init__(self, table, remaining):
+        super().__init__(table, remaining)
+        self.heap = []
+
+    def push(self, i):
+        heapq.heappush(self.heap, (self.remaining[i], self.table.pid[i], i))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    def __len__(self):
+        return len(self.heap)
+
+    def items(self):
+        return [entry[2] for entry in self.heap]
+
+
+def make_ready_queue(name: str, table: ProcessTable, remaining: List[int], quantum=None) -> ReadyQueue:
+    """
+    Cola de listos de la política `name` (los mismos nombres que
+    registry.SCHEDULERS). `remaining` es la lista de tiempos restantes que
+    el simulador actualiza. Lanza ValueError si la política no existe o si
+    falta el quantum de Round Robin.
+    """
+    if name == "FIFO":
+        return FifoQueue(table, remaining)
+    if name == "SJF":
+        return KeyQueue(table, remaining, "burst_time")
+    if name == "Priority":
+        return KeyQueue(table, remaining, "priority")
+    if name == "SRTF":
+        return SrtfQueue(table, remaining)
+    if name == "Round Robin":
+        if not quantum:
+            raise ValueError(f"{name} requiere un quantum mayor que 0")
+        return RoundRobinQueue(table, remaining, quantum)
+    raise ValueError(f"Algoritmo no implementado: {name}")
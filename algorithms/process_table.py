@@ -0,0 +1,96 @@
+# algorithms/process_table.py
+
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Union
+
+# Entero con signo de 64 bits para las columnas numéricas
+INT_TYPECODE = 'q'
+
+
+class ProcessTable:
+    """
+    Tabla de procesos en formato columnar.
+
+    Cada columna es una secuencia indexable del mismo largo: `pid` es una
+    lista de strings internados y `burst_time`, `arrival_time` y `priority`
+    son arreglos compactos de enteros (array('q')). Todos los planificadores
+    de `algorithms/` la aceptan directamente en lugar de la lista de dicts.
+
+    El índice de llegadas ordenadas se calcula una sola vez y se reutiliza
+    entre planificadores; `arrival_order` permite pasarlo ya calculado.
+    """
+
+    __slots__ = ('pid', 'burst_time', 'arrival_time', 'priority', '_arrival_order')
+
+    def __init__(self, pid=None, burst_time=None, arrival_time=None, priority=None, arrival_order=None):
+        self.pid = [] if pid is None else pid
+        self.burst_time = array(INT_TYPECODE) if burst_time is None else burst_time
+        self.arrival_time = array(INT_TYPECODE) if arrival_time is None else arrival_time
+        self.priority = array(INT_TYPECODE) if priority is None else priority
+        self._arrival_order = arrival_order
+
+    @classmethod
+    def from_dicts(cls, processes: Iterable[Dict]) -> 'ProcessTable':
+        """
+        Construye la tabla en una sola pasada sobre la lista de dicts, sin
+        copiar los dicts: solo se leen los cuatro campos de cada proceso.
+        """
+        table = cls()
+        for p in processes:
+            table.append(p['pid'], p['burst_time'], p['arrival_time'], p.get('priority', 0))
+        return table
+
+    def append(self, pid, burst_time: int, arrival_time: int, priority: int = 0) -> None:
+        if isinstance(pid, str):
+            pid = sys.intern(pid)
+        self.pid.append(pid)
+        self.burst_time.append(burst_time)
+        self.arrival_time.append(arrival_time)
+        self.priority.append(priority)
+        self._arrival_order = None
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def __getitem__(self, i: int) -> Dict:
+        return {
+            'pid': self.pid[i],
+            'burst_time': self.burst_time[i],
+            'arrival_time': self.arrival_time[i],
+            'priority': self.priority[i]
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self.pid)):
+            yield self[i]
+
+    def to_dicts(self) -> List[Dict]:
+        return list(self)
+
+    def columns(self) -> Dict:
+        """Columnas por nombre, p. ej. para construir un DataFrame sin pasar por dicts."""
+        return {
+            'pid': self.pid,
+            'burst_time': self.burst_time,
+            'arrival_time': self.arrival_time,
+            'priority': self.priority
+        }
+
+    def arrival_order(self):
+        """Índices ordenados (de forma estable) por tiempo de llegada."""
+        if self._arrival_order is None:
+            self._arrival_order = array(
+                INT_TYPECODE, sorted(range(len(self.pid)), key=self.arrival_time.__getitem__)
+            )
+        return self._arrival_order
+
+
+def as_process_table(processes: Union[Iterable[Dict], ProcessTable]) -> ProcessTable:
+    """
+    Devuelve `processes` tal cual si ya es una ProcessTable; en otro caso la
+    construye a partir de la lista de dicts.
+    """
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_dicts(processes)
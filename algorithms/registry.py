@@ -0,0 +1,47 @@
+# algorithms/registry.py
+
+from algorithms import fifo, sjf, srtf, round_robin, priority
+
+# Nombre visible -> función del planificador
+SCHEDULERS = {
+    "FIFO": fifo.fifo_scheduler,
+    "SJF": sjf.sjf_scheduler,
+    "SRTF": srtf.srtf_scheduler,
+    "Round Robin": round_robin.round_robin_scheduler,
+    "Priority": priority.priority_scheduler
+}
+
+# Algoritmos que requieren quantum
+QUANTUM_SCHEDULERS = {"Round Robin"}
+
+
+def run_scheduler(name, processes, quantum=None, compact=False):
+    """
+    Ejecuta el planificador `name` sobre `processes`. Lanza ValueError si el
+    algoritmo no existe o si falta el quantum de Round Robin.
+    """
+    if name not in SCHEDULERS:
+        raise ValueError(f"Algoritmo no implementado: {name}")
+    if name in QUANTUM_SCHEDULERS:
+        if not quantum:
+            raise ValueError(f"{name} requiere un quantum mayor que 0")
+        return SCHEDULERS[name](processes, quantum, compact=compact)
+    return SCHEDULERS[name](processes, compact=compact)
+
+
+def expand_jobs(algorithms, quanta=()):
+    """Lista de ejecuciones (algoritmo, quantum): una por quantum para Round Robin."""
+    jobs = []
+    for name in algorithms:
+        if name in QUANTUM_SCHEDULERS:
+            jobs.extend((name, q) for q in quanta)
+        else:
+            jobs.append((name, None))
+    return jobs
+
+
+def job_label(name, quantum=None):
+    """Etiqueta legible de una ejecución, p. ej. 'Round Robin (q=2)'."""
+    if name in QUANTUM_SCHEDULERS:
+        return f"{name} (q={quantum})"
+    return name
@@ -1,57 +1,97 @@
 from collections import deque
-from copy import deepcopy
 
-def round_robin_scheduler(processes, quantum):
+from algorithms import instrumentation
+from algorithms.process_table import as_process_table
+from algorithms.timeline import Timeline
 
+def round_robin_scheduler(processes, quantum, merge_slices=False, compact=False):
+    """
+    Simula Round Robin con un cursor sobre las llegadas ordenadas.
 
-    processes = deepcopy(processes)
-    time = 0
+    Los periodos sin procesos listos se saltan directamente hasta la siguiente
+    llegada. Con merge_slices=True los quanta consecutivos del mismo proceso
+    se fusionan en un solo tramo y, si está solo en la cola, se ejecutan de
+    una vez hasta la siguiente llegada, por lo que el costo depende del número
+    de tramos y no de la duración de la simulación. Con compact=True
+    'timeline' es un Timeline columnar.
+
+    Con la instrumentación activa (algorithms/instrumentation.py) cuenta
+    las operaciones sobre la cola y los despachos, expropiaciones (fin de
+    quantum), cambios de contexto y saltos de CPU ociosa bajo el ámbito
+    'round_robin'.
+    """
+    table = as_process_table(processes)
+    pids = table.pid
+    arrivals = table.arrival_time
+
+    n = len(table)
+    # Llegadas ordenadas (estable): los que llegan en el mismo quantum se
+    # encolan por tiempo de llegada
+    order = table.arrival_order()
+    remaining_bt = list(table.burst_time)
+    finish_times = [0] * n
     queue = deque()
-    timeline = []
-    remaining_bt = {p['pid']: p['burst_time'] for p in processes}
-    arrival_times = {p['pid']: p['arrival_time'] for p in processes}
-    finish_times = {}
-    arrived = set()
-
-    while len(finish_times) < len(processes):
-        # Insertar procesos que llegan en este ciclo
-        for p in processes:
-            if p['arrival_time'] <= time and p['pid'] not in arrived:
-                queue.append(p['pid'])
-                arrived.add(p['pid'])
+    enqueue, dequeue = queue.append, queue.popleft
+    inst = instrumentation.active()
+    if inst is not None:
+        enqueue = inst.counting('round_robin', 'queue_push', enqueue)
+        dequeue = inst.counting('round_robin', 'queue_pop', dequeue)
+    timeline = Timeline(pids)
+
+    time = 0
+    next_arrival = 0
+    finished = 0
 
+    while finished < n:
         if not queue:
-            time += 1
-            continue
+            # Saltar el hueco inactivo hasta la siguiente llegada
+            time = max(time, arrivals[order[next_arrival]])
+            while next_arrival < n and arrivals[order[next_arrival]] <= time:
+                enqueue(order[next_arrival])
+                next_arrival += 1
+
+        i = dequeue()
+        exec_time = min(quantum, remaining_bt[i])
 
-        pid = queue.popleft()
-        exec_time = min(quantum, remaining_bt[pid])
-        timeline.append({
-            'pid': pid,
-            'start': time,
-            'end': time + exec_time
-        })
+        if merge_slices and not queue:
+            # Solo en la cola: repite quanta hasta que llegue alguien o termine
+            if next_arrival < n:
+                gap = arrivals[order[next_arrival]] - time
+                quanta = max(1, -(-gap // quantum))
+                exec_time = min(remaining_bt[i], quanta * quantum)
+            else:
+                exec_time = remaining_bt[i]
+
+        if merge_slices:
+            timeline.extend(i, time, time + exec_time)
+        else:
+            timeline.append(i, time, time + exec_time)
 
         time += exec_time
-        remaining_bt[pid] -= exec_time
+        remaining_bt[i] -= exec_time
 
-        # Revisar si otros procesos llegan durante este tiempo
-        for p in processes:
-            if p['arrival_time'] > time - exec_time and p['arrival_time'] <= time and p['pid'] not in arrived:
-                queue.append(p['pid'])
-                arrived.add(p['pid'])
+        # Encolar los procesos que llegaron durante este quantum
+        while next_arrival < n and arrivals[order[next_arrival]] <= time:
+            enqueue(order[next_arrival])
+            next_arrival += 1
 
-        if remaining_bt[pid] > 0:
-            queue.append(pid)
+        if remaining_bt[i] > 0:
+            enqueue(i)
         else:
-            finish_times[pid] = time
+            finish_times[i] = time
+            finished += 1
 
     # Calcular tiempo de espera: Finish - Arrival - Burst
-    waiting_times = []
-    for p in processes:
-        pid = p['pid']
-        wt = finish_times[pid] - p['arrival_time'] - p['burst_time']
-        waiting_times.append(wt)
+    waiting_times = [
+        finish_times[i] - arrivals[i] - table.burst_time[i]
+        for i in range(n)
+    ]
 
     avg_waiting_time = sum(waiting_times) / len(waiting_times)
-    return {'timeline': timeline, 'avg_waiting_time': avg_waiting_time}
+    if inst is not None:
+        inst.count('round_robin', 'runs')
+        inst.update('round_robin', instrumentation.timeline_counters(timeline))
+    return {
+        'timeline': timeline if compact else timeline.to_dicts(),
+        'avg_waiting_time': avg_waiting_time
+    }
@@ -0,0 +1,175 @@
+# algorithms/smp.py
+
+import heapq
+from typing import Dict, List, Optional, Union
+
+from algorithms.policies import make_ready_queue
+from algorithms.process_table import ProcessTable, as_process_table
+from algorithms.timeline import CoreTimeline
+
+
+def smp_schedule(processes: Union[List[Dict], ProcessTable], algorithm: str, cores: int,
+                 quantum: Optional[int] = None, stealing: bool = True, affinity: bool = True,
+                 compact: bool = False) -> Dict:
+    """
+    Simulación multinúcleo (SMP) de la política `algorithm` con `cores`
+    núcleos, cada uno con su propia cola de listos.
+
+    - Al llegar, un proceso va a un núcleo ocioso (el de menor número) o, si
+      todos están ocupados, al siguiente en turno circular.
+    - Con `affinity`, un proceso que agota su quantum vuelve a la cola de su
+      núcleo; sin ella se reubica como si llegara.
+    - Con `stealing`, un núcleo que se queda sin trabajo toma el siguiente
+      proceso de la cola más larga.
+    - En políticas expropiativas (SRTF) cada núcleo reelige cuando le llega
+      un proceso.
+
+    Orientada a eventos: el reloj salta entre llegadas y fines de tramo, con
+    un heap de eventos por núcleo, así que el costo no depende del largo de
+    los bursts. Con un solo núcleo produce la misma calendarización que el
+    planificador correspondiente (con los tramos contiguos fusionados).
+
+    Devuelve {'timeline', 'avg_waiting_time', 'makespan', 'core_utilization',
+    'migrations', 'steals'}: los tramos llevan además 'core', la utilización
+    es la fracción del makespan que cada núcleo estuvo ocupado y
+    'migrations' cuenta las veces que un proceso siguió en otro núcleo.
+    """
+    if cores < 1:
+        raise ValueError("El número de núcleos debe ser un entero mayor que 0")
+    table = as_process_table(processes)
+    pids = table.pid
+    arrivals = table.arrival_time
+    n = len(table)
+
+    remaining = list(table.burst_time)
+    queues = [make_ready_queue(algorithm, table, remaining, quantum) for _ in range(cores)]
+    preemptive = queues[0].preemptive
+    slice_length = queues[0].quantum
+    order = table.arrival_order()
+
+    timeline = CoreTimeline(pids, cores)
+    finish = [0] * n
+    last_core = [-1] * n
+    running = [None] * cores
+    started = [0] * cores
+    version = [0] * cores  # invalida el fin de tramo de un núcleo expropiado
+    busy = [0] * cores
+    events = []  # heap de (fin del tramo, núcleo, versión)
+    idle = set(range(cores))  # sin proceso y con la cola vacía
+    # Largo de cada cola y total en espera: el robo solo recorre los núcleos
+    # si hay algo que robar
+    lengths = [0] * cores
+    queued = 0
+    cursor = 0
+    migrations = 0
+    steals = 0
+
+    def push(k, i):
+        nonlocal queued
+        queues[k].push(i)
+        lengths[k] += 1
+        queued += 1
+
+    def pop(k):
+        nonlocal queued
+        lengths[k] -= 1
+        queued -= 1
+        return queues[k].pop()
+
+    def place(i):
+        nonlocal cursor
+        if idle:
+            k = min(idle)
+            idle.discard(k)
+        else:
+            k = cursor
+            cursor = (cursor + 1) % cores
+        push(k, i)
+        return k
+
+    def stop(k, t):
+        """Cierra el tramo en curso del núcleo k en t y devuelve el proceso."""
+        i = running[k]
+        run = t - started[k]
+        remaining[i] -= run
+        busy[k] += run
+        timeline.extend(i, started[k], t, k)
+        running[k] = None
+        version[k] += 1
+        return i
+
+    def dispatch(k, t, i):
+        nonlocal migrations
+        if last_core[i] not in (-1, k):
+            migrations += 1
+        last_core[i] = k
+        running[k] = i
+        started[k] = t
+        run = remaining[i] if slice_length is None else min(remaining[i], slice_length)
+        heapq.heappush(events, (t + run, k, version[k]))
+
+    time = 0
+    next_arrival = 0
+    finished = 0
+    while finished < n:
+        t = arrivals[order[next_arrival]] if next_arrival < n else None
+        if events and (t is None or events[0][0] <= t):
+            t = events[0][0]
+        time = t
+
+        touched = set()
+        requeue = []
+        # 1. Tramos que terminan en t (en orden de núcleo)
+        while events and events[0][0] == t:
+            _, k, v = heapq.heappop(events)
+            if v != version[k]:
+                continue
+            i = stop(k, t)
+            touched.add(k)
+            if remaining[i] == 0:
+                finish[i] = t
+                finished += 1
+            else:
+                requeue.append((i, k))
+            # Un núcleo que quedó libre recibe las llegadas de este mismo ciclo
+            if not lengths[k] and (remaining[i] == 0 or not affinity):
+                idle.add(k)
+
+        # 2. Llegadas hasta t, antes que los que vuelven a la cola
+        while next_arrival < n and arrivals[order[next_arrival]] <= t:
+            touched.add(place(order[next_arrival]))
+            next_arrival += 1
+
+        # 3. Fin de quantum
+        for i, k in requeue:
+            if affinity:
+                push(k, i)
+            else:
+                touched.add(place(i))
+
+        # 4. Reelegir en los núcleos afectados
+        for k in (sorted(touched) if len(touched) > 1 else touched):
+            if running[k] is not None:
+                if preemptive and lengths[k]:
+                    push(k, stop(k, t))
+                    dispatch(k, t, pop(k))
+                continue
+            if lengths[k]:
+                idle.discard(k)
+                dispatch(k, t, pop(k))
+            elif stealing and queued:
+                steals += 1
+                idle.discard(k)
+                dispatch(k, t, pop(max(range(cores), key=lengths.__getitem__)))
+            else:
+                idle.add(k)
+
+    waiting_times = [finish[i] - arrivals[i] - table.burst_time[i] for i in range(n)]
+    return {
+        'timeline': timeline if compact else timeline.to_dicts(),
+        'avg_waiting_time': sum(waiting_times) / n if n else 0.0,
+        'makespan': time,
+        'core_utilization': [b / time if time else 0.0 for b in busy],
+        'migrations': migrations,
+        'steals': steals
+    }
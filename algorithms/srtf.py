@@ -1,61 +1,80 @@
-from copy import deepcopy
 import heapq
 
-def srtf_scheduler(processes):
+from algorithms import instrumentation
+from algorithms.process_table import as_process_table
+from algorithms.timeline import Timeline
 
+def srtf_scheduler(processes, compact=False):
+    """
+    Simula SRTF orientado a eventos: el reloj solo avanza entre llegadas y
+    finalizaciones, por lo que el costo es O(N log N) y no depende de la
+    suma de los bursts. Produce el mismo resultado que la versión ciclo a
+    ciclo original (tests/legacy.py).
+    Con compact=True 'timeline' es un Timeline columnar.
+
+    Con la instrumentación activa (algorithms/instrumentation.py) cuenta
+    las operaciones sobre el heap y los despachos, expropiaciones, cambios
+    de contexto y saltos de CPU ociosa bajo el ámbito 'srtf'.
+    """
+    table = as_process_table(processes)
+    pids = table.pid
+    arrivals = table.arrival_time
+
+    n = len(table)
+    # Llegadas ordenadas (estable) para recorrerlas con un cursor
+    order = table.arrival_order()
+    remaining = list(table.burst_time)
+    finish_times = [0] * n
+    timeline = Timeline(pids)
+
+    ready_queue = []  # (restante, pid, índice)
+    push, pop = heapq.heappush, heapq.heappop
+    inst = instrumentation.active()
+    if inst is not None:
+        push = inst.counting('srtf', 'heap_push', push)
+        pop = inst.counting('srtf', 'heap_pop', pop)
+    next_arrival = 0
     time = 0
-    processes = deepcopy(processes)
-
-    # Estado de ejecución
-    remaining_bt = {p['pid']: p['burst_time'] for p in processes}
-    arrival_times = {p['pid']: p['arrival_time'] for p in processes}
-    finish_times = {}
-    timeline = []
-
-    ready_queue = []
-    current_pid = None
-    last_time = 0
-
-    while remaining_bt:
-        # Cargar procesos que llegan en este ciclo
-        for p in processes:
-            if p['arrival_time'] == time:
-                heapq.heappush(ready_queue, (p['burst_time'], p['pid'], p))
-
-        if ready_queue:
-            # Seleccionamos el proceso con menor burst restante
-            burst, pid, proc = heapq.heappop(ready_queue)
-
-            # Si el proceso cambia, registramos el anterior
-            if current_pid != pid:
-                if current_pid is not None:
-                    timeline[-1]["end"] = time
-                timeline.append({"pid": pid, "start": time, "end": time + 1})
-                current_pid = pid
-            else:
-                timeline[-1]["end"] += 1
-
-            remaining_bt[pid] -= 1
-            time += 1
-
-            if remaining_bt[pid] > 0:
-                heapq.heappush(ready_queue, (remaining_bt[pid], pid, proc))
-            else:
-                finish_times[pid] = time
-                del remaining_bt[pid]
-                current_pid = None
+
+    while next_arrival < n or ready_queue:
+        # Sin procesos listos: saltar directamente a la siguiente llegada
+        if not ready_queue:
+            time = max(time, arrivals[order[next_arrival]])
+
+        while next_arrival < n and arrivals[order[next_arrival]] <= time:
+            i = order[next_arrival]
+            push(ready_queue, (remaining[i], pids[i], i))
+            next_arrival += 1
+
+        rem, pid, i = pop(ready_queue)
+
+        # Ejecutar hasta terminar o hasta la próxima llegada (posible expropiación)
+        run = rem
+        if next_arrival < n:
+            run = min(run, arrivals[order[next_arrival]] - time)
+
+        # Tramos consecutivos del mismo proceso se fusionan
+        timeline.extend(i, time, time + run)
+
+        time += run
+        remaining[i] = rem - run
+
+        if remaining[i] > 0:
+            push(ready_queue, (remaining[i], pid, i))
         else:
-            time += 1
+            finish_times[i] = time
 
     # Calcular tiempo de espera por fórmula: finish - arrival - burst
-    waiting_times = []
-    for p in processes:
-        pid = p['pid']
-        wt = finish_times[pid] - p['arrival_time'] - p['burst_time']
-        waiting_times.append(wt)
+    waiting_times = [
+        finish_times[i] - arrivals[i] - table.burst_time[i]
+        for i in range(n)
+    ]
 
     avg_waiting_time = sum(waiting_times) / len(waiting_times)
+    if inst is not None:
+        inst.count('srtf', 'runs')
+        inst.update('srtf', instrumentation.timeline_counters(timeline))
     return {
-        "timeline": timeline,
+        "timeline": timeline if compact else timeline.to_dicts(),
         "avg_waiting_time": avg_waiting_time
     }
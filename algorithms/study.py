@@ -0,0 +1,291 @@
+# algorithms/study.py
+"""
+Estudios Monte Carlo: comparación de políticas sobre miles de trazas
+sintéticas (algorithms/workloads.py) con medias e intervalos de confianza.
+
+Ejemplos:
+
+    python -m algorithms.study --traces 2000 -n 200
+    python -m algorithms.study -a fifo -a sjf -a rr -q 2 -q 8 --rate 0.15 --burst-shape 1.2 -j 8
+    python -m algorithms.study --traces 500 --format json -o estudio.json
+
+Cada worker genera sus trazas a partir de semillas independientes, corre
+todas las ejecuciones (algoritmo, quantum) sobre cada una y acumula las
+métricas en estadísticos de Welford; solo esos acumuladores vuelven al
+proceso principal, que los combina en el orden de los bloques. No se
+guarda ninguna línea de tiempo.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import NormalDist
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from algorithms.metrics import compute_metrics
+from algorithms.registry import SCHEDULERS, expand_jobs, job_label, run_scheduler
+from algorithms.workloads import generate_processes
+
+# Métricas de compute_metrics que se resumen en el estudio
+METRICS = (
+    "avg_waiting_time", "avg_turnaround_time", "avg_response_time",
+    "cpu_utilization", "throughput", "context_switches", "makespan"
+)
+# Bloques de trazas: suficientes para repartir la carga entre workers. No
+# depende del número de workers para que los resultados tampoco dependan
+STUDY_CHUNKS = 64
+
+
+class RunningStats:
+    """
+    Media y varianza en una pasada (Welford), combinables entre procesos con
+    la fórmula de Chan et al. Guarda solo cinco números por métrica.
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def merge(self, other: 'RunningStats') -> None:
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Varianza muestral (0 con menos de dos observaciones)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """Intervalo de confianza de la media (aproximación normal)."""
+        if self.count < 2:
+            return self.mean, self.mean
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half = z * self.stdev / math.sqrt(self.count)
+        return self.mean - half, self.mean + half
+
+
+def _run_chunk(seeds, jobs, n: int, workload: Dict) -> Dict[tuple, RunningStats]:
+    """
+    Corre todas las ejecuciones sobre las trazas de `seeds`. Además de cada
+    métrica acumula la diferencia pareada contra la primera ejecución (misma
+    traza), que tiene mucha menos varianza que comparar medias sueltas.
+    """
+    stats = {}
+
+    def add(key, value):
+        acc = stats.get(key)
+        if acc is None:
+            acc = stats[key] = RunningStats()
+        acc.add(float(value))
+
+    for seed in seeds:
+        table = generate_processes(n, seed=seed, **workload)
+        base = None
+        for job in jobs:
+            result = run_scheduler(job[0], table, job[1], compact=True)
+            metricas = compute_metrics(table, result['timeline'])
+            for metric in METRICS:
+                add((job, metric), metricas[metric])
+                if base is not None:
+                    add((job, metric, 'diff'), metricas[metric] - base[metric])
+            if base is None:
+                base = metricas
+    return stats
+
+
+def run_study(jobs: Sequence[Tuple[str, Optional[int]]], traces: int, n: int,
+              workload: Optional[Dict] = None, seed: int = 0, max_workers: Optional[int] = None,
+              confidence: float = 0.95, progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+    """
+    Corre las ejecuciones (algoritmo, quantum) de `jobs` sobre `traces`
+    trazas de `n` procesos generadas con generate_processes(**workload).
+    Las semillas de las trazas salen de SeedSequence(seed) y los bloques
+    se combinan siempre en el mismo orden, así que el resultado es idéntico
+    (bit a bit) sin importar el número de workers.
+
+    Devuelve una fila por ejecución y métrica con la media, la desviación
+    estándar, el intervalo de confianza y la diferencia pareada contra la
+    primera ejecución ('diff_*', None en la primera). `progress(hechas,
+    total)` se llama cada vez que termina un bloque de trazas.
+    """
+    if traces < 1 or n < 1:
+        raise ValueError("El número de trazas y de procesos debe ser mayor que 0")
+    if not jobs:
+        raise ValueError("Se necesita al menos un algoritmo")
+    for name, quantum in jobs:
+        if name not in SCHEDULERS:
+            raise ValueError(f"Algoritmo no implementado: {name}")
+    workload = workload or {}
+    seeds = np.random.SeedSequence(seed).spawn(traces)
+
+    size = max(1, math.ceil(traces / STUDY_CHUNKS))
+    chunks = [seeds[k:k + size] for k in range(0, traces, size)]
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+
+    totals = {}
+    done = 0
+
+    def reduce(stats):
+        for key, acc in stats.items():
+            totals.setdefault(key, RunningStats()).merge(acc)
+
+    def report(count):
+        nonlocal done
+        done += count
+        if progress is not None:
+            progress(done, traces)
+
+    if workers == 1:
+        for chunk in chunks:
+            reduce(_run_chunk(chunk, jobs, n, workload))
+            report(len(chunk))
+    else:
+        # La suma en coma flotante depende del orden: los bloques que llegan
+        # antes de tiempo esperan a los anteriores
+        pending = {}
+        following = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_chunk, chunk, jobs, n, workload): k for k, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                k = futures[future]
+                pending[k] = future.result()
+                report(len(chunks[k]))
+                while following in pending:
+                    reduce(pending.pop(following))
+                    following += 1
+
+    rows = []
+    for job in jobs:
+        for metric in METRICS:
+            acc = totals[(job, metric)]
+            low, high = acc.interval(confidence)
+            row = {
+                'algorithm': job[0],
+                'quantum': job[1],
+                'label': job_label(*job),
+                'metric': metric,
+                'traces': acc.count,
+                'mean': acc.mean,
+                'stdev': acc.stdev,
+                'ci_low': low,
+                'ci_high': high,
+                'diff_mean': None,
+                'diff_ci_low': None,
+                'diff_ci_high': None
+            }
+            diff = totals.get((job, metric, 'diff'))
+            if diff is not None:
+                row['diff_mean'] = diff.mean
+                row['diff_ci_low'], row['diff_ci_high'] = diff.interval(confidence)
+            rows.append(row)
+    return rows
+
+
+def build_parser():
+    from algorithms.cli import ALIASES, algorithm_name
+
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms.study",
+        description="Compara algoritmos de calendarización sobre muchas trazas sintéticas."
+    )
+    parser.add_argument("-a", "--algorithm", action="append", type=algorithm_name,
+                        help=f"algoritmo ({', '.join(ALIASES)}); se puede repetir (por defecto: todos)")
+    parser.add_argument("-q", "--quantum", action="append", type=int,
+                        help="quantum para Round Robin; se puede repetir (por defecto: 2)")
+    parser.add_argument("--traces", type=int, default=1000, help="número de trazas (por defecto: 1000)")
+    parser.add_argument("-n", "--processes", type=int, default=100,
+                        help="procesos por traza (por defecto: 100)")
+    parser.add_argument("--rate", type=float, default=0.2,
+                        help="llegadas por ciclo, Poisson (por defecto: 0.2)")
+    parser.add_argument("--burst-shape", type=float, default=1.5,
+                        help="forma de la Pareto de los bursts; menor = cola más pesada (por defecto: 1.5)")
+    parser.add_argument("--burst-scale", type=float, default=4.0,
+                        help="escala de la Pareto de los bursts (por defecto: 4)")
+    parser.add_argument("--max-burst", type=int, default=1000, help="burst máximo (por defecto: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="semilla del estudio (por defecto: 0)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="nivel de confianza de los intervalos (por defecto: 0.95)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="procesos en paralelo (por defecto: todos los núcleos)")
+    parser.add_argument("-f", "--format", choices=["csv", "json"], default="csv",
+                        help="formato de salida (por defecto: csv)")
+    parser.add_argument("-o", "--output", help="archivo de salida (por defecto: stdout)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    quanta = args.quantum or [2]
+    if any(q < 1 for q in quanta):
+        print("El quantum debe ser un entero mayor que 0.", file=sys.stderr)
+        return 1
+    if not 0 < args.confidence < 1:
+        print("El nivel de confianza debe estar entre 0 y 1.", file=sys.stderr)
+        return 1
+    jobs = expand_jobs(args.algorithm or list(SCHEDULERS), quanta)
+    workload = {
+        "arrival_rate": args.rate,
+        "burst_shape": args.burst_shape,
+        "burst_scale": args.burst_scale,
+        "max_burst": args.max_burst
+    }
+
+    def progress(done, total):
+        print(f"\r{done}/{total} trazas", end="", file=sys.stderr, flush=True)
+
+    try:
+        rows = run_study(jobs, args.traces, args.processes, workload, args.seed,
+                         args.jobs, args.confidence, progress)
+    except ValueError as e:
+        print(f"\n{e}", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump({"workload": workload, "traces": args.traces, "processes": args.processes,
+                       "confidence": args.confidence, "results": rows}, out, ensure_ascii=False, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# algorithms/sweep.py
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from algorithms.compare import (PARALLEL_MIN_WORK, SharedProcessTable, attach_process_table, discard_pool,
+                                release_process_table, shared_pool)
+from algorithms.metrics import as_int_array
+from algorithms.process_table import as_process_table
+from algorithms.round_robin import round_robin_scheduler
+
+
+def _evaluate_quanta(table, quanta: Iterable[int]) -> List[Dict]:
+    n = len(table)
+    avg_burst = sum(table.burst_time) / n
+    rows = []
+    for quantum in quanta:
+        # Tramos fusionados: mismas métricas con menos iteraciones
+        result = round_robin_scheduler(table, quantum, merge_slices=True, compact=True)
+        idx = as_int_array(result['timeline'].pid_index)
+        rows.append({
+            'quantum': quantum,
+            'avg_waiting_time': result['avg_waiting_time'],
+            'avg_turnaround_time': result['avg_waiting_time'] + avg_burst,
+            'context_switches': int(np.count_nonzero(idx[1:] != idx[:-1]))
+        })
+    return rows
+
+
+def _evaluate_chunk(handle, quanta):
+    table, shm = attach_process_table(handle)
+    try:
+        return _evaluate_quanta(table, quanta)
+    finally:
+        release_process_table(table, shm)
+
+
+def round_robin_sweep(processes, quanta: Iterable[int], max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Evalúa Round Robin para todos los `quanta` sobre la misma traza.
+
+    El índice de llegadas se ordena una sola vez y se comparte con los
+    procesos del pool junto con la tabla; cada worker evalúa un bloque de
+    quanta. Devuelve una fila por quantum (ordenadas por quantum) con espera
+    y turnaround promedio y número de cambios de contexto.
+    """
+    table = as_process_table(processes)
+    quanta = sorted(set(quanta))
+    if any(q < 1 for q in quanta):
+        raise ValueError("Los quanta deben ser enteros mayores que 0")
+    if not quanta or not len(table):
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    table.arrival_order()
+    if workers == 1 or len(quanta) == 1 or len(table) * len(quanta) < PARALLEL_MIN_WORK:
+        return _evaluate_quanta(table, quanta)
+
+    # Quanta intercalados por bloque para repartir la carga entre workers
+    chunks = [quanta[k::workers] for k in range(min(workers, len(quanta)))]
+    rows = []
+    with SharedProcessTable(table) as shared:
+        try:
+            for chunk_rows in shared_pool(max_workers).map(_evaluate_chunk, [shared.handle] * len(chunks), chunks):
+                rows.extend(chunk_rows)
+        except BrokenProcessPool:
+            discard_pool(max_workers)
+            raise
+    rows.sort(key=lambda row: row['quantum'])
+    return rows
+
+
+def best_quantum(rows: List[Dict], metric: str = 'avg_waiting_time') -> Optional[Dict]:
+    """Fila con el menor valor de `metric` (empates: el quantum más pequeño)."""
+    if not rows:
+        return None
+    return min(rows, key=lambda row: (row[metric], row['quantum']))
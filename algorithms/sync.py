@@ -0,0 +1,428 @@
+# algorithms/sync.py
+
+import heapq
+from array import array
+from collections import deque
+from typing import Dict, Iterator, List, Union
+
+from algorithms import instrumentation
+from algorithms.process_table import INT_TYPECODE, ProcessTable, as_process_table
+
+# Tipos de evento, en el orden de sus códigos
+EVENTS = ("REQUEST", "ACCESSED", "WAITING", "FAILED", "RELEASE")
+REQUEST, ACCESSED, WAITING, FAILED, RELEASE = range(len(EVENTS))
+
+# Tipos de acceso del archivo de acciones (lector-escritor)
+READ, WRITE = "READ", "WRITE"
+
+# Intentos de un pedido en espera antes de marcarlo FAILED (modo Semáforo)
+MAX_INTENTOS = 5
+
+# Ciclos extra que el Semáforo sigue simulando después de la última acción
+CICLOS_EXTRA = 10
+
+
+class SyncLog:
+    """
+    Bitácora columnar de una simulación de sincronización: arreglos paralelos
+    de enteros con el ciclo, el índice del proceso, el índice del recurso, el
+    tipo de evento (ver EVENTS), el número de intento, la duración en ciclos
+    (cuánto dura el estado ACCESSED/WAITING/FAILED que marca) y el índice de
+    la acción que originó cada evento.
+
+    `pids` y `resources` traducen los índices a nombres. `cycles` es la
+    cantidad de ciclos simulados (0 .. cycles - 1). Iterar devuelve los
+    eventos como dicts {'cycle', 'pid', 'resource', 'event', 'attempt',
+    'duration', 'action'}.
+    """
+
+    __slots__ = ('pids', 'resources', 'cycle', 'pid_index', 'resource_index',
+                 'event', 'attempt', 'duration', 'action', 'cycles')
+
+    def __init__(self, pids: List[str], resources: List[str]):
+        self.pids = pids
+        self.resources = resources
+        self.cycle = array(INT_TYPECODE)
+        self.pid_index = array(INT_TYPECODE)
+        self.resource_index = array(INT_TYPECODE)
+        self.event = array(INT_TYPECODE)
+        self.attempt = array(INT_TYPECODE)
+        self.duration = array(INT_TYPECODE)
+        self.action = array(INT_TYPECODE)
+        self.cycles = 0
+
+    def append(self, cycle: int, pid: int, resource: int, event: int, action: int,
+               attempt: int = 0, duration: int = 1) -> int:
+        """Agrega un evento y devuelve su posición (para fijar la duración después)."""
+        self.cycle.append(cycle)
+        self.pid_index.append(pid)
+        self.resource_index.append(resource)
+        self.event.append(event)
+        self.attempt.append(attempt)
+        self.duration.append(duration)
+        self.action.append(action)
+        return len(self.cycle) - 1
+
+    def __len__(self) -> int:
+        return len(self.cycle)
+
+    def __getitem__(self, k: int) -> Dict:
+        return {
+            'cycle': self.cycle[k],
+            'pid': self.pids[self.pid_index[k]],
+            'resource': self.resources[self.resource_index[k]],
+            'event': EVENTS[self.event[k]],
+            'attempt': self.attempt[k],
+            'duration': self.duration[k],
+            'action': self.action[k]
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        for k in range(len(self.cycle)):
+            yield self[k]
+
+    def columns(self) -> Dict[str, List]:
+        """Columnas con nombres en lugar de índices, p. ej. para un DataFrame."""
+        pids, resources = self.pids, self.resources
+        return {
+            'cycle': list(self.cycle),
+            'pid': [pids[i] for i in self.pid_index],
+            'resource': [resources[i] for i in self.resource_index],
+            'event': [EVENTS[e] for e in self.event],
+            'attempt': list(self.attempt),
+            'duration': list(self.duration),
+            'action': list(self.action)
+        }
+
+
+def _prepare(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+             actions: List[Dict], duration: int = 1):
+    """
+    Agrupa las acciones por ciclo, ya traducidas a índices de proceso y de
+    recurso: {ciclo: [(proceso, recurso, duración, acción), ...]} en el
+    orden del archivo (`duration` si la acción no trae 'duracion'; acción es
+    la posición en `actions`), y la lista ordenada de ciclos con acciones.
+    Las acciones en ciclos negativos se ignoran. Lanza ValueError si una
+    acción usa un recurso no definido.
+    """
+    pids = list(as_process_table(processes).pid)
+    pid_index = {pid: i for i, pid in enumerate(pids)}
+    names = list(resources)
+    resource_index = {name: i for i, name in enumerate(names)}
+
+    por_ciclo = {}
+    for a, accion in enumerate(actions):
+        if accion['ciclo'] < 0:
+            # La simulación empieza en el ciclo 0
+            continue
+        r = resource_index.get(accion['recurso'])
+        if r is None:
+            raise ValueError(f"Recurso no definido: {accion['recurso']}")
+        p = pid_index.get(accion['pid'])
+        if p is None:
+            # Acciones de procesos que no están en el archivo de procesos
+            p = pid_index[accion['pid']] = len(pids)
+            pids.append(accion['pid'])
+        bucket = por_ciclo.get(accion['ciclo'])
+        if bucket is None:
+            bucket = por_ciclo[accion['ciclo']] = []
+        bucket.append((p, r, accion.get('duracion', duration), a))
+    return por_ciclo, sorted(por_ciclo), pids, names
+
+
+def _record(scope: str, log: SyncLog, queues: bool = False) -> None:
+    """
+    Contadores de una simulación terminada para la instrumentación activa:
+    eventos por tipo, ciclos simulados, ciclos con eventos y ciclos vacíos
+    saltados ('idle_skips'). En los modos con cola cada WAITING es una
+    entrada a la cola y cada ACCESSED una liberación programada en el heap,
+    así que esas operaciones se cuentan a partir de la bitácora.
+    """
+    inst = instrumentation.active()
+    if inst is None:
+        return
+    event = log.event
+    active_cycles = len(set(log.cycle))
+    counters = {
+        'runs': 1,
+        'requests': event.count(REQUEST),
+        'accesses': event.count(ACCESSED),
+        'waits': event.count(WAITING),
+        'failures': event.count(FAILED),
+        'releases': event.count(RELEASE),
+        'cycles': log.cycles,
+        'active_cycles': active_cycles,
+        'idle_skips': log.cycles - active_cycles
+    }
+    if queues:
+        counters.update({
+            'queue_push': counters['waits'],
+            # Los FAILED de los modos con cola son los que nunca salieron
+            'queue_pop': counters['waits'] - counters['failures'],
+            'heap_push': counters['accesses'],
+            'heap_pop': counters['releases']
+        })
+    inst.update(scope, counters)
+
+
+def simulate_mutex(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+                   actions: List[Dict]) -> SyncLog:
+    """
+    Simulación Mutex: cada acción pide una unidad del recurso en su ciclo.
+    Si hay disponible la obtiene (ACCESSED) y la devuelve al final del ciclo
+    siguiente (RELEASE); si no, queda registrada como WAITING sin reintentar.
+    Se simulan los ciclos 0 .. ciclo de la última acción, visitando solo los
+    que tienen acciones o liberaciones.
+    """
+    por_ciclo, ciclos, pids, names = _prepare(processes, resources, actions)
+    log = SyncLog(pids, names)
+    if not ciclos:
+        return log
+
+    capacity = [resources[name] for name in names]
+    available = capacity[:]
+    ocupados = []  # (proceso, recurso, acción) a liberar al final del ciclo siguiente
+    ciclo_max = ciclos[-1]
+    k = 0
+
+    ciclo = ciclos[0]
+    while ciclo <= ciclo_max:
+        usados = []
+        if k < len(ciclos) and ciclos[k] == ciclo:
+            k += 1
+            for p, r, _, a in por_ciclo[ciclo]:
+                log.append(ciclo, p, r, REQUEST, a)
+                if available[r] > 0:
+                    available[r] -= 1
+                    usados.append((p, r, a))
+                    log.append(ciclo, p, r, ACCESSED, a)
+                else:
+                    log.append(ciclo, p, r, WAITING, a)
+
+        for p, r, a in ocupados:
+            if available[r] < capacity[r]:
+                available[r] += 1
+                log.append(ciclo, p, r, RELEASE, a)
+        ocupados = usados
+
+        # Saltar los ciclos vacíos hasta la próxima liberación o acción
+        if ocupados:
+            ciclo += 1
+        elif k < len(ciclos):
+            ciclo = ciclos[k]
+        else:
+            break
+
+    log.cycles = ciclo_max + 1
+    _record('mutex', log)
+    return log
+
+
+def simulate_semaphore(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+                       actions: List[Dict]) -> SyncLog:
+    """
+    Simulación Semáforo: al inicio de cada ciclo se liberan las unidades
+    obtenidas en el ciclo anterior; luego se atienden, en orden, los pedidos
+    pendientes y los nuevos del ciclo. Un pedido sin unidades disponibles se
+    reintenta en el ciclo siguiente (WAITING) hasta MAX_INTENTOS veces, y
+    después se marca FAILED. Termina cuando no quedan pedidos ni recursos
+    tomados, o a los CICLOS_EXTRA ciclos de la última acción. Los ciclos sin
+    acciones, pedidos pendientes ni recursos tomados se saltan.
+    """
+    por_ciclo, ciclos, pids, names = _prepare(processes, resources, actions)
+    log = SyncLog(pids, names)
+    if not ciclos:
+        return log
+
+    available = [resources[name] for name in names]
+    activos = {}  # (proceso, recurso) -> (ciclo de liberación, acción)
+    pendientes = []  # (proceso, recurso, acción, intentos)
+    ciclo_max = ciclos[-1]
+    limite = ciclo_max + CICLOS_EXTRA
+    k = 0
+
+    ciclo = ciclos[0]
+    while ciclo < limite:
+        liberar = [key for key, (fin, _) in activos.items() if ciclo >= fin]
+        for key in liberar:
+            p, r = key
+            available[r] += 1
+            log.append(ciclo, p, r, RELEASE, activos.pop(key)[1])
+
+        if k < len(ciclos) and ciclos[k] == ciclo:
+            k += 1
+            for p, r, _, a in por_ciclo[ciclo]:
+                pendientes.append((p, r, a, 0))
+                log.append(ciclo, p, r, REQUEST, a)
+
+        siguientes = []
+        for p, r, a, intentos in pendientes:
+            if available[r] > 0:
+                available[r] -= 1
+                activos[(p, r)] = (ciclo + 1, a)
+                log.append(ciclo, p, r, ACCESSED, a, intentos)
+            elif intentos >= MAX_INTENTOS:
+                log.append(ciclo, p, r, FAILED, a, intentos)
+            else:
+                siguientes.append((p, r, a, intentos + 1))
+                log.append(ciclo, p, r, WAITING, a, intentos + 1)
+        pendientes = siguientes
+
+        # Todo lo tomado se libera en el ciclo siguiente y los pendientes se
+        # reintentan en él; si no hay nada, saltar a la próxima acción
+        if pendientes or activos:
+            ciclo += 1
+        elif k < len(ciclos):
+            ciclo = ciclos[k]
+        else:
+            break
+
+    # Ciclos que habría recorrido la simulación ciclo a ciclo: hasta el
+    # primero vacío después de la última acción
+    log.cycles = min(max(ciclo + 1, ciclo_max + 2), limite)
+    _record('semaphore', log)
+    return log
+
+
+def _simulate_queues(processes, resources, actions, duration, writer, prefer_readers, scope) -> SyncLog:
+    """
+    Motor común de los modos con cola: recursos con unidades que se piden
+    con un peso (1, o la capacidad completa si `writer(acción)` es verdadero)
+    y se retienen 'duracion' ciclos.
+
+    Cada recurso tiene una cola FIFO de lectores y otra de escritores; el
+    orden de llegada entre ambas se conserva con un número de secuencia.
+    Sin `prefer_readers` se atiende estrictamente por llegada: un pedido que
+    no cabe bloquea a los que vienen detrás. Con `prefer_readers` los
+    lectores pasan mientras quede una unidad, aunque haya escritores
+    esperando. Las liberaciones se programan en un heap por ciclo de fin y
+    se procesan antes que los pedidos del mismo ciclo; solo se visitan los
+    ciclos con eventos, así que el costo es O(eventos · log eventos).
+    `scope` es el ámbito de los contadores de instrumentación.
+    """
+    if duration < 1:
+        raise ValueError("La duración debe ser un entero mayor que 0")
+    por_ciclo, ciclos, pids, names = _prepare(processes, resources, actions, duration)
+    log = SyncLog(pids, names)
+    if not ciclos:
+        return log
+
+    capacity = [resources[name] for name in names]
+    available = capacity[:]
+    # Por recurso: (lectores, escritores), cada una con
+    # (secuencia, proceso, acción, peso, duración, posición del WAITING)
+    colas = [(deque(), deque()) for _ in names]
+    liberaciones = []  # heap de (ciclo de fin, secuencia, proceso, recurso, acción, peso)
+    secuencia = 0
+
+    def otorgar(ciclo, p, r, a, peso, d):
+        nonlocal secuencia
+        available[r] -= peso
+        log.append(ciclo, p, r, ACCESSED, a, duration=d)
+        heapq.heappush(liberaciones, (ciclo + d, secuencia, p, r, a, peso))
+        secuencia += 1
+
+    def siguiente_en_cola(r):
+        """Cola cuyo primer pedido se atiende a continuación, o None."""
+        lectores, escritores = colas[r]
+        if prefer_readers and lectores and available[r] > 0:
+            return lectores
+        if lectores and escritores:
+            cola = lectores if lectores[0][0] < escritores[0][0] else escritores
+        else:
+            cola = lectores or escritores
+        if cola and cola[0][3] <= available[r]:
+            return cola
+        return None
+
+    k = 0
+    ciclo = ciclos[0]
+    while True:
+        # Liberaciones: las unidades pasan directo a los primeros de la cola
+        while liberaciones and liberaciones[0][0] <= ciclo:
+            _, _, p, r, a, peso = heapq.heappop(liberaciones)
+            log.append(ciclo, p, r, RELEASE, a)
+            available[r] += peso
+            cola = siguiente_en_cola(r)
+            while cola is not None:
+                _, q, b, w, d, espera = cola.popleft()
+                log.duration[espera] = ciclo - log.cycle[espera]
+                otorgar(ciclo, q, r, b, w, d)
+                cola = siguiente_en_cola(r)
+
+        if k < len(ciclos) and ciclos[k] == ciclo:
+            k += 1
+            for p, r, d, a in por_ciclo[ciclo]:
+                log.append(ciclo, p, r, REQUEST, a)
+                escribe = writer(actions[a])
+                peso = max(capacity[r], 1) if escribe else 1
+                lectores, escritores = colas[r]
+                if prefer_readers and not escribe:
+                    libre = not lectores
+                else:
+                    libre = not lectores and not escritores
+                if libre and peso <= available[r]:
+                    otorgar(ciclo, p, r, a, peso, d)
+                else:
+                    espera = log.append(ciclo, p, r, WAITING, a, duration=0)
+                    colas[r][escribe].append((secuencia, p, a, peso, d, espera))
+                    secuencia += 1
+
+        # Próximo evento: una liberación o un ciclo con acciones
+        siguiente = [liberaciones[0][0]] if liberaciones else []
+        if k < len(ciclos):
+            siguiente.append(ciclos[k])
+        if not siguiente:
+            break
+        ciclo = min(siguiente)
+
+    # Pedidos que nunca se atendieron (recursos sin unidades)
+    for r, (lectores, escritores) in enumerate(colas):
+        for _, p, a, _, _, espera in sorted([*lectores, *escritores]):
+            log.duration[espera] = ciclo - log.cycle[espera]
+            log.append(ciclo, p, r, FAILED, a)
+
+    log.cycles = ciclo + 1
+    _record(scope, log, queues=True)
+    return log
+
+
+def simulate_semaphore_queue(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+                             actions: List[Dict], duration: int = 1) -> SyncLog:
+    """
+    Semáforo con cola de espera FIFO por recurso, sin reintentos.
+
+    Cada acción pide una unidad del recurso en su ciclo y la retiene
+    'duracion' ciclos (`duration` si la acción no la trae). Si no hay
+    unidades disponibles el proceso entra a la cola del recurso (WAITING) y
+    la obtiene cuando otro la libera, en orden de llegada.
+
+    La duración de cada WAITING es el tiempo en cola. Los pedidos que nunca
+    se atienden (recursos sin unidades) se marcan FAILED al final.
+    """
+    return _simulate_queues(processes, resources, actions, duration,
+                            writer=lambda accion: False, prefer_readers=False,
+                            scope='semaphore_queue')
+
+
+def simulate_rwlock(processes: Union[List[Dict], ProcessTable], resources: Dict[str, int],
+                    actions: List[Dict], duration: int = 1, prefer_readers: bool = False) -> SyncLog:
+    """
+    Candado lector-escritor: la cantidad del recurso es el máximo de
+    lectores simultáneos. Un READ toma una unidad y puede compartir el
+    recurso con otros lectores; un WRITE toma todas las unidades, así que es
+    exclusivo. Cada acceso retiene el recurso 'duracion' ciclos.
+
+    Por defecto la cola es FIFO (un escritor esperando detiene a los
+    lectores que llegan después, sin inanición). Con `prefer_readers` los
+    lectores pasan mientras el recurso no esté tomado por un escritor, lo
+    que puede dejar a los escritores esperando indefinidamente.
+
+    Lanza ValueError si una acción no es READ ni WRITE.
+    """
+    for accion in actions:
+        if accion['accion'] not in (READ, WRITE):
+            raise ValueError(f"Acción desconocida: {accion['accion']} (se espera {READ} o {WRITE})")
+    return _simulate_queues(processes, resources, actions, duration,
+                            writer=lambda accion: accion['accion'] == WRITE,
+                            prefer_readers=prefer_readers, scope='rwlock')
@@ -0,0 +1,110 @@
+# algorithms/timeline.py
+
+from array import array
+from typing import Dict, Iterator, List
+
+from algorithms.process_table import INT_TYPECODE
+
+
+class Timeline:
+    """
+    Línea de tiempo compacta: tres arreglos paralelos de enteros con el
+    índice del proceso, el inicio y el fin de cada tramo.
+
+    `pids` es la columna de pids de la tabla de procesos, de modo que
+    `pids[pid_index[k]]` es el pid del tramo k. Iterar devuelve los tramos
+    como dicts {'pid', 'start', 'end'} de forma perezosa, uno a la vez.
+    """
+
+    __slots__ = ('pids', 'pid_index', 'start', 'end')
+
+    def __init__(self, pids):
+        self.pids = pids
+        self.pid_index = array(INT_TYPECODE)
+        self.start = array(INT_TYPECODE)
+        self.end = array(INT_TYPECODE)
+
+    def append(self, index: int, start: int, end: int) -> None:
+        self.pid_index.append(index)
+        self.start.append(start)
+        self.end.append(end)
+
+    def extend(self, index: int, start: int, end: int) -> None:
+        """Agrega un tramo, fusionándolo con el anterior si es contiguo y del mismo proceso."""
+        if self.pid_index and self.pid_index[-1] == index and self.end[-1] == start:
+            self.end[-1] = end
+        else:
+            self.append(index, start, end)
+
+    def __len__(self) -> int:
+        return len(self.pid_index)
+
+    def __getitem__(self, k: int) -> Dict:
+        return {
+            'pid': self.pids[self.pid_index[k]],
+            'start': self.start[k],
+            'end': self.end[k]
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        for k in range(len(self.pid_index)):
+            yield self[k]
+
+    def labels(self) -> List:
+        """Pid de cada tramo (referencias a los strings de la tabla, sin copiarlos)."""
+        pids = self.pids
+        return [pids[i] for i in self.pid_index]
+
+    def to_dicts(self) -> List[Dict]:
+        pids = self.pids
+        return [
+            {'pid': pids[i], 'start': s, 'end': e}
+            for i, s, e in zip(self.pid_index, self.start, self.end)
+        ]
+
+
+class CoreTimeline(Timeline):
+    """
+    Línea de tiempo de la simulación multinúcleo: como Timeline, con una
+    columna más con el núcleo de cada tramo. Los tramos de todos los núcleos
+    se intercalan en el orden en que terminan; `extend` fusiona con el
+    último tramo del mismo núcleo.
+    """
+
+    __slots__ = ('core', '_last')
+
+    def __init__(self, pids, cores: int):
+        super().__init__(pids)
+        self.core = array(INT_TYPECODE)
+        self._last = [-1] * cores
+
+    def append(self, index: int, start: int, end: int, core: int = 0) -> None:
+        self._last[core] = len(self.pid_index)
+        super().append(index, start, end)
+        self.core.append(core)
+
+    @property
+    def cores(self) -> int:
+        return len(self._last)
+
+    def extend(self, index: int, start: int, end: int, core: int = 0) -> None:
+        k = self._last[core]
+        if k >= 0 and self.pid_index[k] == index and self.end[k] == start:
+            self.end[k] = end
+        else:
+            self.append(index, start, end, core)
+
+    def __getitem__(self, k: int) -> Dict:
+        return {
+            'pid': self.pids[self.pid_index[k]],
+            'start': self.start[k],
+            'end': self.end[k],
+            'core': self.core[k]
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        pids = self.pids
+        return [
+            {'pid': pids[i], 'start': s, 'end': e, 'core': c}
+            for i, s, e, c in zip(self.pid_index, self.start, self.end, self.core)
+        ]
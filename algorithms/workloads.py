@@ -0,0 +1,122 @@
+# algorithms/workloads.py
+
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from algorithms.process_table import INT_TYPECODE, ProcessTable
+
+
+def _column(values: np.ndarray) -> array:
+    """Arreglo de NumPy -> columna array('q') sin pasar por objetos de Python."""
+    column = array(INT_TYPECODE)
+    column.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+    return column
+
+
+def _sample(rng, shape, arrival_rate, burst_shape, burst_scale, max_burst, priority_weights):
+    """(llegadas, bursts, prioridades) con forma `shape`; las llegadas se acumulan en el último eje."""
+    if arrival_rate <= 0 or burst_shape <= 0 or burst_scale <= 0 or max_burst < 1:
+        raise ValueError("Los parámetros de la distribución deben ser positivos")
+    arrivals = np.floor(np.cumsum(rng.exponential(1.0 / arrival_rate, shape), axis=-1))
+    bursts = np.minimum(1 + np.floor(rng.pareto(burst_shape, shape) * burst_scale), max_burst)
+    weights = np.asarray(priority_weights if priority_weights is not None else [1.0] * 5, dtype=float)
+    priorities = 1 + rng.choice(len(weights), size=shape, p=weights / weights.sum())
+    return arrivals.astype(np.int64), bursts.astype(np.int64), priorities.astype(np.int64)
+
+
+def generate_processes(n: int, arrival_rate: float = 1.0, burst_shape: float = 1.5,
+                       burst_scale: float = 4.0, max_burst: int = 1000,
+                       priority_weights: Optional[Sequence[float]] = None,
+                       seed: Optional[int] = None) -> ProcessTable:
+    """
+    Traza sintética de `n` procesos directamente en formato columnar.
+
+    - Llegadas de Poisson: tiempos entre llegadas exponenciales con media
+      1 / `arrival_rate` ciclos, acumulados y truncados a enteros.
+    - Bursts con cola pesada: 1 + Pareto (Lomax) de forma `burst_shape` y
+      escala `burst_scale`, truncados a `max_burst`. Con forma cerca de 1
+      unos pocos procesos concentran gran parte del trabajo.
+    - Prioridades 1..k con probabilidades proporcionales a
+      `priority_weights` (por defecto 5 niveles equiprobables).
+
+    Con la misma `seed` la traza es idéntica.
+    """
+    if n < 0:
+        raise ValueError("El número de procesos no puede ser negativo")
+    rng = np.random.default_rng(seed)
+    arrivals, bursts, priorities = _sample(rng, n, arrival_rate, burst_shape, burst_scale,
+                                           max_burst, priority_weights)
+
+    return ProcessTable(
+        [f"P{k}" for k in range(n)],
+        _column(bursts),
+        _column(arrivals),
+        _column(priorities)
+    )
+
+
+def generate_batch(traces: int, n: int, arrival_rate: float = 1.0, burst_shape: float = 1.5,
+                   burst_scale: float = 4.0, max_burst: int = 1000,
+                   priority_weights: Optional[Sequence[float]] = None,
+                   seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    `traces` trazas de `n` procesos con las mismas distribuciones que
+    generate_processes, como matrices (trazas × procesos) 'arrival_time',
+    'burst_time' y 'priority' para algorithms/batch.py.
+    """
+    if traces < 0 or n < 0:
+        raise ValueError("El número de trazas y de procesos no puede ser negativo")
+    rng = np.random.default_rng(seed)
+    arrivals, bursts, priorities = _sample(rng, (traces, n), arrival_rate, burst_shape, burst_scale,
+                                           max_burst, priority_weights)
+    return {'arrival_time': arrivals, 'burst_time': bursts, 'priority': priorities}
+
+
+def generate_resources(m: int, max_units: int = 2, seed: Optional[int] = None) -> Dict[str, int]:
+    """`m` recursos R0..R{m-1} con entre 1 y `max_units` unidades."""
+    rng = np.random.default_rng(seed)
+    units = rng.integers(1, max_units + 1, m)
+    return {f"R{r}": int(u) for r, u in enumerate(units)}
+
+
+def generate_actions(table: ProcessTable, resources: Dict[str, int], n: int,
+                     hot_skew: float = 1.2, write_fraction: float = 0.3,
+                     actions_per_cycle: float = 4.0, max_duration: int = 3,
+                     seed: Optional[int] = None) -> List[Dict]:
+    """
+    Traza de `n` acciones con mucha contención, con el mismo formato que
+    parse_actions.
+
+    Los recursos se eligen con una ley de Zipf de exponente `hot_skew` (los
+    primeros concentran casi todos los pedidos) y los ciclos son de Poisson
+    con `actions_per_cycle` acciones por ciclo en promedio, así que varias
+    acciones compiten por el mismo recurso en el mismo ciclo. Una fracción
+    `write_fraction` son WRITE y la duración es uniforme en 1..`max_duration`.
+    Las acciones salen ordenadas por ciclo.
+    """
+    if not len(table) or not resources:
+        raise ValueError("Se necesitan procesos y recursos para generar acciones")
+    rng = np.random.default_rng(seed)
+    names = list(resources)
+
+    ranks = np.arange(1, len(names) + 1, dtype=float) ** -hot_skew
+    recurso = rng.choice(len(names), size=n, p=ranks / ranks.sum())
+    pid = rng.integers(0, len(table), n)
+    ciclo = np.floor(np.cumsum(rng.exponential(1.0 / actions_per_cycle, n))).astype(np.int64)
+    escritura = rng.random(n) < write_fraction
+    duracion = rng.integers(1, max_duration + 1, n)
+
+    pids = table.pid
+    return [
+        {
+            "pid": pids[p],
+            "accion": "WRITE" if w else "READ",
+            "recurso": names[r],
+            "ciclo": c,
+            "duracion": d
+        }
+        for p, w, r, c, d in zip(pid.tolist(), escritura.tolist(), recurso.tolist(),
+                                 ciclo.tolist(), duracion.tolist())
+    ]
@@ -0,0 +1,222 @@
+# benchmarks/run.py
+"""
+Benchmarks de los planificadores y de las simulaciones de sincronización
+sobre trazas sintéticas (algorithms/workloads.py).
+
+Ejemplos:
+
+    python -m benchmarks.run                       # 10^3..10^5, compara con baseline.json
+    python -m benchmarks.run --full                # 10^3..10^7
+    python -m benchmarks.run -c srtf -c mutex --sizes 1000 100000
+    python -m benchmarks.run --save                # reemplaza la línea base
+
+Para cada caso y tamaño se mide el tiempo de pared (el mejor de --repeat
+corridas) y el pico de memoria asignada durante la simulación (tracemalloc,
+en una corrida aparte para no afectar el tiempo). La generación de la traza
+no se mide. Sale con código 1 si algún caso empeora respecto a la línea
+base más allá de las tolerancias.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from algorithms.batch import fifo_batch
+from algorithms.fifo import fifo_scheduler
+from algorithms.priority import priority_scheduler
+from algorithms.round_robin import round_robin_scheduler
+from algorithms.sjf import sjf_scheduler
+from algorithms.smp import smp_schedule
+from algorithms.srtf import srtf_scheduler
+from algorithms.sync import simulate_mutex, simulate_rwlock, simulate_semaphore, simulate_semaphore_queue
+from algorithms.workloads import generate_actions, generate_batch, generate_processes, generate_resources
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+FULL_SIZES = [10 ** k for k in range(3, 8)]
+QUANTUM = 4
+# Núcleos de los casos SMP
+SMP_CORES = 64
+# Procesos por traza en el caso por lotes (n = trazas × BATCH_WIDTH)
+BATCH_WIDTH = 100
+# Recursos de las trazas de sincronización (pocos, para que haya contención)
+NUM_RESOURCES = 8
+# Las acciones son una lista de dicts: a 10^7 no caben en memoria
+MAX_SYNC_ACTIONS = 10 ** 6
+# Diferencias de tiempo por debajo de esto se consideran ruido
+MIN_SECONDS = 0.005
+
+
+def _scheduling(run):
+    def setup(n, seed):
+        table = generate_processes(n, seed=seed)
+        table.arrival_order()
+        return (table,)
+    return setup, run, None
+
+
+def _sync(run):
+    def setup(n, seed):
+        table = generate_processes(max(n // 10, 1), seed=seed)
+        resources = generate_resources(NUM_RESOURCES, seed=seed)
+        return table, resources, generate_actions(table, resources, n, seed=seed)
+    return setup, run, MAX_SYNC_ACTIONS
+
+
+def _batch(n, seed):
+    batch = generate_batch(max(n // BATCH_WIDTH, 1), BATCH_WIDTH, seed=seed)
+    return batch['arrival_time'], batch['burst_time']
+
+
+# Nombre -> (preparación(n, seed) -> argumentos, función medida, tamaño máximo)
+CASES = {
+    "fifo": _scheduling(lambda t: fifo_scheduler(t, compact=True)),
+    "sjf": _scheduling(lambda t: sjf_scheduler(t, compact=True)),
+    "srtf": _scheduling(lambda t: srtf_scheduler(t, compact=True)),
+    "round_robin": _scheduling(lambda t: round_robin_scheduler(t, QUANTUM, compact=True)),
+    "priority": _scheduling(lambda t: priority_scheduler(t, compact=True)),
+    "smp_fifo": _scheduling(lambda t: smp_schedule(t, "FIFO", SMP_CORES, compact=True)),
+    "smp_round_robin": _scheduling(lambda t: smp_schedule(t, "Round Robin", SMP_CORES, QUANTUM, compact=True)),
+    "fifo_batch": (_batch, fifo_batch, None),
+    "mutex": _sync(simulate_mutex),
+    "semaphore": _sync(simulate_semaphore),
+    "semaphore_queue": _sync(simulate_semaphore_queue),
+    "rwlock": _sync(simulate_rwlock),
+    "rwlock_readers": _sync(lambda t, r, a: simulate_rwlock(t, r, a, prefer_readers=True)),
+}
+
+
+def measure(run, args, repeat, memory=True):
+    """(mejor tiempo en segundos, pico de memoria en bytes o None)."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run(*args)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run(*args)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(cases, sizes, repeat, seed, memory=True, stream=sys.stderr):
+    results = {}
+    for name in cases:
+        setup, run, max_size = CASES[name]
+        for n in sizes:
+            if max_size is not None and n > max_size:
+                print(f"  {name:<16} n={n:<9} omitido (máximo {max_size})", file=stream)
+                continue
+            args = setup(n, seed)
+            seconds, peak = measure(run, args, repeat, memory)
+            results[f"{name}@{n}"] = {"case": name, "n": n, "seconds": seconds, "peak_bytes": peak}
+            print(f"  {name:<16} n={n:<9} {seconds:9.4f} s"
+                  + (f" {peak / 2 ** 20:9.1f} MiB" if peak is not None else ""), file=stream)
+            del args
+    return results
+
+
+def compare(results, baseline, time_tolerance, memory_tolerance):
+    """Lista de mensajes, uno por caso que empeoró respecto a `baseline`."""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        limit = base["seconds"] * (1 + time_tolerance)
+        if current["seconds"] > limit and current["seconds"] - base["seconds"] > MIN_SECONDS:
+            regressions.append(
+                f"{key}: {current['seconds']:.4f} s (línea base {base['seconds']:.4f} s, "
+                f"+{current['seconds'] / base['seconds'] - 1:.0%})"
+            )
+        if current["peak_bytes"] is not None and base.get("peak_bytes"):
+            if current["peak_bytes"] > base["peak_bytes"] * (1 + memory_tolerance):
+                regressions.append(
+                    f"{key}: pico de memoria {current['peak_bytes'] / 2 ** 20:.2f} MiB "
+                    f"(línea base {base['peak_bytes'] / 2 ** 20:.2f} MiB)"
+                )
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Mide tiempo y memoria de los simuladores y compara con una línea base."
+    )
+    parser.add_argument("-c", "--case", action="append", choices=list(CASES),
+                        help="caso a medir; se puede repetir (por defecto: todos)")
+    parser.add_argument("--sizes", type=int, nargs="+", help="tamaños de traza (por defecto: 10^3 10^4 10^5)")
+    parser.add_argument("--full", action="store_true", help="tamaños 10^3 a 10^7")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="corridas por medición (por defecto: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de las trazas (por defecto: 0)")
+    parser.add_argument("--no-memory", action="store_true", help="no medir el pico de memoria")
+    parser.add_argument("--baseline", default=BASELINE, help="archivo de línea base (JSON)")
+    parser.add_argument("--save", action="store_true", help="guardar los resultados como línea base")
+    parser.add_argument("--time-tolerance", type=float, default=0.5,
+                        help="aumento de tiempo tolerado, como fracción (por defecto: 0.5)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.1,
+                        help="aumento de memoria tolerado, como fracción (por defecto: 0.1)")
+    parser.add_argument("-o", "--output", help="escribir los resultados en este archivo (JSON)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.repeat < 1:
+        print("--repeat debe ser un entero mayor que 0.", file=sys.stderr)
+        return 1
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    cases = args.case or list(CASES)
+
+    results = run_benchmarks(cases, sizes, args.repeat, args.seed, memory=not args.no_memory)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"Línea base guardada en {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No hay línea base en {args.baseline}; usa --save para crearla.", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("Regresiones respecto a la línea base:", file=sys.stderr)
+        for message in regressions:
+            print(f"- {message}", file=sys.stderr)
+        return 1
+    print("Sin regresiones respecto a la línea base.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+# components/gantt.py
+
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import plotly.colors
+import plotly.graph_objects as go
+import streamlit as st
+
+from components.lod import downsample
+
+# Máximo de barras que se envían al navegador por gráfico
+DEFAULT_MAX_BARS = 2000
+# Máximo de grupos con traza y entrada de leyenda propias; con más se usa una sola traza
+MAX_TRACES = 40
+
+
+class _Blocks:
+    """Bloques (grupo, fila, inicio, fin, texto) en arreglos preasignados que crecen al doble."""
+
+    def __init__(self, capacity: int):
+        self.size = 0
+        self.group = np.empty(capacity, dtype=np.int64)
+        self.row = np.empty(capacity, dtype=np.int64)
+        self.start = np.empty(capacity, dtype=np.int64)
+        self.end = np.empty(capacity, dtype=np.int64)
+        self.text = np.empty(capacity, dtype=object)
+
+    def _reserve(self, n: int) -> None:
+        if self.size + n <= len(self.start):
+            return
+        capacity = max(2 * len(self.start), self.size + n)
+        for name in ("group", "row", "start", "end", "text"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def append(self, group, row, start, end, text) -> None:
+        self._reserve(1)
+        k = self.size
+        self.group[k] = group
+        self.row[k] = row
+        self.start[k] = start
+        self.end[k] = end
+        self.text[k] = text
+        self.size += 1
+
+    def extend(self, group, row, start, end, text) -> None:
+        n = len(start)
+        self._reserve(n)
+        k = self.size
+        self.group[k:k + n] = group
+        self.row[k:k + n] = row
+        self.start[k:k + n] = start
+        self.end[k:k + n] = end
+        self.text[k:k + n] = text
+        self.size += n
+
+    def column(self, name: str) -> np.ndarray:
+        return getattr(self, name)[:self.size]
+
+
+class GanttRenderer:
+    """
+    Diagrama de Gantt incremental para las animaciones de las páginas.
+
+    Los bloques se guardan en arreglos preasignados con el código de su
+    grupo (proceso, núcleo o estado) y su fila. Con pocos grupos la figura
+    tiene una traza por grupo, que se reutiliza entre cuadros: `render`
+    solo actualiza las trazas de los grupos que cambiaron desde el cuadro
+    anterior y, con `min_interval`, limita la frecuencia con la que se envía
+    la figura al placeholder. `extend` agrega muchos bloques de una vez a
+    partir de columnas de enteros, sin un objeto de Python por bloque.
+
+    Con `max_bars`, si la ventana visible tiene más tramos que ese límite se
+    dibuja una versión agregada por intervalos y bloques de filas (ver
+    components/lod.py). Las vistas con ventana o agregadas, y las que tienen
+    más de MAX_TRACES grupos, usan una sola traza con un color por barra.
+    """
+
+    def __init__(self, placeholder, title: str = "", color_map: Optional[Dict[str, str]] = None,
+                 group_label: str = "Proceso", text_label: str = "Duración",
+                 min_interval: float = 0.0, key: Optional[str] = None, capacity: int = 256,
+                 max_bars: Optional[int] = None):
+        self.placeholder = placeholder
+        self.title = title
+        self.color_map = color_map or {}
+        self.group_label = group_label
+        self.text_label = text_label
+        self.min_interval = min_interval
+        self.key = key
+        self.max_bars = max_bars
+
+        self.blocks = _Blocks(capacity)
+        # Grupos en el orden en que aparecen, con su color
+        self.groups = []
+        self.group_index = {}
+        self.colors = []
+        self.traces: Dict[int, int] = {}
+        self.dirty = set()
+        self.frame = 0
+        self.last_render = 0.0
+        self.palette = plotly.colors.qualitative.Plotly
+
+        # Procesos (filas) en el orden en que aparecen
+        self.categories = []
+        self.row_index = {}
+        self._labels = None
+        self.fig = self._new_figure()
+        self.detailed = True
+
+    def _new_figure(self) -> go.Figure:
+        fig = go.Figure()
+        fig.update_layout(
+            title=self.title,
+            xaxis_title="Ciclo",
+            yaxis_title="Proceso",
+            barmode="overlay",
+            legend=dict(title=self.group_label)
+        )
+        fig.update_yaxes(categoryorder="array", categoryarray=[], autorange="reversed")
+        return fig
+
+    def __len__(self) -> int:
+        return self.blocks.size
+
+    def _group_code(self, group) -> int:
+        code = self.group_index.get(group)
+        if code is None:
+            code = self.group_index[group] = len(self.groups)
+            self.groups.append(group)
+            self.colors.append(self.color_map.get(group, self.palette[code % len(self.palette)]))
+        return code
+
+    def _row_code(self, y) -> int:
+        row = self.row_index.get(y)
+        if row is None:
+            row = self.row_index[y] = len(self.categories)
+            self.categories.append(y)
+            self._labels = None
+        return row
+
+    def append(self, group, y, start: int, end: int, text=None) -> None:
+        """Agrega un bloque [start, end) en la fila `y`, coloreado según `group`."""
+        code = self._group_code(group)
+        self.blocks.append(code, self._row_code(y), start, end, end - start if text is None else text)
+        self.dirty.add(code)
+
+    @staticmethod
+    def _translate(codes: np.ndarray, names, register) -> np.ndarray:
+        """Códigos externos -> códigos propios, registrando los nombres nuevos en orden de aparición."""
+        used, first = np.unique(codes, return_index=True)
+        lookup = np.zeros(int(used[-1]) + 1, dtype=np.int64)
+        for code in used[np.argsort(first, kind="stable")].tolist():
+            lookup[code] = register(names[code])
+        return lookup[codes]
+
+    def extend(self, group_codes, group_names, row_codes, row_names, start, end, text=None) -> None:
+        """
+        Agrega muchos bloques de una vez. `group_codes` y `row_codes` son
+        arreglos de enteros que indexan `group_names` y `row_names` (p. ej.
+        el pid_index de un Timeline y sus pids); `start`, `end` y `text`
+        (opcional, por defecto la duración) son arreglos paralelos.
+        """
+        start = np.asarray(start, dtype=np.int64)
+        end = np.asarray(end, dtype=np.int64)
+        if not start.size:
+            return
+        groups = self._translate(np.asarray(group_codes, dtype=np.int64), group_names, self._group_code)
+        rows = self._translate(np.asarray(row_codes, dtype=np.int64), row_names, self._row_code)
+        self.blocks.extend(groups, rows, start, end, end - start if text is None else text)
+        self.dirty.update(np.unique(groups).tolist())
+
+    def span(self) -> Tuple[int, int]:
+        """Primer inicio y último fin entre todos los bloques."""
+        if not self.blocks.size:
+            return 0, 0
+        return int(self.blocks.column("start").min()), int(self.blocks.column("end").max())
+
+    def _bar(self, row, start, end, text) -> dict:
+        if self._labels is None:
+            self._labels = np.array(self.categories, dtype=object)
+        return dict(
+            x=end - start,
+            y=self._labels[row],
+            base=start,
+            text=text,
+            customdata=end
+        )
+
+    def _add_trace(self, fig, code, data) -> None:
+        group = self.groups[code]
+        fig.add_trace(go.Bar(
+            name=str(group),
+            orientation="h",
+            marker=dict(color=self.colors[code]),
+            textposition="inside",
+            hovertemplate=(
+                f"<b>%{{y}}</b><br>{self.group_label}: {group}<br>"
+                f"{self.text_label}: %{{text}}<br>"
+                "Ciclo: %{base}-%{customdata}<extra></extra>"
+            ),
+            **data
+        ))
+
+    def _update_traces(self) -> None:
+        if not self.detailed:
+            # Venimos de una vista agregada: se reconstruyen todas las trazas
+            self.fig = self._new_figure()
+            self.traces.clear()
+            self.dirty = set(range(len(self.groups)))
+            self.detailed = True
+        blocks = self.blocks
+        group = blocks.column("group")
+        for code in self.dirty:
+            mask = group == code
+            data = self._bar(blocks.column("row")[mask], blocks.column("start")[mask],
+                             blocks.column("end")[mask], blocks.column("text")[mask])
+            if code in self.traces:
+                self.fig.data[self.traces[code]].update(data)
+            else:
+                self.traces[code] = len(self.fig.data)
+                self._add_trace(self.fig, code, data)
+        self.dirty.clear()
+
+    def _row_labels(self, first: np.ndarray, last: np.ndarray) -> Tuple[np.ndarray, list]:
+        """Etiqueta de cada barra y orden del eje: el proceso o 'primero … último' si agrupa filas."""
+        if self._labels is None:
+            self._labels = np.array(self.categories, dtype=object)
+        if np.array_equal(first, last):
+            return self._labels[first], list(self.categories)
+        pairs, inverse = np.unique(first * len(self.categories) + last, return_inverse=True)
+        names = [
+            self.categories[f] if f == l else f"{self.categories[f]} … {self.categories[l]}"
+            for f, l in zip((pairs // len(self.categories)).tolist(), (pairs % len(self.categories)).tolist())
+        ]
+        return np.array(names, dtype=object)[inverse.reshape(-1)], names
+
+    def _single_trace_figure(self, code, first, last, start, end, text, text_label) -> go.Figure:
+        """Figura con una sola traza coloreada por barra; la leyenda, con trazas vacías por grupo."""
+        names = np.array([str(g) for g in self.groups], dtype=object)
+        colors = np.array(self.colors, dtype=object)
+        y, categories = self._row_labels(first, last)
+        fig = self._new_figure()
+        fig.add_trace(go.Bar(
+            orientation="h",
+            x=end - start,
+            y=y,
+            base=start,
+            text=text,
+            customdata=np.column_stack((end, names[code])),
+            marker=dict(color=colors[code]),
+            textposition="inside",
+            showlegend=False,
+            hovertemplate=(
+                f"<b>%{{y}}</b><br>{self.group_label}: %{{customdata[1]}}<br>"
+                f"{text_label}: %{{text}}<br>"
+                "Ciclo: %{base}-%{customdata[0]}<extra></extra>"
+            )
+        ))
+        present = np.unique(code)
+        if present.size <= MAX_TRACES:
+            for k in present.tolist():
+                fig.add_trace(go.Bar(name=names[k], x=[None], y=[None], orientation="h",
+                                     marker=dict(color=colors[k])))
+        fig.update_yaxes(categoryarray=categories)
+        return fig
+
+    def _downsampled_figure(self, window) -> Optional[go.Figure]:
+        """Figura con nivel de detalle acotado, o None si cabe en detalle exacto."""
+        blocks = self.blocks
+        lod = downsample(blocks.column("row"), blocks.column("group"), blocks.column("start"),
+                         blocks.column("end"), len(self.groups), self.max_bars, window)
+        if lod['exact'] and window is None:
+            return None
+
+        if lod['exact']:
+            text, text_label = blocks.column("text")[lod['index']], self.text_label
+        else:
+            text = np.array([f"{o:.0%}" for o in lod['occupancy']], dtype=object)
+            text_label = "Ocupación"
+        fig = self._single_trace_figure(lod['group'], lod['row'], lod['row_last'],
+                                        lod['start'], lod['end'], text, text_label)
+        if window is not None:
+            fig.update_xaxes(range=list(window))
+        return fig
+
+    def render(self, title: Optional[str] = None, force: bool = True,
+               window: Optional[Tuple[int, int]] = None, placeholder=None) -> None:
+        """
+        Envía la figura al placeholder. Con force=False se omite el cuadro si
+        no pasó `min_interval` desde el anterior. `window` = (t0, t1) limita la
+        vista a esos ciclos (con detalle exacto si caben en `max_bars`).
+        """
+        now = time.monotonic()
+        if not force and now - self.last_render < self.min_interval:
+            return
+        if title is not None:
+            self.title = title
+
+        fig = None
+        if self.max_bars and (window is not None or len(self) > self.max_bars):
+            fig = self._downsampled_figure(window)
+            if fig is not None:
+                self.detailed = False
+        if fig is None and len(self.groups) > MAX_TRACES:
+            # Muchos grupos (p. ej. uno por proceso): una traza en lugar de una por grupo
+            blocks = self.blocks
+            row = blocks.column("row")
+            fig = self._single_trace_figure(blocks.column("group"), row, row, blocks.column("start"),
+                                            blocks.column("end"), blocks.column("text"), self.text_label)
+            self.detailed = False
+        if fig is None:
+            self._update_traces()
+            self.fig.update_yaxes(categoryarray=list(self.categories))
+            fig = self.fig
+        fig.update_layout(title=self.title)
+
+        self.frame += 1
+        key = f"{self.key}-{self.frame}" if self.key else None
+        (placeholder or self.placeholder).plotly_chart(fig, use_container_width=True, key=key)
+        self.last_render = now
+
+
+@st.fragment
+def gantt_zoom(renderer: GanttRenderer, label: str = "🔍 Ventana de ciclos") -> None:
+    """
+    Control de zoom sobre un Gantt ya simulado: al mover el rango solo se
+    vuelve a ejecutar este fragmento, con detalle exacto al acercarse.
+    """
+    t0, t1 = renderer.span()
+    if t1 - t0 < 2:
+        return
+    key = f"{renderer.key}-zoom" if renderer.key else None
+    window = st.slider(label, min_value=t0, max_value=t1, value=(t0, t1), key=key)
+    # Con el rango completo el gráfico de la página ya muestra la vista agregada
+    if window[1] > window[0] and window != (t0, t1):
+        renderer.render(window=window, placeholder=st.empty())
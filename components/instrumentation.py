@@ -0,0 +1,39 @@
+# components/instrumentation.py
+
+import json
+from contextlib import nullcontext
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+from algorithms.instrumentation import Instrumentation, instrumented
+
+
+def activar(inst: Optional[Instrumentation]):
+    """Activa `inst` dentro del bloque; sin instrumentación (None) no hace nada."""
+    return instrumented(inst) if inst is not None else nullcontext()
+
+
+def mostrar_instrumentacion(inst: Optional[Instrumentation]) -> None:
+    """Tiempos por fase, contadores por motor y el reporte completo en JSON."""
+    if inst is None:
+        return
+    reporte = inst.report()
+    with st.expander("🔬 Instrumentación", expanded=True):
+        st.caption(f"Tiempo total de la ejecución de la página: {reporte['wall_time_s'] * 1000:.1f} ms")
+        if reporte["phases"]:
+            df_fases = pd.DataFrame(reporte["phases"])
+            for columna in ("total_s", "mean_s", "max_s"):
+                df_fases[columna] = (df_fases[columna] * 1000).round(3)
+            df_fases.columns = ["Fase", "Llamadas", "Total (ms)", "Promedio (ms)", "Máximo (ms)"]
+            st.dataframe(df_fases, use_container_width=True)
+        if reporte["counters"]:
+            # Una fila por contador y una columna por motor
+            st.dataframe(pd.DataFrame(reporte["counters"]).fillna(0).astype(int), use_container_width=True)
+        st.download_button(
+            "💾 Descargar reporte (JSON)",
+            json.dumps(reporte, ensure_ascii=False, indent=2),
+            file_name="instrumentacion.json",
+            mime="application/json"
+        )
@@ -0,0 +1,99 @@
+# components/lod.py
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Intervalos de tiempo mínimos por fila de la vista agregada: con más filas
+# que max_bars // MIN_TIME_BINS, las filas consecutivas también se agrupan
+MIN_TIME_BINS = 20
+
+
+def downsample(row: np.ndarray, group: np.ndarray, start: np.ndarray, end: np.ndarray,
+               n_groups: int, max_bars: int, window: Optional[Tuple[int, int]] = None) -> Dict:
+    """
+    Nivel de detalle para líneas de tiempo largas.
+
+    Recibe los tramos como arreglos paralelos (fila, grupo, inicio, fin) y la
+    ventana visible [t0, t1). Si en la ventana hay a lo sumo `max_bars`
+    tramos se devuelven tal cual, recortados a la ventana ('exact': True).
+
+    Si no, la ventana se divide en intervalos de igual ancho y las filas
+    visibles en bloques de filas consecutivas (una fila por bloque mientras
+    quepan MIN_TIME_BINS intervalos por fila). Cada bloque queda con una
+    barra por intervalo ocupado: su grupo es el que más tiempo ocupa la
+    celda y 'occupancy' es la fracción ocupada (respecto del ancho del
+    intervalo por el número de filas del bloque). 'row' y 'row_last' son la
+    primera y la última fila de cada barra. El número de barras queda
+    acotado por bloques × intervalos <= max_bars, sin importar el largo de
+    la línea de tiempo ni el número de filas.
+    """
+    if window is None:
+        t0 = int(start.min()) if start.size else 0
+        t1 = int(end.max()) if end.size else 0
+    else:
+        t0, t1 = window
+
+    sel = np.flatnonzero((end > t0) & (start < t1) & (end > start))
+    if sel.size <= max_bars:
+        return {
+            'exact': True,
+            'index': sel,
+            'row': row[sel],
+            'row_last': row[sel],
+            'group': group[sel],
+            'start': np.maximum(start[sel], t0),
+            'end': np.minimum(end[sel], t1),
+            'occupancy': None
+        }
+
+    groups = group[sel]
+    row_ids, rank = np.unique(row[sel], return_inverse=True)
+    n_rows = row_ids.size
+    row_bins = min(n_rows, max(1, max_bars // MIN_TIME_BINS))
+    width = max(1, -(-(t1 - t0) // max(1, max_bars // row_bins)))
+    bins = -(-(t1 - t0) // width)
+
+    # Bloque de cada fila visible (filas consecutivas en el orden de las filas)
+    block_of_row = np.arange(n_rows) * row_bins // n_rows
+    rows = block_of_row[rank]
+    rows_per_block = np.bincount(block_of_row, minlength=row_bins)
+    last_of_block = np.cumsum(rows_per_block) - 1
+    first_of_block = last_of_block - rows_per_block + 1
+
+    # Partir cada tramo en pedazos, uno por intervalo que toca
+    s = np.maximum(start[sel], t0) - t0
+    e = np.minimum(end[sel], t1) - t0
+    b0 = s // width
+    count = (e - 1) // width - b0 + 1
+    piece = np.repeat(np.arange(sel.size), count)
+    offset = np.cumsum(count) - count
+    b = b0[piece] + (np.arange(piece.size) - offset[piece])
+    overlap = np.minimum(e[piece], (b + 1) * width) - np.maximum(s[piece], b * width)
+
+    # Tiempo ocupado por (fila, intervalo, grupo)
+    key = (rows[piece] * bins + b) * n_groups + groups[piece]
+    keys, inverse = np.unique(key, return_inverse=True)
+    busy = np.bincount(inverse, weights=overlap)
+    cell = keys // n_groups
+
+    # Grupo dominante y ocupación total de cada celda (fila, intervalo)
+    order = np.lexsort((-busy, cell))
+    first = np.r_[True, cell[order][1:] != cell[order][:-1]]
+    dominant = order[first]
+    cells, cell_inverse = np.unique(cell, return_inverse=True)
+    occupied = np.bincount(cell_inverse, weights=busy)
+
+    block = cells // bins
+    bin_start = t0 + (cells % bins) * width
+    bin_end = np.minimum(bin_start + width, t1)
+    return {
+        'exact': False,
+        'index': None,
+        'row': row_ids[first_of_block[block]],
+        'row_last': row_ids[last_of_block[block]],
+        'group': keys[dominant] % n_groups,
+        'start': bin_start,
+        'end': bin_end,
+        'occupancy': np.minimum(occupied / ((bin_end - bin_start) * rows_per_block[block]), 1.0)
+    }
@@ -1,54 +1,79 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import io
 import time
-from algorithms import fifo, sjf, srtf, round_robin, priority
+from algorithms.cache import ResultCache, result_key, table_digest
+from algorithms.instrumentation import Instrumentation, phase, timed_iter
+from algorithms.process_table import ProcessTable
+from algorithms.compare import run_comparison
+from algorithms.registry import expand_jobs
+from algorithms.metrics import as_int_array, compute_metrics
+from algorithms.smp import smp_schedule
+from algorithms.sweep import best_quantum, round_robin_sweep
+from algorithms.parsers import parse_processes
+from components.gantt import DEFAULT_MAX_BARS, GanttRenderer, gantt_zoom
+from components.instrumentation import activar, mostrar_instrumentacion
+
+# Máximo de errores de validación que se muestran por archivo
+MAX_ERRORES = 50
+# Resultados de simulación que se conservan entre reruns (y memoria que ocupan)
+MAX_RESULTADOS = 64
+MAX_BYTES_RESULTADOS = 256 * 2 ** 20
+
+
+@st.cache_resource
+def cache_de_resultados():
+    """Caché de resultados del servidor, compartida entre reruns y sesiones."""
+    return ResultCache(max_entries=MAX_RESULTADOS, max_bytes=MAX_BYTES_RESULTADOS)
+
+
+@st.cache_resource(max_entries=8)
+def cargar_procesos(contenido: bytes):
+    """Tabla y errores de un archivo; Streamlit no lo vuelve a leer en cada rerun."""
+    return parse_processes(io.BytesIO(contenido), max_errors=MAX_ERRORES)
+
+
+def simular_smp(tabla, jobs, nucleos, robo, afinidad, cache=None):
+    """Como run_comparison, con la simulación multinúcleo (en este proceso y con `cache` si se pasa)."""
+    digest = table_digest(tabla) if cache is not None else None
+    for algo, quantum in jobs:
+        if cache is None:
+            yield (algo, quantum), smp_schedule(tabla, algo, nucleos, quantum, robo, afinidad, compact=True)
+            continue
+        key = result_key(digest, algo, quantum, cores=nucleos, stealing=robo, affinity=afinidad)
+        resultado = cache.get(key, pids=tabla.pid)
+        if resultado is None:
+            resultado = smp_schedule(tabla, algo, nucleos, quantum, robo, afinidad, compact=True)
+            cache.put(key, resultado)
+        yield (algo, quantum), resultado
 
 
 st.set_page_config(page_title="Simulador de Calendarización", layout="wide")
 st.title("📅 Simulación de Algoritmos de Calendarización")
 
+instrumentar = st.sidebar.checkbox(
+    "🔬 Instrumentación", value=False,
+    help="Mide el tiempo de cada fase y cuenta las operaciones de los planificadores. "
+         "Las simulaciones corren en este proceso y sin caché"
+)
+inst = Instrumentation() if instrumentar else None
+
 uploaded_file = st.file_uploader("📂 Cargar archivo de procesos (.txt)", type="txt")
 
 if uploaded_file:
-    content = uploaded_file.read().decode("utf-8").splitlines()
-    procesos = []
-    errores = []
-    for i, line in enumerate(content, 1):
-        # Limpiar la línea de espacios y saltos
-        line = line.strip()
-        if not line:
-            continue  # Ignorar líneas vacías
-        # Separar por comas
-        partes = [p.strip() for p in line.split(",")]
-        # Validar formato: debe tener 4 partes
-        if len(partes) != 4:
-            errores.append(f"Línea {i}: formato inválido (se esperan 4 valores separados por coma)")
-            continue
-        pid, bt, at, pr = partes
-        # Validar que burst time, arrival time y priority sean enteros
-        try:
-            bt = int(bt)
-            at = int(at)
-            pr = int(pr)
-        except ValueError:
-            errores.append(f"Línea {i}: burst time, arrival time y prioridad deben ser números enteros")
-            continue
-        procesos.append({
-            "pid": pid,
-            "burst_time": bt,
-            "arrival_time": at,
-            "priority": pr
-        })
+    # Lectura incremental directa a la tabla columnar (la tabla no se modifica)
+    with activar(inst), phase("parse"):
+        tabla, errores = cargar_procesos(uploaded_file.getvalue())
 
     if errores:
         st.error("Se detectaron errores en el archivo:")
-        procesos=[]
+        tabla = ProcessTable()
         for err in errores:
             st.write(f"- {err}")
 
-    if procesos:
-        df = pd.DataFrame(procesos)
+    if len(tabla):
+        df = pd.DataFrame(tabla.columns())
         st.subheader("📋 Procesos cargados")
         st.dataframe(df)
 
@@ -62,77 +87,135 @@ if uploaded_file:
         if "Round Robin" in algos:
             quantum = st.number_input("⏱ Quantum para Round Robin:", min_value=1, step=1, value=2)
 
+        nucleos = int(st.number_input("🖥️ Núcleos (SMP)", min_value=1, step=1, value=1))
+        robo, afinidad = True, True
+        if nucleos > 1:
+            col_robo, col_afinidad = st.columns(2)
+            robo = col_robo.checkbox("🤝 Robo de trabajo", value=True,
+                                     help="Un núcleo sin trabajo toma procesos de la cola más larga")
+            afinidad = col_afinidad.checkbox("📌 Afinidad", value=True,
+                                             help="Al agotar el quantum el proceso vuelve a su núcleo")
+
         simulate_step_by_step = st.checkbox("🌀 Simulación paso a paso", value=True)
 
         if st.button("🚀 Ejecutar simulación"):
-            st.subheader("📊 Resultados de simulación")
-            tabs = st.tabs(algos)
-
-            for i, algo in enumerate(algos):
-                with tabs[i]:
-                    st.markdown(f"### Algoritmo: `{algo}`")
-
-                    if algo == "FIFO":
-                        resultado = fifo.fifo_scheduler(procesos)
-                    elif algo == "SJF":
-                        resultado = sjf.sjf_scheduler(procesos)
-                    elif algo == "SRTF":
-                        resultado = srtf.srtf_scheduler(procesos)
-                    elif algo == "Round Robin":
-                        resultado = round_robin.round_robin_scheduler(procesos, quantum)
-                    elif algo == "Priority":
-                        resultado = priority.priority_scheduler(procesos)
-                    else:
-                        st.error("Algoritmo no implementado.")
-                        continue
-
-                    st.markdown("#### 🕒 Diagrama de Gantt (simulación animada)")
+            with activar(inst):
+                st.subheader("📊 Resultados de simulación")
+                tabs = st.tabs(algos)
+                jobs = expand_jobs(algos, [quantum] if quantum else [])
+
+                # Los algoritmos corren en paralelo; cada pestaña se llena cuando termina el suyo
+                # (los ya calculados para esta traza salen de la caché). Con instrumentación
+                # corren en este proceso y sin caché, para que se cuenten sus operaciones
+                cache = cache_de_resultados() if inst is None else None
+                if nucleos > 1:
+                    resultados = simular_smp(tabla, jobs, nucleos, robo, afinidad, cache)
+                else:
+                    resultados = run_comparison(tabla, jobs, max_workers=None if inst is None else 1,
+                                                cache=cache)
+                for (algo, _), resultado in timed_iter("schedule", resultados):
+                    i = algos.index(algo)
                     gantt = resultado["timeline"]
-                    gantt_placeholder = st.empty()
-
-                    df_gantt = pd.DataFrame(columns=["Proceso", "Inicio", "Fin", "Duración", "Base"])
-
-                    for bloque in gantt:
-                        new_row = {
-                            "Proceso": bloque["pid"],
-                            "Inicio": bloque["start"],
-                            "Fin": bloque["end"],
-                            "Duración": bloque["end"] - bloque["start"],
-                            "Base": bloque["start"]
-                        }
-                        df_gantt = pd.concat([df_gantt, pd.DataFrame([new_row])], ignore_index=True)
-
-                        # Asignamos un key único por algoritmo y ciclo
-                        fig_key = f"{algo}-{i}-{bloque['pid']}-{bloque['start']}"
-                        
-                        fig = px.bar(
-                            df_gantt,
-                            y="Proceso",
-                            x="Duración",
-                            color="Proceso",
-                            orientation="h",
-                            text="Duración",
-                            base="Base",
-                            hover_data=["Inicio", "Fin"]
-                        )
-                        fig.update_layout(
-                            title="Diagrama de Gantt (basado en ciclos)",
-                            xaxis_title="Ciclo",
-                            yaxis_title="Proceso",
-                            barmode="stack"
-                        )
+                    with phase("metrics"):
+                        metricas = compute_metrics(tabla, gantt)
 
-                        gantt_placeholder.plotly_chart(fig, use_container_width=True, key=fig_key)
+                    with tabs[i], phase("render"):
+                        st.markdown(f"### Algoritmo: `{algo}`")
 
-                        if simulate_step_by_step:
-                            time.sleep(0.3 * new_row["Duración"])
+                        st.markdown("#### 🕒 Diagrama de Gantt (simulación animada)")
+                        gantt_placeholder = st.empty()
 
-                    st.markdown("#### 📈 Métricas de eficiencia")
-                    st.metric("Tiempo promedio de espera", f"{resultado['avg_waiting_time']:.2f} ciclos")
-                    total_time = max(b['end'] for b in gantt)
-                    st.metric("Tiempo total de ejecución", f"{total_time} ciclos")
+                        gantt_chart = GanttRenderer(
+                            gantt_placeholder,
+                            title="Diagrama de Gantt (basado en ciclos)",
+                            # Sin pausas entre bloques no hace falta dibujar cada uno
+                            min_interval=0.0 if simulate_step_by_step else 0.25,
+                            key=f"{algo}-{i}",
+                            max_bars=DEFAULT_MAX_BARS,
+                            # En SMP el color indica el núcleo
+                            group_label="Núcleo" if nucleos > 1 else "Proceso"
+                        )
+                        # Líneas de tiempo largas: sin animación, vista agregada con zoom
+                        animar = len(gantt) <= DEFAULT_MAX_BARS
+
+                        if animar:
+                            for bloque in gantt:
+                                grupo = f"Núcleo {bloque['core']}" if nucleos > 1 else bloque["pid"]
+                                gantt_chart.append(grupo, bloque["pid"], bloque["start"], bloque["end"])
+                                gantt_chart.render(force=simulate_step_by_step)
+
+                                if simulate_step_by_step:
+                                    time.sleep(0.3 * (bloque["end"] - bloque["start"]))
+                        else:
+                            # Sin animación las columnas del Timeline van directo al renderer
+                            if nucleos > 1:
+                                grupos = as_int_array(gantt.core)
+                                nombres = [f"Núcleo {k}" for k in range(nucleos)]
+                            else:
+                                grupos, nombres = as_int_array(gantt.pid_index), gantt.pids
+                            gantt_chart.extend(grupos, nombres, as_int_array(gantt.pid_index), gantt.pids,
+                                               as_int_array(gantt.start), as_int_array(gantt.end))
+
+                        if not (animar and simulate_step_by_step):
+                            gantt_chart.render()
+                        if not animar:
+                            gantt_zoom(gantt_chart)
+
+                        st.markdown("#### 📈 Métricas de eficiencia")
+                        col1, col2, col3 = st.columns(3)
+                        col1.metric("Tiempo promedio de espera", f"{resultado['avg_waiting_time']:.2f} ciclos")
+                        col1.metric("Tiempo total de ejecución", f"{metricas['total_time']} ciclos")
+                        col2.metric("Turnaround promedio", f"{metricas['avg_turnaround_time']:.2f} ciclos")
+                        col2.metric("Respuesta promedio", f"{metricas['avg_response_time']:.2f} ciclos")
+                        col3.metric("Utilización de CPU", f"{metricas['cpu_utilization'] * 100:.1f} %")
+                        col3.metric("Throughput", f"{metricas['throughput']:.3f} procesos/ciclo")
+                        st.metric("Cambios de contexto", metricas['context_switches'])
+                        if nucleos > 1:
+                            col1, col2 = st.columns(2)
+                            col1.metric("Migraciones", resultado['migrations'])
+                            col2.metric("Robos de trabajo", resultado['steals'])
+                            st.markdown("##### Utilización por núcleo")
+                            st.bar_chart(pd.DataFrame(
+                                {"Utilización": resultado['core_utilization']},
+                                index=[f"Núcleo {k}" for k in range(nucleos)]
+                            ))
+
+                        st.markdown("##### Percentiles (ciclos)")
+                        st.dataframe(pd.DataFrame(metricas['percentiles']).T, use_container_width=True)
+
+                        st.markdown("##### Métricas por proceso")
+                        st.dataframe(pd.DataFrame(metricas['per_process']), use_container_width=True)
+
+        with st.expander("🔎 Barrido de quantum (Round Robin)"):
+            col_min, col_max = st.columns(2)
+            q_min = col_min.number_input("Quantum mínimo", min_value=1, step=1, value=1)
+            q_max = col_max.number_input("Quantum máximo", min_value=1, step=1, value=20)
+
+            if st.button("📐 Evaluar quanta"):
+                if q_max < q_min:
+                    st.error("El quantum máximo debe ser mayor o igual al mínimo.")
+                else:
+                    with activar(inst), phase("schedule"):
+                        filas = round_robin_sweep(tabla, range(q_min, q_max + 1))
+                    df_barrido = pd.DataFrame(filas)
+                    mejor = best_quantum(filas)
+                    st.success(
+                        f"Mejor quantum: {mejor['quantum']} "
+                        f"(espera promedio {mejor['avg_waiting_time']:.2f} ciclos)"
+                    )
+                    fig_barrido = px.line(
+                        df_barrido,
+                        x="quantum",
+                        y=["avg_waiting_time", "avg_turnaround_time"],
+                        markers=True
+                    )
+                    fig_barrido.update_layout(xaxis_title="Quantum", yaxis_title="Ciclos")
+                    st.plotly_chart(fig_barrido, use_container_width=True)
+                    st.dataframe(df_barrido, use_container_width=True)
     else:
         st.warning("No se cargaron procesos válidos.")
 
 else:
     st.warning("Por favor, carga un archivo de procesos válido para comenzar.")
+
+mostrar_instrumentacion(inst)
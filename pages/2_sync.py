@@ -1,101 +1,189 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 import time
+from algorithms.parsers import (
+    MENSAJES_PROCESOS_SYNC, parse_actions, parse_processes, parse_resources
+)
+from algorithms.cosim import contention_report, cosimulate
+from algorithms.instrumentation import Instrumentation, phase
+from algorithms.metrics import as_int_array, compute_sync_metrics
+from algorithms.registry import SCHEDULERS
+from algorithms.sync import (
+    EVENTS, simulate_mutex, simulate_rwlock, simulate_semaphore, simulate_semaphore_queue
+)
+from components.gantt import DEFAULT_MAX_BARS, GanttRenderer, gantt_zoom
+from components.instrumentation import activar, mostrar_instrumentacion
+
+# Máximo de errores de validación que se muestran por archivo
+MAX_ERRORES = 50
+
+# Modo -> motor de simulación (algorithms/sync.py)
+SIMULADORES = {
+    "Mutex": simulate_mutex,
+    "Semáforo": simulate_semaphore,
+    "Semáforo (cola FIFO)": simulate_semaphore_queue,
+    "Lector-escritor": simulate_rwlock
+}
+
+# Co-simulación: un planificador de algorithms/ decide qué proceso corre
+MODO_COSIM = "CPU + sincronización"
+
+# Cómo retienen los procesos las unidades en la co-simulación
+RETENCIONES = {
+    "Ciclos de reloj": "clock",
+    "Ciclos de CPU (puede interbloquear)": "cpu"
+}
+
+# Modos con cola de espera (sin reintentos)
+MODOS_COLA = {"Semáforo (cola FIFO)", "Lector-escritor"}
+
+# Eventos de la bitácora que se dibujan como barras en el Gantt
+ESTADOS = ["ACCESSED", "WAITING", "FAILED"]
+
+# Texto de cada evento en la simulación paso a paso (Semáforo)
+MENSAJES_EVENTO = {
+    "RELEASE": "✅ {pid} libera {resource}",
+    "REQUEST": "📥 {pid} solicita {resource}",
+    "ACCESSED": "✅ {pid} accede a {resource}",
+    "FAILED": "❌ {pid} falla al acceder a {resource} (muchos intentos)",
+    "WAITING": "⏳ {pid} espera por {resource} (intento {attempt})"
+}
+
+# En el semáforo con cola no hay reintentos: se espera hasta recibir la unidad
+MENSAJES_COLA = {
+    **MENSAJES_EVENTO,
+    "ACCESSED": "✅ {pid} accede a {resource} ({accion}) por {duration} ciclo(s)",
+    "FAILED": "❌ {pid} nunca obtuvo {resource} (sin unidades)",
+    "WAITING": "⏳ {pid} entra a la cola de {resource}"
+}
+
+
+def agregar_bitacora(gantt_chart, bitacora, estados, grupo=None, con_duracion=False):
+    """
+    Agrega al Gantt los eventos de la bitácora de los tipos `estados`
+    directamente desde sus columnas, con el recurso como texto. El grupo es
+    el tipo de evento, o `grupo` para todos; con `con_duracion` se omiten
+    los eventos de duración 0.
+    """
+    evento = as_int_array(bitacora.event)
+    duracion = as_int_array(bitacora.duration)
+    sel = np.isin(evento, [EVENTS.index(e) for e in estados])
+    if con_duracion:
+        sel &= duracion > 0
+    if grupo is None:
+        grupos, nombres = evento[sel], EVENTS
+    else:
+        grupos, nombres = np.zeros(np.count_nonzero(sel), dtype=np.int64), [grupo]
+    inicio = as_int_array(bitacora.cycle)[sel]
+    recursos = np.array(bitacora.resources, dtype=object)
+    gantt_chart.extend(grupos, nombres, as_int_array(bitacora.pid_index)[sel], bitacora.pids,
+                       inicio, inicio + duracion[sel], recursos[as_int_array(bitacora.resource_index)[sel]])
+
+
+def mostrar_cosimulacion(procesos, recursos, acciones, algoritmo, quantum, retencion):
+    """Co-simulación: Gantt de CPU y bloqueos, interbloqueos y el impacto de la contención por política."""
+    st.subheader(f"🖥️ Co-simulación CPU + recursos ({algoritmo})")
+    with phase("schedule"):
+        resultado = cosimulate(procesos, recursos, acciones, algoritmo, quantum, hold=retencion, compact=True)
+
+    with phase("render"):
+        gantt_chart = GanttRenderer(
+            st.empty(),
+            title=f"CPU ({algoritmo}) y bloqueos por recursos",
+            color_map={"CPU": "green", "BLOQUEADO": "red"},
+            group_label="Estado",
+            text_label="Detalle",
+            key="cosim",
+            max_bars=DEFAULT_MAX_BARS
+        )
+        timeline = resultado["timeline"]
+        gantt_chart.extend(np.zeros(len(timeline), dtype=np.int64), ["CPU"],
+                           as_int_array(timeline.pid_index), timeline.pids,
+                           as_int_array(timeline.start), as_int_array(timeline.end))
+        agregar_bitacora(gantt_chart, resultado["sync"], ["WAITING"], grupo="BLOQUEADO", con_duracion=True)
+        gantt_chart.render()
+        if len(gantt_chart) > DEFAULT_MAX_BARS:
+            gantt_zoom(gantt_chart)
+
+    col1, col2 = st.columns(2)
+    # Sin promedio (None) cuando hay procesos que nunca terminan
+    for col, titulo, valor in ((col1, "⏱ Espera promedio", resultado["avg_waiting_time"]),
+                               (col2, "🔒 Bloqueo promedio", resultado["avg_blocked_time"])):
+        col.metric(titulo, "∞" if valor is None else f"{valor:.2f}")
+    if resultado["unfinished"]:
+        st.warning(f"⚠️ Procesos bloqueados para siempre: {', '.join(resultado['unfinished'])}")
+    for interbloqueo in resultado["deadlocks"]:
+        cadena = " → ".join(f"{pid} espera {recurso}" for pid, recurso in interbloqueo["chain"])
+        st.error(f"💀 Interbloqueo en el ciclo {interbloqueo['cycle']}: {cadena}")
+
+    st.subheader("📈 Impacto de la contención por política")
+    with phase("schedule"):
+        df_impacto = pd.DataFrame(contention_report(procesos, recursos, acciones, list(SCHEDULERS), quantum,
+                                                    hold=retencion))
+    df_impacto.columns = [
+        "Algoritmo", "Espera sin recursos", "Espera con recursos", "Aumento", "Bloqueo promedio", "Sin terminar",
+        "Interbloqueos"
+    ]
+    st.dataframe(df_impacto, use_container_width=True)
+
+
+def eventos_por_ciclo(bitacora):
+    """Recorre los ciclos con eventos y entrega (ciclo, eventos del ciclo)."""
+    k = 0
+    while k < len(bitacora):
+        ciclo = bitacora.cycle[k]
+        eventos = []
+        while k < len(bitacora) and bitacora.cycle[k] == ciclo:
+            eventos.append(bitacora[k])
+            k += 1
+        yield ciclo, eventos
+
+
+def detener(inst):
+    """Muestra la instrumentación (si está activa) y detiene la página."""
+    mostrar_instrumentacion(inst)
+    st.stop()
+
 
 st.set_page_config(page_title="Simulación de Sincronización", layout="wide")
 st.title("🔒 Simulación de Mecanismos de Sincronización")
 
 # Sidebar
 st.sidebar.header("Configuración")
-modo = st.sidebar.selectbox("Modo de sincronización", ["Mutex", "Semáforo"])
+modo = st.sidebar.selectbox("Modo de sincronización", [*SIMULADORES, MODO_COSIM])
+paso_a_paso = st.sidebar.checkbox("🌀 Simulación paso a paso", value=True)
+instrumentar = st.sidebar.checkbox(
+    "🔬 Instrumentación", value=False,
+    help="Mide el tiempo de cada fase y cuenta las operaciones de los motores de sincronización"
+)
+inst = Instrumentation() if instrumentar else None
+opciones = {}
+if modo == MODO_COSIM:
+    algoritmo = st.sidebar.selectbox("Algoritmo de calendarización", list(SCHEDULERS))
+    # También se usa para Round Robin en la comparación entre políticas
+    quantum = st.sidebar.number_input("⏱ Quantum para Round Robin", min_value=1, step=1, value=2)
+    retencion = RETENCIONES[st.sidebar.radio(
+        "🔐 Retención de recursos", list(RETENCIONES),
+        help="Con ciclos de CPU un proceso bloqueado conserva lo que tiene, y puede haber interbloqueos"
+    )]
+if modo == "Lector-escritor":
+    opciones["prefer_readers"] = st.sidebar.checkbox(
+        "📖 Preferencia a lectores", value=False,
+        help="Los lectores pasan aunque haya escritores esperando (puede causar inanición de escritores)"
+    )
 
 # Carga de archivos
 procesos_file = st.file_uploader("📂 Cargar archivo de procesos", type="txt", key="procesos")
 recursos_file = st.file_uploader("📂 Cargar archivo de recursos", type="txt", key="recursos")
 acciones_file = st.file_uploader("📂 Cargar archivo de acciones", type="txt", key="acciones")
 
-def cargar_procesos(file):
-    procesos = []
-    errores = []
-    lines = file.read().decode("utf-8").splitlines()
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
-        partes = [p.strip() for p in line.split(",")]
-        if len(partes) != 4:
-            errores.append(f"Línea {i} procesos: formato inválido (4 valores esperados)")
-            continue
-        pid, bt, at, pr = partes
-        try:
-            bt = int(bt)
-            at = int(at)
-            pr = int(pr)
-        except ValueError:
-            errores.append(f"Línea {i} procesos: burst_time, arrival_time y priority deben ser enteros")
-            continue
-        procesos.append({
-            "pid": pid,
-            "burst_time": bt,
-            "arrival_time": at,
-            "priority": pr
-        })
-    return procesos, errores
-
-def cargar_recursos(file):
-    recursos = {}
-    errores = []
-    lines = file.read().decode("utf-8").splitlines()
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
-        partes = [p.strip() for p in line.split(",")]
-        if len(partes) != 2:
-            errores.append(f"Línea {i} recursos: formato inválido (2 valores esperados)")
-            continue
-        nombre, contador = partes
-        try:
-            contador = int(contador)
-        except ValueError:
-            errores.append(f"Línea {i} recursos: contador debe ser entero")
-            continue
-        recursos[nombre] = contador
-    return recursos, errores
-
-def cargar_acciones(file):
-    acciones = []
-    errores = []
-    lines = file.read().decode("utf-8").splitlines()
-    for i, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line:
-            continue
-        partes = [p.strip() for p in line.split(",")]
-        if len(partes) != 4:
-            errores.append(f"Línea {i} acciones: formato inválido (4 valores esperados)")
-            continue
-        pid, accion, recurso, ciclo = partes
-        try:
-            ciclo = int(ciclo)
-        except ValueError:
-            errores.append(f"Línea {i} acciones: ciclo debe ser entero")
-            continue
-        acciones.append({
-            "pid": pid,
-            "accion": accion.upper(),
-            "recurso": recurso,
-            "ciclo": ciclo
-        })
-    return acciones, errores
-
 # Solo continuar si los 3 archivos están cargados
 if procesos_file and recursos_file and acciones_file:
-    procesos, err_procesos = cargar_procesos(procesos_file)
-    recursos, err_recursos = cargar_recursos(recursos_file)
-    acciones, err_acciones = cargar_acciones(acciones_file)
+    with activar(inst), phase("parse"):
+        procesos, err_procesos = parse_processes(procesos_file, MAX_ERRORES, MENSAJES_PROCESOS_SYNC)
+        recursos, err_recursos = parse_resources(recursos_file, MAX_ERRORES)
+        acciones, err_acciones = parse_actions(acciones_file, MAX_ERRORES)
 
     errores_totales = err_procesos + err_recursos + err_acciones
     if errores_totales:
@@ -103,14 +191,14 @@ if procesos_file and recursos_file and acciones_file:
         for err in errores_totales:
             st.write(f"- {err}")
 
-    if procesos and recursos and acciones:
+    if len(procesos) and recursos and acciones:
         st.success("✅ Archivos validados correctamente y listos para simular.")
 
         # Mostrar tablas resumen
         st.markdown("## 📊 Datos cargados")
 
         st.markdown("### 📋 Procesos")
-        df_procesos = pd.DataFrame(procesos)
+        df_procesos = pd.DataFrame(procesos.columns())
         st.dataframe(df_procesos, use_container_width=True)
 
         st.markdown("### 🧩 Recursos")
@@ -123,248 +211,151 @@ if procesos_file and recursos_file and acciones_file:
 
         # Botón para iniciar simulación
         if st.button("🚀 Empezar simulación"):
+            with activar(inst):
+                if modo == MODO_COSIM:
+                    try:
+                        mostrar_cosimulacion(procesos, recursos, acciones, algoritmo, int(quantum), retencion)
+                    except ValueError as e:
+                        st.error(str(e))
+                    detener(inst)
+
+                try:
+                    with phase("schedule"):
+                        bitacora = SIMULADORES[modo](procesos, recursos, acciones, **opciones)
+                except ValueError as e:
+                    st.error(str(e))
+                    detener(inst)
+
+                # Bitácoras largas: sin animación, se dibuja el resultado final
+                animar = paso_a_paso and len(bitacora) <= DEFAULT_MAX_BARS
+
+                if modo == "Mutex":
+                    with phase("render"):
+                        st.subheader("🔄 Simulación paso a paso (Mutex)")
+
+                        gantt_chart = GanttRenderer(
+                            st.empty(),
+                            color_map={"ACCESSED": "green", "WAITING": "red"},
+                            group_label="Estado",
+                            text_label="Recurso",
+                            key="mutex",
+                            max_bars=DEFAULT_MAX_BARS
+                        )
 
-            if modo == "Mutex":
-                st.subheader("🔄 Simulación paso a paso (Mutex)")
-
-                estado_recursos = recursos.copy()
-                ciclo_max = max(a['ciclo'] for a in acciones)
-                acciones_ordenadas = sorted(acciones, key=lambda a: a['ciclo'])
-
-                gantt_placeholder = st.empty()
-                df_gantt = pd.DataFrame(columns=["Proceso", "Recurso", "Inicio", "Fin", "Estado"])
-
-                recursos_ocupados = {}
-
-                for ciclo in range(ciclo_max + 1):
-                    acciones_en_ciclo = [a for a in acciones_ordenadas if a['ciclo'] == ciclo]
-
-                    recursos_usados_este_ciclo = []
-
-                    for accion in acciones_en_ciclo:
-                        pid = accion["pid"]
-                        recurso = accion["recurso"]
-                        estado = ""
-
-                        if estado_recursos[recurso] > 0:
-                            estado = "ACCESSED"
-                            estado_recursos[recurso] -= 1
-                            recursos_usados_este_ciclo.append(recurso)
+                        if animar:
+                            for ciclo, eventos in eventos_por_ciclo(bitacora):
+                                for evento in eventos:
+                                    if evento["event"] in ESTADOS:
+                                        gantt_chart.append(
+                                            evento["event"], evento["pid"], ciclo, ciclo + evento["duration"],
+                                            evento["resource"]
+                                        )
+
+                                gantt_chart.render(title=f"Simulación Mutex - Ciclo {ciclo}")
+                                time.sleep(0.5)
                         else:
-                            estado = "WAITING"
-
-                        df_gantt = pd.concat([
-                            df_gantt,
-                            pd.DataFrame([{
-                                "Proceso": pid,
-                                "Recurso": recurso,
-                                "Inicio": ciclo,
-                                "Fin": ciclo + 1,
-                                "Estado": estado
-                            }])
-                        ])
-
-                    if ciclo in recursos_ocupados:
-                        for recurso in recursos_ocupados[ciclo]:
-                            if estado_recursos[recurso] < recursos[recurso]:
-                                estado_recursos[recurso] += 1
-                        del recursos_ocupados[ciclo]
-
-                    if recursos_usados_este_ciclo:
-                        recursos_ocupados[ciclo + 1] = recursos_ocupados.get(ciclo + 1, []) + recursos_usados_este_ciclo
-
-                    color_map = {"ACCESSED": "green", "WAITING": "red"}
-                    fig = px.bar(
-                        df_gantt,
-                        x="Inicio",
-                        y="Proceso",
-                        color="Estado",
-                        color_discrete_map=color_map,
-                        orientation="h",
-                        text="Recurso",
-                        base="Inicio",
-                        hover_data=["Inicio", "Fin", "Estado", "Recurso"]
-                    )
-                    fig.update_layout(
-                        xaxis_title="Ciclo",
-                        yaxis_title="Proceso",
-                        title=f"Simulación Mutex - Ciclo {ciclo}",
-                        barmode="stack"
-                    )
-                    gantt_placeholder.plotly_chart(fig, use_container_width=True)
-                    time.sleep(0.5)
-
-            elif modo == "Semáforo":
-                st.subheader("🔄 Simulación paso a paso (Semáforo)")
-
-                estado_recursos = recursos.copy()
-                ciclo_max = max(a['ciclo'] for a in acciones)
-                pendientes = []
-                df_gantt = pd.DataFrame(columns=["Proceso", "Recurso", "Inicio", "Fin", "Estado"])
-                procesos_activos = {}  # {(pid, recurso): ciclo_fin}
-                gantt_placeholder = st.empty()
-
-                for ciclo in range(ciclo_max + 10):
-                    st.write(f"**Ciclo {ciclo}** - Estado recursos: {estado_recursos}")
-
-                    # Liberar recursos
-                    procesos_a_liberar = []
-                    for (pid, recurso), ciclo_fin in procesos_activos.items():
-                        if ciclo >= ciclo_fin:
-                            estado_recursos[recurso] += 1
-                            procesos_a_liberar.append((pid, recurso))
-                            st.write(f"   ✅ {pid} libera {recurso}")
-
-                    for key in procesos_a_liberar:
-                        del procesos_activos[key]
-
-                    # Nuevas solicitudes
-                    nuevas_solicitudes = [a for a in acciones if a['ciclo'] == ciclo]
-                    for solicitud in nuevas_solicitudes:
-                        pendientes.append(solicitud)
-                        st.write(f"   📥 {solicitud['pid']} solicita {solicitud['recurso']}")
-
-                    pendientes_siguiente_ciclo = []
-
-                    # Procesar solicitudes pendientes
-                    for solicitud in pendientes:
-                        pid = solicitud["pid"]
-                        recurso = solicitud["recurso"]
-                        intentos = solicitud.get("intentos", 0)
-
-                        if estado_recursos[recurso] > 0:
-                            estado_recursos[recurso] -= 1
-                            procesos_activos[(pid, recurso)] = ciclo + 1
-
-                            nuevo_registro = pd.DataFrame([{
-                                "Proceso": pid,
-                                "Recurso": recurso,
-                                "Inicio": ciclo,
-                                "Fin": ciclo + 1,
-                                "Estado": "ACCESSED",
-                                "ID": f"{pid}-{recurso}-{ciclo}-ACCESSED"
-                            }])
-                            df_gantt = pd.concat([df_gantt, nuevo_registro], ignore_index=True)
-
-                            st.write(f"   ✅ {pid} accede a {recurso}")
-
-                        elif intentos >= 5:
-                            nuevo_registro = pd.DataFrame([{
-                                "Proceso": pid,
-                                "Recurso": recurso,
-                                "Inicio": ciclo,
-                                "Fin": ciclo + 1,
-                                "Estado": "FAILED",
-                                "ID": f"{pid}-{recurso}-{ciclo}-FAILED"
-                            }])
-                            df_gantt = pd.concat([df_gantt, nuevo_registro], ignore_index=True)
-
-                            st.write(f"   ❌ {pid} falla al acceder a {recurso} (muchos intentos)")
+                            agregar_bitacora(gantt_chart, bitacora, ESTADOS)
+                            gantt_chart.render(title=f"Simulación Mutex - Ciclo {bitacora.cycles - 1}")
+                        if len(gantt_chart) > DEFAULT_MAX_BARS:
+                            gantt_zoom(gantt_chart)
 
-                        else:
-                            nueva_solicitud = solicitud.copy()
-                            nueva_solicitud["intentos"] = intentos + 1
-                            pendientes_siguiente_ciclo.append(nueva_solicitud)
-
-                            nuevo_registro = pd.DataFrame([{
-                                "Proceso": pid,
-                                "Recurso": recurso,
-                                "Inicio": ciclo,
-                                "Fin": ciclo + 1,
-                                "Estado": "WAITING",
-                                "ID": f"{pid}-{recurso}-{ciclo}-WAITING"
-                            }])
-                            df_gantt = pd.concat([df_gantt, nuevo_registro], ignore_index=True)
-
-                            st.write(f"   ⏳ {pid} espera por {recurso} (intento {intentos + 1})")
-
-                    pendientes = pendientes_siguiente_ciclo
-
-                    # Graficar Gantt
-                    color_map = {
-                        "ACCESSED": "blue",
-                        "WAITING": "orange",
-                        "FAILED": "red"
-                    }
-
-                    if not df_gantt.empty:
-                        fig = go.Figure()
-
-                        for _, row in df_gantt.iterrows():
-                            color = color_map.get(row['Estado'], 'gray')
-                            fig.add_trace(go.Bar(
-                                name=row['Estado'],
-                                x=[row['Fin'] - row['Inicio']],
-                                y=[row['Proceso']],
-                                base=[row['Inicio']],
-                                orientation='h',
-                                marker=dict(color=color),
-                                text=row['Recurso'],
-                                textposition='inside',
-                                showlegend=False,
-                                hovertemplate=f"<b>{row['Proceso']}</b><br>" +
-                                              f"Recurso: {row['Recurso']}<br>" +
-                                              f"Estado: {row['Estado']}<br>" +
-                                              f"Ciclo: {row['Inicio']}-{row['Fin']}<extra></extra>"
-                            ))
-
-                        for estado, color in color_map.items():
-                            if estado in df_gantt['Estado'].values:
-                                fig.add_trace(go.Bar(
-                                    name=estado,
-                                    x=[None],
-                                    y=[None],
-                                    marker=dict(color=color),
-                                    showlegend=True
-                                ))
-
-                        fig.update_layout(
-                            title=f"Simulación Semáforo - Ciclo {ciclo}",
-                            xaxis_title="Ciclo",
-                            yaxis_title="Proceso",
-                            barmode="overlay",
-                            showlegend=True,
-                            legend=dict(title="Estado")
+                else:
+                    with phase("render"):
+                        st.subheader(f"🔄 Simulación paso a paso ({modo})")
+
+                        estado_recursos = recursos.copy()
+                        gantt_chart = GanttRenderer(
+                            st.empty(),
+                            color_map={"ACCESSED": "blue", "WAITING": "orange", "FAILED": "red"},
+                            group_label="Estado",
+                            text_label="Recurso",
+                            key=modo,
+                            max_bars=DEFAULT_MAX_BARS
                         )
 
-                        gantt_placeholder.plotly_chart(fig, use_container_width=True)
-
-                    time.sleep(1)
-
-                    if not pendientes and not procesos_activos and ciclo > ciclo_max:
-                        break
-
-                # Resumen final
-                st.subheader("📊 Resumen por proceso")
-
-                if not df_gantt.empty:
-                    resumen_data = []
-
-                    for proceso in df_gantt['Proceso'].unique():
-                        df_proceso = df_gantt[df_gantt['Proceso'] == proceso]
-
-                        accesos = len(df_proceso[df_proceso['Estado'] == 'ACCESSED'])
-                        esperas = len(df_proceso[df_proceso['Estado'] == 'WAITING'])
-                        fallidas = len(df_proceso[df_proceso['Estado'] == 'FAILED'])
-                        total = accesos + esperas + fallidas
-
-                        porcentaje_exito = (accesos / total * 100) if total > 0 else 0
-
-                        resumen_data.append({
-                            'Proceso': proceso,
-                            'Accesos': accesos,
-                            'Esperas': esperas,
-                            'Fallidas': fallidas,
-                            '% Éxito': round(porcentaje_exito, 4)
-                        })
-
-                    df_resumen = pd.DataFrame(resumen_data)
-                    st.dataframe(df_resumen, use_container_width=True, height=300)
-                else:
-                    st.write("No hay datos para mostrar en el resumen.")
+                        mensajes = MENSAJES_COLA if modo in MODOS_COLA else MENSAJES_EVENTO
+                        if animar:
+                            for ciclo, eventos in eventos_por_ciclo(bitacora):
+                                st.write(f"**Ciclo {ciclo}** - Estado recursos: {estado_recursos}")
+
+                                for evento in eventos:
+                                    pid, recurso = evento["pid"], evento["resource"]
+                                    accion = acciones[evento["action"]]["accion"]
+                                    # Un escritor toma todas las unidades del recurso
+                                    unidades = 1
+                                    if modo == "Lector-escritor" and accion == "WRITE":
+                                        unidades = max(recursos[recurso], 1)
+                                    if evento["event"] == "RELEASE":
+                                        estado_recursos[recurso] += unidades
+                                    elif evento["event"] == "ACCESSED":
+                                        estado_recursos[recurso] -= unidades
+                                    if evento["event"] in ESTADOS:
+                                        gantt_chart.append(evento["event"], pid, ciclo, ciclo + evento["duration"], recurso)
+                                    st.write("   " + mensajes[evento["event"]].format(**evento, accion=accion))
+
+                                # Graficar Gantt
+                                if len(gantt_chart):
+                                    gantt_chart.render(title=f"Simulación {modo} - Ciclo {ciclo}")
+                                time.sleep(1)
+                        else:
+                            agregar_bitacora(gantt_chart, bitacora, ESTADOS)
+                            gantt_chart.render(title=f"Simulación {modo} - Ciclo {bitacora.cycles - 1}")
+                            with st.expander("📜 Bitácora de eventos"):
+                                st.dataframe(pd.DataFrame(bitacora.columns()), use_container_width=True)
+                        if len(gantt_chart) > DEFAULT_MAX_BARS:
+                            gantt_zoom(gantt_chart)
+
+                    # Resumen final
+                    with phase("metrics"):
+                        st.subheader("📊 Resumen por proceso")
+                        df_eventos = pd.DataFrame(bitacora.columns())
+                        df_gantt = df_eventos[df_eventos["event"].isin(ESTADOS)]
+
+                        if not df_gantt.empty:
+                            procesos_en_orden = df_gantt["pid"].unique()
+                            conteo = pd.crosstab(df_gantt["pid"], df_gantt["event"]).reindex(
+                                index=procesos_en_orden, columns=["ACCESSED", "WAITING", "FAILED"], fill_value=0
+                            )
+                            total = conteo.sum(axis=1)
+
+                            df_resumen = pd.DataFrame({
+                                'Proceso': procesos_en_orden,
+                                'Accesos': conteo["ACCESSED"].to_numpy(),
+                                'Esperas': conteo["WAITING"].to_numpy(),
+                                'Fallidas': conteo["FAILED"].to_numpy(),
+                                '% Éxito': (conteo["ACCESSED"] / total * 100).round(4).to_numpy()
+                            })
+                            if modo in MODOS_COLA:
+                                # Tiempo total en cola (la duración de cada WAITING)
+                                espera = df_gantt[df_gantt["event"] == "WAITING"].groupby("pid")["duration"].sum()
+                                df_resumen["Ciclos en espera"] = espera.reindex(procesos_en_orden, fill_value=0).to_numpy()
+                            st.dataframe(df_resumen, use_container_width=True, height=300)
+                        else:
+                            st.write("No hay datos para mostrar en el resumen.")
+
+                        if modo == "Lector-escritor":
+                            st.subheader("📚 Lectores y escritores")
+                            metricas = compute_sync_metrics(bitacora, acciones)
+                            df_tipos = pd.DataFrame([
+                                {
+                                    "Tipo": tipo,
+                                    "Pedidos": m["requests"],
+                                    "Accesos": m["accesses"],
+                                    "Sin atender": m["failed"],
+                                    "Throughput (accesos/ciclo)": round(m["throughput"], 4),
+                                    "Espera promedio": round(m["avg_wait"], 2),
+                                    "Espera p95": m["wait_percentiles"]["p95"],
+                                    "Espera máxima": m["max_wait"]
+                                }
+                                for tipo, m in metricas.items()
+                            ])
+                            st.dataframe(df_tipos, use_container_width=True)
+                            st.caption("Una espera máxima muy superior al p95, o pedidos sin atender, indican inanición.")
 
     else:
         st.warning("⚠️ Por favor, corrige los errores antes de continuar.")
 
 else:
     st.warning("⚠️ Por favor, carga los tres archivos para comenzar.")
+
+mostrar_instrumentacion(inst)
@@ -0,0 +1,206 @@
+# tests/legacy.py
+"""
+Implementaciones originales (previas a los motores orientados a eventos),
+conservadas solo como referencia para las pruebas de paridad: SJF y
+Priority con min() sobre listas, Round Robin que recorre todos los
+procesos en cada quantum, SRTF ciclo a ciclo y los ciclos de Mutex y
+Semáforo que antes corrían dentro de pages/2_sync.py (sin Streamlit).
+"""
+
+from collections import deque
+from heapq import heappop, heappush
+
+
+def _no_preemptivo(processes, orden, clave):
+    processes = sorted(processes, key=orden)
+    completed = []
+    current_time = 0
+    waiting_times = []
+    remaining = processes.copy()
+
+    while remaining:
+        available = [p for p in remaining if p['arrival_time'] <= current_time]
+        if not available:
+            current_time = remaining[0]['arrival_time']
+            continue
+        next_proc = min(available, key=clave)
+        remaining.remove(next_proc)
+
+        start = current_time
+        end = start + next_proc['burst_time']
+        waiting_times.append(start - next_proc['arrival_time'])
+        completed.append({'pid': next_proc['pid'], 'start': start, 'end': end})
+        current_time = end
+
+    return {'timeline': completed, 'avg_waiting_time': sum(waiting_times) / len(waiting_times)}
+
+
+def sjf_scheduler(processes):
+    return _no_preemptivo(processes, lambda p: (p['arrival_time'], p['burst_time']), lambda p: p['burst_time'])
+
+
+def priority_scheduler(processes):
+    return _no_preemptivo(processes, lambda p: (p['arrival_time'], p['priority']), lambda p: p['priority'])
+
+
+def round_robin_scheduler(processes, quantum):
+    time = 0
+    queue = deque()
+    timeline = []
+    remaining_bt = {p['pid']: p['burst_time'] for p in processes}
+    finish_times = {}
+    arrived = set()
+
+    while len(finish_times) < len(processes):
+        for p in processes:
+            if p['arrival_time'] <= time and p['pid'] not in arrived:
+                queue.append(p['pid'])
+                arrived.add(p['pid'])
+
+        if not queue:
+            time += 1
+            continue
+
+        pid = queue.popleft()
+        exec_time = min(quantum, remaining_bt[pid])
+        timeline.append({'pid': pid, 'start': time, 'end': time + exec_time})
+        time += exec_time
+        remaining_bt[pid] -= exec_time
+
+        for p in processes:
+            if time - exec_time < p['arrival_time'] <= time and p['pid'] not in arrived:
+                queue.append(p['pid'])
+                arrived.add(p['pid'])
+
+        if remaining_bt[pid] > 0:
+            queue.append(pid)
+        else:
+            finish_times[pid] = time
+
+    waiting_times = [finish_times[p['pid']] - p['arrival_time'] - p['burst_time'] for p in processes]
+    return {'timeline': timeline, 'avg_waiting_time': sum(waiting_times) / len(waiting_times)}
+
+
+def srtf_scheduler(processes):
+    """SRTF ciclo a ciclo: O(total_burst × N)."""
+    time = 0
+
+    # Estado de ejecución
+    remaining_bt = {p['pid']: p['burst_time'] for p in processes}
+    finish_times = {}
+    timeline = []
+
+    ready_queue = []
+    current_pid = None
+
+    while remaining_bt:
+        # Cargar procesos que llegan en este ciclo
+        for p in processes:
+            if p['arrival_time'] == time:
+                heappush(ready_queue, (p['burst_time'], p['pid'], p))
+
+        if ready_queue:
+            # Seleccionamos el proceso con menor burst restante
+            burst, pid, proc = heappop(ready_queue)
+
+            # Si el proceso cambia, registramos el anterior
+            if current_pid != pid:
+                if current_pid is not None:
+                    timeline[-1]["end"] = time
+                timeline.append({"pid": pid, "start": time, "end": time + 1})
+                current_pid = pid
+            else:
+                timeline[-1]["end"] += 1
+
+            remaining_bt[pid] -= 1
+            time += 1
+
+            if remaining_bt[pid] > 0:
+                heappush(ready_queue, (remaining_bt[pid], pid, proc))
+            else:
+                finish_times[pid] = time
+                del remaining_bt[pid]
+                current_pid = None
+        else:
+            time += 1
+
+    # Calcular tiempo de espera por fórmula: finish - arrival - burst
+    waiting_times = []
+    for p in processes:
+        pid = p['pid']
+        wt = finish_times[pid] - p['arrival_time'] - p['burst_time']
+        waiting_times.append(wt)
+
+    avg_waiting_time = sum(waiting_times) / len(waiting_times)
+    return {
+        "timeline": timeline,
+        "avg_waiting_time": avg_waiting_time
+    }
+
+
+def mutex_page(recursos, acciones):
+    """Barras (estado, pid, ciclo, recurso) del modo Mutex de la página original."""
+    barras = []
+    estado_recursos = recursos.copy()
+    ciclo_max = max(a['ciclo'] for a in acciones)
+    acciones_ordenadas = sorted(acciones, key=lambda a: a['ciclo'])
+    recursos_ocupados = {}
+
+    for ciclo in range(ciclo_max + 1):
+        usados = []
+        for accion in [a for a in acciones_ordenadas if a['ciclo'] == ciclo]:
+            recurso = accion['recurso']
+            if estado_recursos[recurso] > 0:
+                estado = "ACCESSED"
+                estado_recursos[recurso] -= 1
+                usados.append(recurso)
+            else:
+                estado = "WAITING"
+            barras.append((estado, accion['pid'], ciclo, recurso))
+
+        if ciclo in recursos_ocupados:
+            for recurso in recursos_ocupados.pop(ciclo):
+                if estado_recursos[recurso] < recursos[recurso]:
+                    estado_recursos[recurso] += 1
+        if usados:
+            recursos_ocupados[ciclo + 1] = recursos_ocupados.get(ciclo + 1, []) + usados
+    return barras
+
+
+def semaphore_page(recursos, acciones):
+    """
+    Barras (estado, pid, ciclo, recurso) del modo Semáforo de la página
+    original y cantidad de ciclos que recorría.
+    """
+    barras = []
+    estado_recursos = recursos.copy()
+    ciclo_max = max(a['ciclo'] for a in acciones)
+    pendientes = []
+    activos = {}
+    ciclos = 0
+
+    for ciclo in range(ciclo_max + 10):
+        ciclos += 1
+        for clave in [k for k, fin in activos.items() if ciclo >= fin]:
+            estado_recursos[clave[1]] += 1
+            del activos[clave]
+        pendientes.extend(a for a in acciones if a['ciclo'] == ciclo)
+
+        siguientes = []
+        for solicitud in pendientes:
+            pid, recurso = solicitud['pid'], solicitud['recurso']
+            intentos = solicitud.get('intentos', 0)
+            if estado_recursos[recurso] > 0:
+                estado_recursos[recurso] -= 1
+                activos[(pid, recurso)] = ciclo + 1
+                barras.append(("ACCESSED", pid, ciclo, recurso))
+            elif intentos >= 5:
+                barras.append(("FAILED", pid, ciclo, recurso))
+            else:
+                siguientes.append(dict(solicitud, intentos=intentos + 1))
+                barras.append(("WAITING", pid, ciclo, recurso))
+        pendientes = siguientes
+
+        if not pendientes and not activos and ciclo > ciclo_max:
+            break
+    return barras, ciclos
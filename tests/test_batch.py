@@ -0,0 +1,67 @@
+# tests/test_batch.py
+
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.batch import fifo_batch, stack_tables
+from algorithms.fifo import fifo_scheduler
+from algorithms.process_table import ProcessTable
+from tests.util import random_processes
+
+
+def esperado(tabla):
+    """Inicio y fin por proceso (orden original) según fifo_scheduler."""
+    res = fifo_scheduler(tabla)
+    fila = {s['pid']: (s['start'], s['end']) for s in res['timeline']}
+    inicio = [fila[pid][0] for pid in tabla.pid]
+    fin = [fila[pid][1] for pid in tabla.pid]
+    return inicio, fin, res['avg_waiting_time']
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_traces(seed):
+    rng = random.Random(seed)
+    # max_arrival 0 y 5 fuerzan llegadas empatadas; 30 deja huecos ociosos
+    tablas = [
+        ProcessTable.from_dicts(random_processes(rng, rng.randint(1, 15), max_burst=rng.choice([3, 10]),
+                                                 max_arrival=rng.choice([0, 5, 30])))
+        for _ in range(100)
+    ]
+    res = fifo_batch(*stack_tables(tablas))
+    for r, tabla in enumerate(tablas):
+        inicio, fin, promedio = esperado(tabla)
+        k = len(tabla)
+        assert res['start'][r, :k].tolist() == inicio
+        assert res['end'][r, :k].tolist() == fin
+        assert res['makespan'][r] == max(fin)
+        assert res['avg_waiting_time'][r] == pytest.approx(promedio)
+        # El relleno no cuenta
+        assert not res['waiting_time'][r, k:].any()
+
+
+def test_same_length_without_lengths():
+    rng = random.Random(7)
+    tablas = [ProcessTable.from_dicts(random_processes(rng, 12, max_arrival=40)) for _ in range(50)]
+    arrival, burst, _ = stack_tables(tablas)
+    res = fifo_batch(arrival, burst)
+    for r, tabla in enumerate(tablas):
+        inicio, fin, promedio = esperado(tabla)
+        assert res['start'][r].tolist() == inicio
+        assert res['end'][r].tolist() == fin
+        assert res['avg_waiting_time'][r] == pytest.approx(promedio)
+
+
+def test_idle_gap_and_ties_by_hand():
+    # A y B llegan juntos (A primero por orden estable); C llega tras un hueco
+    res = fifo_batch([[0, 0, 10]], [[3, 2, 4]])
+    assert res['start'].tolist() == [[0, 3, 10]]
+    assert res['end'].tolist() == [[3, 5, 14]]
+    assert res['avg_waiting_time'][0] == pytest.approx(1.0)
+    assert res['makespan'][0] == 14
+
+
+def test_shape_mismatch():
+    with pytest.raises(ValueError):
+        fifo_batch(np.zeros((2, 3)), np.zeros((2, 4)))
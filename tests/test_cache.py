@@ -0,0 +1,113 @@
+# tests/test_cache.py
+
+import os
+import pickle
+import random
+import threading
+
+from algorithms.cache import ResultCache, result_key, result_size, table_digest
+from algorithms.compare import run_comparison
+from algorithms.process_table import ProcessTable
+from algorithms.registry import SCHEDULERS, expand_jobs, run_scheduler
+from tests.util import random_processes
+
+
+def table(n, seed=0):
+    return ProcessTable.from_dicts(random_processes(random.Random(seed), n, max_arrival=n))
+
+
+def test_digest_follows_content():
+    a, b = table(200), table(200)
+    assert table_digest(a) == table_digest(b)
+    b.burst_time[5] += 1
+    assert table_digest(a) != table_digest(b)
+
+
+def test_result_size_counts_timeline_columns():
+    resultado = run_scheduler("Round Robin", table(500), 1, compact=True)
+    columnas = 3 * len(resultado['timeline']) * resultado['timeline'].start.itemsize
+    assert columnas <= result_size(resultado) < columnas + 1024
+
+
+def test_memory_is_bounded_by_entries_and_bytes():
+    cache = ResultCache(max_entries=2)
+    for key in "abc":
+        cache.put(key, key)
+    assert "a" not in cache and cache.get("b") == "b"
+    cache.put("d", "d")
+    assert "c" not in cache and "b" in cache
+
+    resultados = {n: run_scheduler("SRTF", table(n, seed=n), compact=True) for n in (100, 200, 300, 400)}
+    limite = result_size(resultados[300]) + result_size(resultados[400])
+    cache = ResultCache(max_bytes=limite)
+    for n, resultado in resultados.items():
+        cache.put(n, resultado)
+        assert cache.nbytes <= limite
+    assert list(cache.entries) == [300, 400]
+    assert cache.nbytes == sum(result_size(resultados[n]) for n in (300, 400))
+
+    # Un resultado que no cabe no se conserva en memoria
+    cache = ResultCache(max_bytes=result_size(resultados[100]))
+    cache.put(400, resultados[400])
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_disk_round_trip_and_pruning(tmp_path):
+    tabla = table(300)
+    jobs = expand_jobs(list(SCHEDULERS), [2, 4])
+    cache = ResultCache(path=str(tmp_path))
+    primero = dict(run_comparison(tabla, jobs, max_workers=1, cache=cache))
+
+    otra = ResultCache(path=str(tmp_path))
+    segundo = dict(run_comparison(tabla, jobs, max_workers=1, cache=otra))
+    assert otra.hits == len(jobs) and otra.misses == 0
+    for job in jobs:
+        assert segundo[job]['timeline'].to_dicts() == primero[job]['timeline'].to_dicts()
+        assert segundo[job]['avg_waiting_time'] == primero[job]['avg_waiting_time']
+
+    archivos = [os.path.join(tmp_path, f) for f in os.listdir(tmp_path)]
+    tamanos = sorted(os.path.getsize(f) for f in archivos)
+    limite = sum(tamanos[-3:])
+    podada = ResultCache(path=str(tmp_path), max_disk_bytes=limite)
+    digest = table_digest(tabla)
+    podada.put(result_key(digest, "extra"), primero[jobs[0]])
+    assert sum(os.path.getsize(os.path.join(tmp_path, f)) for f in os.listdir(tmp_path)) <= limite
+    # Lo último que se escribió sobrevive a la poda
+    assert result_key(digest, "extra") in ResultCache(path=str(tmp_path))
+
+
+def test_disk_files_leave_out_the_pid_column(tmp_path):
+    tabla = table(2000)
+    resultado = run_scheduler("SRTF", tabla, compact=True)
+    cache = ResultCache(path=str(tmp_path))
+    cache.put("srtf", resultado)
+    assert resultado['timeline'].pids is tabla.pid
+
+    archivo, = os.listdir(tmp_path)
+    with open(os.path.join(tmp_path, archivo), "rb") as f:
+        assert pickle.load(f)['timeline'].pids is None
+
+    leido = ResultCache(path=str(tmp_path)).get("srtf", pids=tabla.pid)
+    assert leido['timeline'].pids is tabla.pid
+    assert leido['timeline'].to_dicts() == resultado['timeline'].to_dicts()
+
+
+def test_concurrent_use_keeps_the_byte_count():
+    resultados = [run_scheduler("FIFO", table(50 + k, seed=k), compact=True) for k in range(20)]
+    cache = ResultCache(max_entries=8, max_bytes=6 * result_size(resultados[-1]))
+
+    def trabajo(semilla):
+        rng = random.Random(semilla)
+        for _ in range(2000):
+            k = rng.randrange(len(resultados))
+            if cache.get(k) is None:
+                cache.put(k, resultados[k])
+
+    hilos = [threading.Thread(target=trabajo, args=(s,)) for s in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert len(cache) <= 8 and cache.nbytes <= cache.max_bytes
+    assert cache.nbytes == sum(result_size(resultados[k]) for k in cache.entries)
+    assert cache.hits + cache.misses == 8 * 2000
@@ -0,0 +1,110 @@
+# tests/test_cli.py
+
+import csv
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from algorithms.cli import main
+from algorithms.parsers import parse_processes
+from algorithms.registry import SCHEDULERS, run_scheduler
+
+ROOT = Path(__file__).resolve().parent.parent
+TRAZA = ROOT / "data" / "process_srtf.txt"
+
+
+def esperado(name, quantum=None):
+    tabla, _ = parse_processes(str(TRAZA))
+    return run_scheduler(name, tabla, quantum)
+
+
+def test_default_csv(capsys):
+    assert main([str(TRAZA)]) == 0
+    filas = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    # Todos los algoritmos, Round Robin con el quantum 2 por defecto
+    assert [f['algorithm'] for f in filas] == list(SCHEDULERS)
+    for fila in filas:
+        quantum = int(fila['quantum']) if fila['quantum'] else None
+        assert float(fila['avg_waiting_time']) == pytest.approx(esperado(fila['algorithm'], quantum)['avg_waiting_time'])
+
+
+def test_json_with_metrics_and_timeline(capsys):
+    assert main([str(TRAZA), "-a", "rr", "-q", "1", "-q", "3", "-a", "srtf", "--metrics",
+                 "--format", "json", "--timeline", "-"]) == 0
+    filas = json.loads(capsys.readouterr().out)['results']
+    assert [(f['algorithm'], f['quantum']) for f in filas] == [("Round Robin", 1), ("Round Robin", 3), ("SRTF", None)]
+    for fila in filas:
+        res = esperado(fila['algorithm'], fila['quantum'])
+        assert fila['timeline'] == res['timeline']
+        assert fila['avg_waiting_time'] == pytest.approx(res['avg_waiting_time'])
+        assert 'context_switches' in fila and 'waiting_time_p95' in fila
+
+
+def test_output_and_timeline_files(tmp_path, capsys):
+    salida, tramos = tmp_path / "res.csv", tmp_path / "timeline.csv"
+    assert main([str(TRAZA), "-a", "fifo", "-o", str(salida), "--timeline", str(tramos)]) == 0
+    assert capsys.readouterr().out == ""
+    with open(salida, encoding="utf-8") as f:
+        assert [r['algorithm'] for r in csv.DictReader(f)] == ["FIFO"]
+    with open(tramos, encoding="utf-8") as f:
+        filas = list(csv.DictReader(f))
+    assert [(r['pid'], int(r['start']), int(r['end'])) for r in filas] == [
+        (s['pid'], s['start'], s['end']) for s in esperado("FIFO")['timeline']
+    ]
+
+
+def test_cache_dir_gives_same_output(tmp_path, capsys):
+    args = [str(TRAZA), "-a", "srtf", "-a", "rr", "--cache-dir", str(tmp_path / "cache")]
+    assert main(args) == 0
+    primera = capsys.readouterr().out
+    assert main(args) == 0
+    assert capsys.readouterr().out == primera
+    assert any((tmp_path / "cache").iterdir())
+
+
+@pytest.mark.parametrize("extra", [
+    ["-q", "0"],
+    ["--timeline", "-"],
+    ["--cache-size", "-1"],
+])
+def test_invalid_options(extra, capsys):
+    assert main([str(TRAZA), *extra]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "" and captured.err
+
+
+def test_invalid_file(tmp_path, capsys):
+    traza = tmp_path / "mala.txt"
+    traza.write_text("A,3,0,1\nB,x,1,1\nA,2,2,1\n", encoding="utf-8")
+    assert main([str(traza)]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Se detectaron errores" in captured.err
+    assert "Línea 2" in captured.err and "Línea 3" in captured.err
+
+
+def test_empty_file(tmp_path, capsys):
+    traza = tmp_path / "vacia.txt"
+    traza.write_text("\n", encoding="utf-8")
+    assert main([str(traza)]) == 1
+    assert "No se cargaron procesos" in capsys.readouterr().err
+
+
+def test_unknown_algorithm(capsys):
+    with pytest.raises(SystemExit) as e:
+        main([str(TRAZA), "-a", "lifo"])
+    assert e.value.code == 2
+    assert "algoritmo desconocido" in capsys.readouterr().err
+
+
+def test_module_exit_code(tmp_path):
+    traza = tmp_path / "mala.txt"
+    traza.write_text("A,-1,0,1\n", encoding="utf-8")
+    proc = subprocess.run([sys.executable, "-m", "algorithms.cli", str(traza)],
+                          cwd=ROOT, capture_output=True, text=True)
+    assert proc.returncode == 1
+    assert "negativos" in proc.stderr
@@ -0,0 +1,71 @@
+# tests/test_compare.py
+
+import random
+
+import pytest
+
+from algorithms import compare
+from algorithms.cache import ResultCache
+from algorithms.compare import (SharedProcessTable, attach_process_table, release_process_table, run_comparison,
+                                shared_pool)
+from algorithms.process_table import ProcessTable
+from algorithms.registry import SCHEDULERS, expand_jobs, run_scheduler
+from tests.util import random_processes
+
+
+@pytest.fixture
+def tabla():
+    return ProcessTable.from_dicts(random_processes(random.Random(3), 300, max_arrival=500))
+
+
+def test_shared_memory_round_trip(tabla):
+    with SharedProcessTable(tabla) as shared:
+        copia, shm = attach_process_table(shared.handle)
+        try:
+            assert copia.pid == tabla.pid
+            for columna in ("burst_time", "arrival_time", "priority"):
+                assert list(getattr(copia, columna)) == list(getattr(tabla, columna))
+            assert list(copia.arrival_order()) == list(tabla.arrival_order())
+            assert run_scheduler("SRTF", copia)['timeline'] == run_scheduler("SRTF", tabla)['timeline']
+        finally:
+            release_process_table(copia, shm)
+
+
+def test_empty_table_round_trip():
+    with SharedProcessTable(ProcessTable()) as shared:
+        copia, shm = attach_process_table(shared.handle)
+        assert len(copia) == 0 and copia.pid == []
+        release_process_table(copia, shm)
+
+
+def test_parallel_path_matches_inline(tabla, monkeypatch):
+    monkeypatch.setattr(compare, "PARALLEL_MIN_WORK", 0)
+    jobs = expand_jobs(list(SCHEDULERS), [1, 3])
+    en_linea = dict(run_comparison(tabla, jobs, max_workers=1))
+    for _ in range(2):
+        paralelo = dict(run_comparison(tabla, jobs, max_workers=2))
+        assert set(paralelo) == set(jobs)
+        for job in jobs:
+            assert paralelo[job]['timeline'].pids is tabla.pid
+            assert paralelo[job]['timeline'].to_dicts() == en_linea[job]['timeline'].to_dicts()
+            assert paralelo[job]['avg_waiting_time'] == en_linea[job]['avg_waiting_time']
+    # El pool se crea una vez y se reutiliza, sin fork desde el proceso con hilos
+    assert shared_pool(2) is shared_pool(2)
+    assert compare._start_context().get_start_method() in ("forkserver", "spawn")
+
+
+def test_parallel_path_with_cache(tabla, monkeypatch):
+    monkeypatch.setattr(compare, "PARALLEL_MIN_WORK", 0)
+    jobs = expand_jobs(["FIFO", "SRTF", "Round Robin"], [2])
+    cache = ResultCache()
+    primero = dict(run_comparison(tabla, jobs, max_workers=2, cache=cache))
+    segundo = dict(run_comparison(tabla, jobs, max_workers=2, cache=cache))
+    assert cache.misses == len(jobs) and cache.hits == len(jobs)
+    assert all(segundo[job] is primero[job] for job in jobs)
+
+
+def test_small_work_runs_inline(tabla, monkeypatch):
+    # Sin pool: si se intentara crear uno la prueba fallaría
+    monkeypatch.setattr(compare, "shared_pool", None)
+    jobs = expand_jobs(list(SCHEDULERS), [2])
+    assert len(dict(run_comparison(tabla, jobs))) == len(jobs)
@@ -0,0 +1,114 @@
+# tests/test_cosim.py
+
+import random
+
+import pytest
+
+from algorithms.cosim import contention_report, cosimulate
+from algorithms.registry import SCHEDULERS, run_scheduler
+from tests.util import busy_per_pid, merged, random_actions, random_processes
+
+# Dos procesos que toman R1 y R2 en orden opuesto (espera circular)
+CIRCULAR = (
+    [{'pid': 'P1', 'arrival_time': 0, 'burst_time': 4, 'priority': 1},
+     {'pid': 'P2', 'arrival_time': 0, 'burst_time': 4, 'priority': 1}],
+    {'R1': 1, 'R2': 1},
+    [{'pid': 'P1', 'recurso': 'R1', 'accion': 'READ', 'ciclo': 0, 'duracion': 3},
+     {'pid': 'P1', 'recurso': 'R2', 'accion': 'READ', 'ciclo': 2, 'duracion': 1},
+     {'pid': 'P2', 'recurso': 'R2', 'accion': 'READ', 'ciclo': 0, 'duracion': 3},
+     {'pid': 'P2', 'recurso': 'R1', 'accion': 'READ', 'ciclo': 2, 'duracion': 1}]
+)
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_without_actions_matches_scheduler(name):
+    rng = random.Random(11)
+    for _ in range(300):
+        procesos = random_processes(rng, rng.randint(1, 12), zero_bursts=True)
+        quantum = rng.randint(1, 4) if name == "Round Robin" else None
+        esperado = run_scheduler(name, procesos, quantum)
+        resultado = cosimulate(procesos, {}, [], name, quantum)
+        assert merged(resultado['timeline']) == merged(esperado['timeline'])
+        assert resultado['avg_waiting_time'] == pytest.approx(esperado['avg_waiting_time'])
+        assert resultado['unfinished'] == [] and resultado['deadlocks'] == []
+
+
+@pytest.mark.parametrize("hold", ["clock", "cpu"])
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_invariants_with_actions(name, hold):
+    rng = random.Random(5)
+    for _ in range(150):
+        procesos = random_processes(rng, rng.randint(1, 8), max_arrival=10)
+        recursos = {f"R{k}": rng.randint(1, 2) for k in range(rng.randint(1, 3))}
+        acciones = random_actions(rng, len(procesos), recursos, rng.randint(0, 15), max_cycle=8)
+        quantum = rng.randint(1, 3) if name == "Round Robin" else None
+        resultado = cosimulate(procesos, recursos, acciones, name, quantum, hold=hold)
+        tramos = sorted(resultado['timeline'], key=lambda s: s['start'])
+        log = resultado['sync']
+
+        assert all(a['end'] <= b['start'] for a, b in zip(tramos, tramos[1:]))
+        ejecutado = busy_per_pid(tramos)
+        for p in procesos:
+            if p['pid'] in resultado['unfinished']:
+                assert ejecutado.get(p['pid'], 0) < p['burst_time']
+            else:
+                assert ejecutado[p['pid']] == p['burst_time']
+            assert all(s['start'] >= p['arrival_time'] for s in tramos if s['pid'] == p['pid'])
+
+        # Un proceso bloqueado no ocupa la CPU
+        for e in log:
+            if e['event'] == "WAITING" and e['duration'] > 0:
+                fin = e['cycle'] + e['duration']
+                assert all(s['end'] <= e['cycle'] or s['start'] >= fin for s in tramos if s['pid'] == e['pid'])
+
+        ocupados = dict.fromkeys(recursos, 0)
+        for e in log:
+            if e['event'] == "ACCESSED":
+                ocupados[e['resource']] += 1
+                assert ocupados[e['resource']] <= recursos[e['resource']]
+            elif e['event'] == "RELEASE":
+                ocupados[e['resource']] -= 1
+        assert list(log.cycle) == sorted(log.cycle)
+
+        if hold == "clock":
+            # Con retenciones por tiempo de reloj no puede formarse una espera circular
+            assert resultado['unfinished'] == [] and resultado['deadlocks'] == []
+        else:
+            # Con capacidad en todos los recursos, solo un interbloqueo deja procesos sin terminar
+            en_ciclo = {pid for d in resultado['deadlocks'] for pid in d['processes']}
+            assert en_ciclo <= set(resultado['unfinished'])
+            assert bool(resultado['unfinished']) == bool(resultado['deadlocks'])
+
+
+def test_circular_wait_is_detected():
+    procesos, recursos, acciones = CIRCULAR
+    resultado = cosimulate(procesos, recursos, acciones, "Round Robin", 1, hold="cpu")
+    assert sorted(resultado['unfinished']) == ["P1", "P2"]
+    assert len(resultado['deadlocks']) == 1
+    assert sorted(resultado['deadlocks'][0]['processes']) == ["P1", "P2"]
+
+    # Con retenciones por reloj los mismos procesos terminan
+    assert cosimulate(procesos, recursos, acciones, "Round Robin", 1)['unfinished'] == []
+
+
+def test_unfinished_processes_have_no_average():
+    procesos, recursos, acciones = CIRCULAR
+    resultado = cosimulate(procesos, recursos, acciones, "Round Robin", 1, hold="cpu")
+    assert resultado['avg_waiting_time'] is None and resultado['avg_blocked_time'] is None
+
+    fila, = contention_report(procesos, recursos, acciones, ["Round Robin"], 1, hold="cpu")
+    assert fila['unfinished'] == 2
+    assert fila['avg_waiting_time_alone'] == run_scheduler("Round Robin", procesos, 1)['avg_waiting_time']
+    assert fila['avg_waiting_time'] is None and fila['inflation'] is None and fila['avg_blocked_time'] is None
+
+
+def test_report_averages_only_when_all_finish():
+    rng = random.Random(17)
+    for _ in range(300):
+        procesos = random_processes(rng, rng.randint(1, 8), max_arrival=10)
+        recursos = {f"R{k}": rng.randint(1, 2) for k in range(rng.randint(1, 3))}
+        acciones = random_actions(rng, len(procesos), recursos, rng.randint(0, 15), max_cycle=8)
+        for fila in contention_report(procesos, recursos, acciones, ["FIFO", "Round Robin"], 2, hold="cpu"):
+            sin_promedio = fila['avg_waiting_time'] is None
+            assert sin_promedio == (fila['unfinished'] > 0)
+            assert (fila['inflation'] is None) == sin_promedio == (fila['avg_blocked_time'] is None)
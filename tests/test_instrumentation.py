@@ -0,0 +1,81 @@
+# tests/test_instrumentation.py
+
+from algorithms import instrumentation
+from algorithms.instrumentation import Instrumentation, active, instrumented, phase, timeline_counters
+from algorithms.round_robin import round_robin_scheduler
+from algorithms.srtf import srtf_scheduler
+from algorithms.timeline import Timeline
+
+# A es expropiado por B; C llega después de un hueco sin procesos listos
+PROCESOS = [
+    {'pid': 'A', 'burst_time': 4, 'arrival_time': 0, 'priority': 0},
+    {'pid': 'B', 'burst_time': 1, 'arrival_time': 1, 'priority': 0},
+    {'pid': 'C', 'burst_time': 2, 'arrival_time': 10, 'priority': 0},
+]
+
+
+def test_srtf_counters():
+    with instrumented() as inst:
+        res = srtf_scheduler(PROCESOS)
+    # A 0-1, B 1-2, A 2-5, (ocioso) C 10-12
+    assert [(s['pid'], s['start'], s['end']) for s in res['timeline']] == [
+        ('A', 0, 1), ('B', 1, 2), ('A', 2, 5), ('C', 10, 12)
+    ]
+    assert inst.counters == {'srtf': {
+        'heap_push': 4, 'heap_pop': 4, 'runs': 1,
+        'dispatches': 4, 'preemptions': 1, 'context_switches': 3, 'idle_skips': 1
+    }}
+
+
+def test_round_robin_counters():
+    with instrumented() as inst:
+        res = round_robin_scheduler(PROCESOS, 2)
+    # A 0-2 (fin de quantum), B 2-3, A 3-5, (ocioso) C 10-12
+    assert [(s['pid'], s['start'], s['end']) for s in res['timeline']] == [
+        ('A', 0, 2), ('B', 2, 3), ('A', 3, 5), ('C', 10, 12)
+    ]
+    assert inst.counters == {'round_robin': {
+        'queue_push': 4, 'queue_pop': 4, 'runs': 1,
+        'dispatches': 4, 'preemptions': 1, 'context_switches': 3, 'idle_skips': 1
+    }}
+
+
+def test_counters_accumulate_across_runs():
+    inst = Instrumentation()
+    with instrumented(inst):
+        srtf_scheduler(PROCESOS)
+        srtf_scheduler(PROCESOS)
+    assert inst.counters['srtf']['runs'] == 2
+    assert inst.counters['srtf']['dispatches'] == 8
+
+
+def test_nothing_recorded_when_inactive():
+    inst = Instrumentation()
+    with instrumented(inst):
+        pass
+    assert active() is None
+    assert phase("schedule") is instrumentation._NO_PHASE
+
+    with phase("schedule"):
+        srtf_scheduler(PROCESOS)
+    round_robin_scheduler(PROCESOS, 2)
+    assert inst.counters == {} and inst.phases == {}
+
+
+def test_phases():
+    with instrumented() as inst:
+        for _ in range(3):
+            with phase("schedule"):
+                srtf_scheduler(PROCESOS)
+        assert list(instrumentation.timed_iter("items", iter([1, 2]))) == [1, 2]
+    reporte = inst.report()
+    fases = {f['phase']: f for f in reporte['phases']}
+    assert fases['schedule']['calls'] == 3
+    assert fases['items']['calls'] == 3  # dos elementos y el fin del iterador
+    assert reporte['counters']['srtf']['runs'] == 3
+
+
+def test_timeline_counters_empty():
+    assert timeline_counters(Timeline([])) == {
+        'dispatches': 0, 'preemptions': 0, 'context_switches': 0, 'idle_skips': 0
+    }
@@ -0,0 +1,92 @@
+# tests/test_lod.py
+
+import numpy as np
+import pytest
+
+from components.lod import downsample
+
+
+def random_slices(rng, n_rows, per_row, n_groups):
+    """Tramos sin solapes dentro de cada fila, con huecos al azar."""
+    row, group, start, end = [], [], [], []
+    for r in range(n_rows):
+        t = int(rng.integers(0, 50))
+        for _ in range(per_row):
+            t += int(rng.integers(0, 30))
+            d = int(rng.integers(1, 40))
+            row.append(r)
+            group.append(int(rng.integers(n_groups)))
+            start.append(t)
+            end.append(t + d)
+            t += d
+    return (np.array(row), np.array(group), np.array(start, dtype=np.int64), np.array(end, dtype=np.int64))
+
+
+def busy_in_window(start, end, t0, t1):
+    return int(np.clip(np.minimum(end, t1) - np.maximum(start, t0), 0, None).sum())
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_bound_and_coverage(seed):
+    rng = np.random.default_rng(seed)
+    n_rows = int(rng.choice([1, 3, 40, 300]))
+    n_groups = 5
+    row, group, start, end = random_slices(rng, n_rows, int(rng.integers(20, 200)), n_groups)
+    max_bars = int(rng.choice([50, 200, 1000]))
+    span = int(end.max())
+    for window in (None, (0, span), (span // 3, span // 3 + int(rng.integers(1, span)))):
+        out = downsample(row, group, start, end, n_groups, max_bars, window)
+        t0, t1 = window or (int(start.min()), span)
+        total = busy_in_window(start, end, t0, t1)
+        if out['exact']:
+            assert len(out['index']) <= max_bars
+            assert int((out['end'] - out['start']).sum()) == total
+            continue
+
+        assert len(out['start']) <= max_bars
+        assert (out['start'] >= t0).all() and (out['end'] <= t1).all()
+        assert ((out['occupancy'] > 0) & (out['occupancy'] <= 1)).all()
+        # Filas por barra: contar las filas del bloque en la ventana
+        visibles = np.unique(row[(end > t0) & (start < t1)])
+        filas = np.array([np.count_nonzero((visibles >= a) & (visibles <= b))
+                          for a, b in zip(out['row'], out['row_last'])])
+        # Sin solapes por fila la ocupación no se recorta: el tiempo ocupado se conserva
+        ocupado = (out['occupancy'] * (out['end'] - out['start']) * filas).sum()
+        assert ocupado == pytest.approx(total)
+
+        # Cada instante ocupado queda bajo una barra de su fila
+        visible = np.flatnonzero((end > t0) & (start < t1))
+        for k in rng.choice(visible, size=min(50, visible.size), replace=False):
+            t = (max(start[k], t0) + min(end[k], t1) - 1) // 2
+            assert np.any((out['row'] <= row[k]) & (row[k] <= out['row_last']) &
+                          (out['start'] <= t) & (t < out['end']))
+
+
+def test_exact_is_clipped_to_window():
+    row = np.array([0, 0, 1])
+    group = np.array([0, 1, 1])
+    start = np.array([0, 10, 5])
+    end = np.array([8, 20, 6])
+    out = downsample(row, group, start, end, 2, 10, (4, 15))
+    assert out['exact']
+    assert out['index'].tolist() == [0, 1, 2]
+    assert out['start'].tolist() == [4, 10, 5]
+    assert out['end'].tolist() == [8, 15, 6]
+
+
+def test_dominant_group():
+    # Un solo intervalo: el grupo 1 ocupa más tiempo que el 0
+    row = np.zeros(3, dtype=np.int64)
+    group = np.array([0, 1, 1])
+    start = np.array([0, 2, 5])
+    end = np.array([2, 5, 9])
+    out = downsample(row, group, start, end, 2, 1, (0, 10))
+    assert not out['exact']
+    assert out['group'].tolist() == [1]
+    assert out['occupancy'].tolist() == [pytest.approx(0.9)]
+
+
+def test_empty():
+    vacio = np.array([], dtype=np.int64)
+    out = downsample(vacio, vacio, vacio, vacio, 1, 10)
+    assert out['exact'] and out['index'].size == 0
@@ -0,0 +1,124 @@
+# tests/test_metrics.py
+
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.metrics import compute_metrics
+from algorithms.process_table import ProcessTable
+from algorithms.registry import SCHEDULERS, run_scheduler
+from algorithms.timeline import CoreTimeline, Timeline
+from tests.util import random_processes
+
+# A y B se alternan (varios tramos cada uno), la CPU queda ociosa de 5 a 11
+# y C empieza un ciclo después de llegar
+PROCESOS = [
+    {'pid': 'A', 'burst_time': 3, 'arrival_time': 0, 'priority': 1},
+    {'pid': 'B', 'burst_time': 2, 'arrival_time': 1, 'priority': 1},
+    {'pid': 'C', 'burst_time': 2, 'arrival_time': 10, 'priority': 1}
+]
+TRAMOS = [
+    {'pid': 'A', 'start': 0, 'end': 1},
+    {'pid': 'B', 'start': 1, 'end': 2},
+    {'pid': 'A', 'start': 2, 'end': 4},
+    {'pid': 'B', 'start': 4, 'end': 5},
+    {'pid': 'C', 'start': 11, 'end': 13}
+]
+
+
+def compacta():
+    tabla = ProcessTable.from_dicts(PROCESOS)
+    timeline = Timeline(tabla.pid)
+    for tramo in TRAMOS:
+        timeline.append(tabla.pid.index(tramo['pid']), tramo['start'], tramo['end'])
+    return tabla, timeline
+
+
+def test_hand_computed_trace():
+    m = compute_metrics(PROCESOS, TRAMOS)
+    por_proceso = m['per_process']
+    assert list(por_proceso['pid']) == ['A', 'B', 'C']
+    assert por_proceso['finish_time'].tolist() == [4, 5, 13]
+    assert por_proceso['turnaround_time'].tolist() == [4, 4, 3]
+    assert por_proceso['waiting_time'].tolist() == [1, 2, 1]
+    assert por_proceso['response_time'].tolist() == [0, 0, 1]
+
+    assert m['avg_waiting_time'] == pytest.approx(4 / 3)
+    assert m['avg_turnaround_time'] == pytest.approx(11 / 3)
+    assert m['avg_response_time'] == pytest.approx(1 / 3)
+    # Percentiles con interpolación lineal: espera ordenada [1, 1, 2]
+    assert m['percentiles']['waiting_time'] == pytest.approx({'p50': 1.0, 'p95': 1.9, 'p99': 1.98})
+    assert m['percentiles']['turnaround_time'] == pytest.approx({'p50': 4.0, 'p95': 4.0, 'p99': 4.0})
+    assert m['percentiles']['response_time'] == pytest.approx({'p50': 0.0, 'p95': 0.9, 'p99': 0.98})
+
+    # 7 ciclos ocupados en 13; A, B, A, B, C son cuatro cambios de contexto
+    assert m['cpu_utilization'] == pytest.approx(7 / 13)
+    assert m['throughput'] == pytest.approx(3 / 13)
+    assert m['context_switches'] == 4
+    assert m['total_time'] == 13 and m['makespan'] == 13
+
+
+def test_compact_timeline_gives_same_metrics():
+    tabla, timeline = compacta()
+    a = compute_metrics(tabla, timeline)
+    b = compute_metrics(PROCESOS, TRAMOS)
+    for clave in ('finish_time', 'turnaround_time', 'waiting_time', 'response_time'):
+        assert np.array_equal(a['per_process'][clave], b['per_process'][clave])
+    for clave in ('avg_waiting_time', 'avg_turnaround_time', 'avg_response_time', 'percentiles',
+                  'cpu_utilization', 'throughput', 'context_switches', 'total_time', 'makespan'):
+        assert a[clave] == b[clave]
+
+
+def test_makespan_starts_at_first_arrival():
+    procesos = [dict(p, arrival_time=p['arrival_time'] + 2) for p in PROCESOS]
+    tramos = [dict(t, start=t['start'] + 2, end=t['end'] + 2) for t in TRAMOS]
+    m = compute_metrics(procesos, tramos)
+    assert m['total_time'] == 15 and m['makespan'] == 13
+    assert m['cpu_utilization'] == pytest.approx(7 / 13)
+
+
+def test_core_timeline_counts_switches_per_core():
+    procesos = [dict(p, arrival_time=0) for p in PROCESOS]
+    tabla = ProcessTable.from_dicts(procesos)
+    timeline = CoreTimeline(tabla.pid, 2)
+    # Núcleo 0: A 0-2, B 2-4. Núcleo 1: C 0-3, A 3-4 (intercalados por fin)
+    for i, inicio, fin, nucleo in [(0, 0, 2, 0), (2, 0, 3, 1), (1, 2, 4, 0), (0, 3, 4, 1)]:
+        timeline.append(i, inicio, fin, nucleo)
+    m = compute_metrics(tabla, timeline)
+    # Un cambio por núcleo (no A→C→B→A en el orden global)
+    assert m['context_switches'] == 2
+    assert m['cpu_utilization'] == pytest.approx(8 / (4 * 2))
+    assert m['per_process']['finish_time'].tolist() == [4, 4, 3]
+    assert m['per_process']['response_time'].tolist() == [0, 2, 0]
+
+
+def test_empty_trace():
+    m = compute_metrics([], [])
+    assert m['avg_waiting_time'] == 0.0 and m['makespan'] == 0
+    assert m['cpu_utilization'] == 0.0 and m['context_switches'] == 0
+    assert m['percentiles']['waiting_time'] == {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_matches_per_slice_loop(name):
+    rng = random.Random(21)
+    for _ in range(100):
+        procesos = random_processes(rng, rng.randint(1, 12), max_arrival=rng.choice([3, 40]))
+        tramos = run_scheduler(name, procesos, 2 if name == "Round Robin" else None)['timeline']
+        m = compute_metrics(procesos, tramos)
+
+        fin, inicio = {}, {}
+        for t in tramos:
+            fin[t['pid']] = max(fin.get(t['pid'], 0), t['end'])
+            inicio[t['pid']] = min(inicio.get(t['pid'], t['start']), t['start'])
+        espera = [fin[p['pid']] - p['arrival_time'] - p['burst_time'] for p in procesos]
+        respuesta = [inicio[p['pid']] - p['arrival_time'] for p in procesos]
+        makespan = max(fin.values()) - min(p['arrival_time'] for p in procesos)
+        cambios = sum(a['pid'] != b['pid'] for a, b in zip(tramos, tramos[1:]))
+
+        assert m['per_process']['waiting_time'].tolist() == espera
+        assert m['per_process']['response_time'].tolist() == respuesta
+        assert m['avg_waiting_time'] == pytest.approx(sum(espera) / len(espera))
+        assert m['makespan'] == makespan and m['context_switches'] == cambios
+        assert m['cpu_utilization'] == pytest.approx(sum(p['burst_time'] for p in procesos) / makespan)
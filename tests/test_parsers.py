@@ -0,0 +1,104 @@
+# tests/test_parsers.py
+
+import io
+from itertools import islice
+
+from algorithms.parsers import (MENSAJES_PROCESOS_SYNC, iter_lines, parse_actions, parse_processes,
+                                parse_resources)
+
+ARCHIVO = """P1,8,0,1
+
+P2,4,1
+P3,x,2,1
+P4,-1,2,1
+P5,3,-2,1
+P1,2,3,1
+ P6 , 2 , 5 , 0
+P7,1,2,3,4
+"""
+
+
+def test_process_errors_and_valid_rows():
+    tabla, errores = parse_processes(io.StringIO(ARCHIVO))
+    assert tabla.to_dicts() == [
+        {'pid': 'P1', 'burst_time': 8, 'arrival_time': 0, 'priority': 1},
+        {'pid': 'P6', 'burst_time': 2, 'arrival_time': 5, 'priority': 0}
+    ]
+    # Los números de línea cuentan las líneas vacías
+    assert errores == [
+        "Línea 3: formato inválido (se esperan 4 valores separados por coma)",
+        "Línea 4: burst time, arrival time y prioridad deben ser números enteros",
+        "Línea 5: burst time y arrival time no pueden ser negativos",
+        "Línea 6: burst time y arrival time no pueden ser negativos",
+        "Línea 7: el pid P1 está repetido",
+        "Línea 9: formato inválido (se esperan 4 valores separados por coma)"
+    ]
+
+
+def test_custom_messages():
+    _, errores = parse_processes(io.StringIO(ARCHIVO), mensajes=MENSAJES_PROCESOS_SYNC)
+    assert errores[0] == "Línea 3 procesos: formato inválido (4 valores esperados)"
+    assert errores[4] == "Línea 7 procesos: pid P1 repetido"
+
+
+def test_max_errors_summarizes_the_rest():
+    texto = "".join(f"P{k},x,0,1\n" for k in range(10)) + "P10,1,0,1\n"
+    tabla, errores = parse_processes(io.StringIO(texto), max_errors=3)
+    assert len(tabla) == 1
+    assert errores[:3] == [f"Línea {i}: burst time, arrival time y prioridad deben ser números enteros"
+                           for i in (1, 2, 3)]
+    assert errores[3:] == ["... y 7 errores más"]
+
+    # Justo en el tope no hay resumen
+    _, errores = parse_processes(io.StringIO("P1,x,0,1\nP2,y,0,1\n"), max_errors=2)
+    assert len(errores) == 2
+
+
+def test_sources_path_binary_and_text(tmp_path):
+    ruta = tmp_path / "procesos.txt"
+    ruta.write_text("P1,5,0,1\nP2,3,1,2\n", encoding="utf-8")
+    esperado = parse_processes(str(ruta))[0].to_dicts()
+    assert parse_processes(ruta)[0].to_dicts() == esperado
+
+    # Un archivo binario (como el UploadedFile de Streamlit) no se cierra al terminar
+    binario = io.BytesIO(ruta.read_bytes())
+    assert parse_processes(binario)[0].to_dicts() == esperado
+    assert not binario.closed
+    assert parse_processes(io.StringIO(ruta.read_text(encoding="utf-8")))[0].to_dicts() == esperado
+
+
+class Infinito(io.RawIOBase):
+    """Flujo binario sin fin de líneas de proceso: leerlo completo nunca termina."""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        linea = b"P,1,0,1\n"
+        n = len(buffer) - len(buffer) % len(linea)
+        buffer[:n] = linea * (n // len(linea))
+        return n
+
+
+def test_lines_are_streamed():
+    lineas = list(islice(iter_lines(Infinito()), 3))
+    assert lineas == [(1, "P,1,0,1"), (2, "P,1,0,1"), (3, "P,1,0,1")]
+
+
+def test_resources_and_actions():
+    recursos, errores = parse_resources(io.StringIO("R1,1\nR2\nR3,dos\nR4,2\n"))
+    assert recursos == {'R1': 1, 'R4': 2}
+    assert errores == [
+        "Línea 2 recursos: formato inválido (2 valores esperados)",
+        "Línea 3 recursos: contador debe ser entero"
+    ]
+
+    acciones, errores = parse_actions(io.StringIO("P1,read,R1,0\nP2,WRITE,R1,2,3\nP3,READ,R1,x\nP4,READ,R1,1,0\n"))
+    assert acciones == [
+        {'pid': 'P1', 'accion': 'READ', 'recurso': 'R1', 'ciclo': 0, 'duracion': 1},
+        {'pid': 'P2', 'accion': 'WRITE', 'recurso': 'R1', 'ciclo': 2, 'duracion': 3}
+    ]
+    assert errores == [
+        "Línea 3 acciones: ciclo debe ser entero y duración entera mayor que 0",
+        "Línea 4 acciones: ciclo debe ser entero y duración entera mayor que 0"
+    ]
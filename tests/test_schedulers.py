@@ -0,0 +1,65 @@
+# tests/test_schedulers.py
+
+import random
+
+import pytest
+
+from algorithms.priority import priority_scheduler
+from algorithms.registry import SCHEDULERS, run_scheduler
+from algorithms.round_robin import round_robin_scheduler
+from algorithms.sjf import sjf_scheduler
+from tests import legacy
+from tests.util import busy_per_pid, merged, random_processes
+
+
+@pytest.mark.parametrize("nuevo, original", [
+    (sjf_scheduler, legacy.sjf_scheduler),
+    (priority_scheduler, legacy.priority_scheduler),
+], ids=["sjf", "priority"])
+@pytest.mark.parametrize("seed", range(5))
+def test_heap_matches_list_scan(nuevo, original, seed):
+    # Bursts y prioridades repetidos y llegadas simultáneas ejercitan los desempates
+    rng = random.Random(seed)
+    for _ in range(200):
+        procesos = random_processes(rng, rng.randint(1, 15), max_burst=rng.choice([2, 8]),
+                                    max_arrival=rng.choice([0, 4, 20]), zero_bursts=True)
+        assert nuevo(procesos) == original(procesos)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_robin_matches_original(seed):
+    # Con llegadas ordenadas el orden de la cola es el mismo que antes
+    rng = random.Random(seed)
+    for _ in range(200):
+        procesos = sorted(random_processes(rng, rng.randint(1, 12)), key=lambda p: p['arrival_time'])
+        quantum = rng.randint(1, 4)
+        assert round_robin_scheduler(procesos, quantum) == legacy.round_robin_scheduler(procesos, quantum)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_robin_merge_slices(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        procesos = random_processes(rng, rng.randint(1, 12), max_arrival=rng.choice([5, 40]), zero_bursts=True)
+        quantum = rng.randint(1, 4)
+        completo = round_robin_scheduler(procesos, quantum)
+        fusionado = round_robin_scheduler(procesos, quantum, merge_slices=True)
+        assert fusionado['timeline'] == merged(completo['timeline'])
+        assert fusionado['avg_waiting_time'] == completo['avg_waiting_time']
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_schedule_invariants(name):
+    rng = random.Random(7)
+    for _ in range(200):
+        procesos = random_processes(rng, rng.randint(1, 12))
+        quantum = rng.randint(1, 4) if name == "Round Robin" else None
+        resultado = run_scheduler(name, procesos, quantum)
+        tramos = sorted(resultado['timeline'], key=lambda s: s['start'])
+        # La CPU nunca ejecuta dos tramos a la vez
+        assert all(a['end'] <= b['start'] for a, b in zip(tramos, tramos[1:]))
+        assert busy_per_pid(tramos) == {p['pid']: p['burst_time'] for p in procesos}
+        llegada = {p['pid']: p['arrival_time'] for p in procesos}
+        assert all(s['start'] >= llegada[s['pid']] for s in tramos)
+        compacto = run_scheduler(name, procesos, quantum, compact=True)
+        assert compacto['timeline'].to_dicts() == resultado['timeline']
@@ -0,0 +1,117 @@
+# tests/test_smp_online.py
+
+import json
+import random
+
+import pytest
+
+from algorithms.online import OnlineScheduler
+from algorithms.registry import SCHEDULERS, run_scheduler
+from algorithms.smp import smp_schedule
+from tests.util import busy_per_pid, merged, random_processes
+
+
+def quantum_for(rng, name):
+    return rng.randint(1, 4) if name == "Round Robin" else None
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_smp_single_core_matches_scheduler(name):
+    rng = random.Random(5)
+    for _ in range(300):
+        procesos = random_processes(rng, rng.randint(1, 12), zero_bursts=True)
+        quantum = quantum_for(rng, name)
+        esperado = run_scheduler(name, procesos, quantum)
+        for afinidad in (True, False):
+            resultado = smp_schedule(procesos, name, 1, quantum, affinity=afinidad)
+            tramos = sorted(resultado['timeline'], key=lambda s: (s['start'], s['end']))
+            assert merged(tramos) == merged(esperado['timeline'])
+            assert resultado['avg_waiting_time'] == pytest.approx(esperado['avg_waiting_time'])
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_smp_invariants(name):
+    rng = random.Random(9)
+    for _ in range(200):
+        procesos = random_processes(rng, rng.randint(1, 20))
+        nucleos = rng.randint(2, 5)
+        resultado = smp_schedule(procesos, name, nucleos, quantum_for(rng, name),
+                                 stealing=rng.random() < 0.5, affinity=rng.random() < 0.5)
+        tramos = resultado['timeline']
+        # Ni un núcleo ni un proceso ejecutan dos tramos a la vez
+        for clave, valor in [('core', c) for c in range(nucleos)] + [('pid', p['pid']) for p in procesos]:
+            propios = sorted((s for s in tramos if s[clave] == valor), key=lambda s: s['start'])
+            assert all(a['end'] <= b['start'] for a, b in zip(propios, propios[1:]))
+        assert busy_per_pid(tramos) == {p['pid']: p['burst_time'] for p in procesos}
+        llegada = {p['pid']: p['arrival_time'] for p in procesos}
+        assert all(s['start'] >= llegada[s['pid']] for s in tramos)
+
+
+@pytest.mark.parametrize("stealing", [False, True])
+def test_smp_arrival_goes_to_core_freed_in_same_cycle(stealing):
+    # P2 termina en el núcleo 0 en el ciclo 8, justo cuando llega P3
+    procesos = [
+        {'pid': 'P0', 'burst_time': 3, 'arrival_time': 0},
+        {'pid': 'P1', 'burst_time': 20, 'arrival_time': 0},
+        {'pid': 'P2', 'burst_time': 5, 'arrival_time': 1},
+        {'pid': 'P3', 'burst_time': 5, 'arrival_time': 8}
+    ]
+    resultado = smp_schedule(procesos, "FIFO", 2, stealing=stealing)
+    assert sorted((s['core'], s['start'], s['end'], s['pid']) for s in resultado['timeline']) == [
+        (0, 0, 3, 'P0'), (0, 3, 8, 'P2'), (0, 8, 13, 'P3'), (1, 0, 20, 'P1')
+    ]
+    assert resultado['avg_waiting_time'] == 0.5
+    assert resultado['steals'] == 0
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_online_all_at_once(name):
+    rng = random.Random(7)
+    for _ in range(300):
+        procesos = random_processes(rng, rng.randint(1, 14), max_arrival=20, zero_bursts=True)
+        quantum = quantum_for(rng, name)
+        esperado = run_scheduler(name, procesos, quantum)
+        online = OnlineScheduler(name, quantum)
+        for p in procesos:
+            online.push(p['pid'], p['burst_time'], p['arrival_time'], p['priority'])
+        online.advance()
+        assert merged(online.pull()) == merged(esperado['timeline'])
+        assert online.avg_waiting_time == pytest.approx(esperado['avg_waiting_time'])
+
+
+@pytest.mark.parametrize("name", list(SCHEDULERS))
+def test_online_incremental_with_snapshots(name):
+    rng = random.Random(13)
+    for _ in range(300):
+        # Llegadas ordenadas: cada proceso se agrega justo antes de que el reloj lo alcance
+        procesos = sorted(random_processes(rng, rng.randint(1, 14), max_arrival=30, zero_bursts=True),
+                          key=lambda p: p['arrival_time'])
+        quantum = quantum_for(rng, name)
+        esperado = run_scheduler(name, procesos, quantum)
+
+        online = OnlineScheduler(name, quantum)
+        tramos = []
+        pendientes = list(procesos)
+        for corte in sorted(rng.sample(range(35), 5)):
+            while pendientes and pendientes[0]['arrival_time'] <= corte:
+                p = pendientes.pop(0)
+                online.push(p['pid'], p['burst_time'], p['arrival_time'], p['priority'])
+            online.advance(corte)
+            tramos.extend(online.pull())
+            if rng.random() < 0.5:
+                online = OnlineScheduler.restore(json.loads(json.dumps(online.snapshot())))
+        for p in pendientes:
+            online.push(p['pid'], p['burst_time'], p['arrival_time'], p['priority'])
+        online.advance()
+        tramos.extend(online.pull())
+
+        assert merged(tramos) == merged(esperado['timeline'])
+        assert online.avg_waiting_time == pytest.approx(esperado['avg_waiting_time'])
+
+
+def test_online_rejects_arrivals_in_the_past():
+    online = OnlineScheduler("FIFO")
+    online.push("P1", 5, 0)
+    online.advance(3)
+    with pytest.raises(ValueError):
+        online.push("P2", 1, 2)
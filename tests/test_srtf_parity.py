@@ -0,0 +1,36 @@
+# tests/test_srtf_parity.py
+
+import random
+from pathlib import Path
+
+import pytest
+
+from algorithms.parsers import parse_processes
+from algorithms.srtf import srtf_scheduler
+from tests import legacy
+from tests.util import random_processes
+
+DATA = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.mark.parametrize("path", sorted(DATA.glob("process_*.txt")), ids=lambda p: p.name)
+def test_data_files(path):
+    with open(path, encoding="utf-8") as f:
+        tabla, errores = parse_processes(f)
+    assert not errores
+    assert srtf_scheduler(tabla) == legacy.srtf_scheduler(tabla.to_dicts())
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_traces(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        procesos = random_processes(rng, rng.randint(1, 15), max_burst=rng.choice([3, 10]),
+                                    max_arrival=rng.choice([0, 5, 30]))
+        assert srtf_scheduler(procesos) == legacy.srtf_scheduler(procesos)
+
+
+def test_compact_matches_dicts():
+    procesos = random_processes(random.Random(42), 50)
+    compacto = srtf_scheduler(procesos, compact=True)
+    assert compacto['timeline'].to_dicts() == srtf_scheduler(procesos)['timeline']
@@ -0,0 +1,65 @@
+# tests/test_study.py
+
+import random
+import statistics
+
+import pytest
+
+from algorithms.registry import expand_jobs
+from algorithms.study import RunningStats, run_study
+
+
+def acumular(valores):
+    acc = RunningStats()
+    for x in valores:
+        acc.add(x)
+    return acc
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_merge_matches_single_pass(seed):
+    rng = random.Random(seed)
+    valores = [rng.gauss(50, 20) for _ in range(500)]
+    cortes = sorted(rng.sample(range(1, len(valores)), 6))
+    partes = [valores[a:b] for a, b in zip([0] + cortes, cortes + [len(valores)])]
+
+    combinado = RunningStats()
+    # Un acumulador vacío no cambia nada
+    combinado.merge(RunningStats())
+    for parte in partes:
+        combinado.merge(acumular(parte))
+    unico = acumular(valores)
+
+    assert combinado.count == unico.count == len(valores)
+    assert combinado.min == unico.min == min(valores)
+    assert combinado.max == unico.max == max(valores)
+    assert combinado.mean == pytest.approx(unico.mean, rel=1e-12)
+    assert combinado.variance == pytest.approx(unico.variance, rel=1e-9)
+    assert combinado.variance == pytest.approx(statistics.variance(valores), rel=1e-9)
+
+
+def test_few_observations():
+    assert acumular([]).interval() == (0.0, 0.0)
+    uno = acumular([3.0])
+    assert uno.variance == 0.0 and uno.interval() == (3.0, 3.0)
+
+
+def test_workers_do_not_change_results():
+    jobs = expand_jobs(["FIFO", "SRTF", "Round Robin"], [2, 5])
+    progreso = []
+    uno = run_study(jobs, 150, 20, seed=7, max_workers=1)
+    varios = run_study(jobs, 150, 20, seed=7, max_workers=3, progress=lambda hechas, total: progreso.append(hechas))
+    # Idénticos, no solo aproximados: mismo reparto y mismo orden de combinación
+    assert varios == uno
+    assert progreso[-1] == 150 and progreso == sorted(progreso)
+    assert all(fila['traces'] == 150 for fila in uno)
+    assert run_study(jobs, 150, 20, seed=8, max_workers=1) != uno
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        run_study([("FIFO", None)], 0, 10)
+    with pytest.raises(ValueError):
+        run_study([], 10, 10)
+    with pytest.raises(ValueError):
+        run_study([("LIFO", None)], 10, 10)
@@ -0,0 +1,65 @@
+# tests/test_sweep.py
+
+import random
+
+import pytest
+
+from algorithms import sweep
+from algorithms.metrics import compute_metrics
+from algorithms.process_table import ProcessTable
+from algorithms.round_robin import round_robin_scheduler
+from algorithms.sweep import best_quantum, round_robin_sweep
+from tests.util import random_processes
+
+
+def esperado(tabla, quantum):
+    """Fila de referencia: Round Robin sin fusionar tramos + compute_metrics."""
+    metricas = compute_metrics(tabla, round_robin_scheduler(tabla, quantum)['timeline'])
+    return {
+        'quantum': quantum,
+        'avg_waiting_time': pytest.approx(metricas['avg_waiting_time']),
+        'avg_turnaround_time': pytest.approx(metricas['avg_turnaround_time']),
+        'context_switches': metricas['context_switches']
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rows_match_compute_metrics(seed):
+    rng = random.Random(seed)
+    for _ in range(20):
+        tabla = ProcessTable.from_dicts(random_processes(rng, rng.randint(1, 15), max_burst=rng.choice([3, 10]),
+                                                         max_arrival=rng.choice([0, 5, 30])))
+        quanta = [7, 1, 3, 2, 3]
+        filas = round_robin_sweep(tabla, quanta, max_workers=1)
+        assert filas == [esperado(tabla, q) for q in sorted(set(quanta))]
+
+
+def test_parallel_path_matches_inline(monkeypatch):
+    tabla = ProcessTable.from_dicts(random_processes(random.Random(11), 200, max_arrival=300))
+    quanta = range(1, 9)
+    en_linea = round_robin_sweep(tabla, quanta, max_workers=1)
+    monkeypatch.setattr(sweep, "PARALLEL_MIN_WORK", 0)
+    assert round_robin_sweep(tabla, quanta, max_workers=2) == en_linea
+
+
+def test_best_quantum_tie_goes_to_smaller():
+    filas = [
+        {'quantum': 4, 'avg_waiting_time': 2.0, 'context_switches': 3},
+        {'quantum': 2, 'avg_waiting_time': 2.0, 'context_switches': 5},
+        {'quantum': 8, 'avg_waiting_time': 3.0, 'context_switches': 3},
+    ]
+    assert best_quantum(filas)['quantum'] == 2
+    assert best_quantum(filas, 'context_switches')['quantum'] == 4
+    assert best_quantum([]) is None
+
+
+def test_best_quantum_tie_on_real_sweep():
+    # Un solo proceso: todos los quanta dan la misma espera
+    filas = round_robin_sweep([{'pid': 'A', 'burst_time': 5, 'arrival_time': 0, 'priority': 0}], [5, 3, 9])
+    assert {f['avg_waiting_time'] for f in filas} == {0.0}
+    assert best_quantum(filas)['quantum'] == 3
+
+
+def test_invalid_quantum():
+    with pytest.raises(ValueError):
+        round_robin_sweep([{'pid': 'A', 'burst_time': 1, 'arrival_time': 0, 'priority': 0}], [0, 2])
@@ -0,0 +1,157 @@
+# tests/test_sync.py
+
+import random
+from collections import deque
+
+import pytest
+
+from algorithms.sync import simulate_mutex, simulate_rwlock, simulate_semaphore, simulate_semaphore_queue
+from tests import legacy
+from tests.util import random_actions
+
+ESTADOS = ("ACCESSED", "WAITING", "FAILED")
+
+
+def random_case(rng, max_units=3, min_cycle=0, kinds=("READ",)):
+    recursos = {f"R{k}": rng.randint(0, max_units) for k in range(rng.randint(1, 4))}
+    acciones = random_actions(rng, 6, recursos, rng.randint(1, 30), max_cycle=rng.choice([3, 10, 30, 200]),
+                              min_cycle=min_cycle, kinds=kinds)
+    return recursos, acciones
+
+
+def bars(log):
+    return [(e['event'], e['pid'], e['cycle'], e['resource']) for e in log if e['event'] in ESTADOS]
+
+
+def check_capacity(log, recursos):
+    ocupados = dict.fromkeys(recursos, 0)
+    for e in log:
+        if e['event'] == "ACCESSED":
+            ocupados[e['resource']] += 1
+            assert ocupados[e['resource']] <= recursos[e['resource']]
+        elif e['event'] == "RELEASE":
+            ocupados[e['resource']] -= 1
+            assert ocupados[e['resource']] >= 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mutex_matches_page_loop(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        # Ciclos negativos: la página original nunca los procesaba
+        recursos, acciones = random_case(rng, min_cycle=-2)
+        if max(a['ciclo'] for a in acciones) < 0:
+            continue
+        log = simulate_mutex([], recursos, acciones)
+        assert bars(log) == legacy.mutex_page(recursos, acciones)
+        assert log.cycles == max(a['ciclo'] for a in acciones) + 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_semaphore_matches_page_loop(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        recursos, acciones = random_case(rng, min_cycle=-2)
+        if max(a['ciclo'] for a in acciones) < 0:
+            continue
+        log = simulate_semaphore([], recursos, acciones)
+        barras, ciclos = legacy.semaphore_page(recursos, acciones)
+        assert bars(log) == barras
+        assert log.cycles == ciclos
+        check_capacity(log, recursos)
+
+
+def semaphore_queue_brute_force(recursos, acciones):
+    """Semáforo con cola FIFO simulado ciclo a ciclo: (pid, recurso, solicitud, acceso) y los que nunca acceden."""
+    disponibles = dict(recursos)
+    colas = {r: deque() for r in recursos}
+    retenidos = []  # [fin, orden, recurso]
+    accesos = []
+    orden = 0
+    horizonte = max(a['ciclo'] for a in acciones) + sum(a['duracion'] for a in acciones) + 2
+    for t in range(horizonte):
+        for tenencia in sorted(h for h in retenidos if h[0] <= t):
+            retenidos.remove(tenencia)
+            recurso = tenencia[2]
+            if colas[recurso]:
+                pid, duracion, pedido = colas[recurso].popleft()
+                accesos.append((pid, recurso, pedido, t))
+                retenidos.append([t + duracion, orden, recurso])
+                orden += 1
+            else:
+                disponibles[recurso] += 1
+        for a in acciones:
+            if a['ciclo'] != t:
+                continue
+            recurso = a['recurso']
+            if disponibles[recurso] > 0:
+                disponibles[recurso] -= 1
+                accesos.append((a['pid'], recurso, t, t))
+                retenidos.append([t + a['duracion'], orden, recurso])
+                orden += 1
+            else:
+                colas[recurso].append((a['pid'], a['duracion'], t))
+    return sorted(accesos), sorted((pid, r) for r in recursos for pid, _, _ in colas[r])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_semaphore_queue_matches_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        recursos, acciones = random_case(rng)
+        acciones = [dict(a, ciclo=a['ciclo'] % 21) for a in acciones]
+        log = simulate_semaphore_queue([], recursos, acciones)
+        eventos = list(log)
+
+        accesos = []
+        for k, e in enumerate(eventos):
+            if e['event'] == "WAITING" and recursos[e['resource']] > 0:
+                # La duración de WAITING es el tiempo en cola
+                accesos.append((e['pid'], e['resource'], e['cycle'], e['cycle'] + e['duration']))
+            elif e['event'] == "ACCESSED":
+                previo = eventos[k - 1]
+                if previo['event'] == "REQUEST" and previo['cycle'] == e['cycle'] and \
+                        (previo['pid'], previo['resource']) == (e['pid'], e['resource']):
+                    accesos.append((e['pid'], e['resource'], e['cycle'], e['cycle']))
+        fallidos = sorted((e['pid'], e['resource']) for e in eventos if e['event'] == "FAILED")
+
+        assert (sorted(accesos), fallidos) == semaphore_queue_brute_force(recursos, acciones)
+        check_capacity(log, recursos)
+
+
+@pytest.mark.parametrize("prefer_readers", [False, True])
+def test_rwlock_invariants(prefer_readers):
+    rng = random.Random(3)
+    for _ in range(500):
+        recursos, acciones = random_case(rng, kinds=("READ", "READ", "WRITE"))
+        log = simulate_rwlock([], recursos, acciones, prefer_readers=prefer_readers)
+        lectores = dict.fromkeys(recursos, 0)
+        escritores = dict.fromkeys(recursos, 0)
+        pedidos = {r: [] for r in recursos}
+        otorgados = {r: [] for r in recursos}
+        resueltos = 0
+        for e in log:
+            r = e['resource']
+            escritura = acciones[e['action']]['accion'] == "WRITE"
+            if e['event'] == "REQUEST":
+                pedidos[r].append(e['action'])
+            elif e['event'] in ("ACCESSED", "FAILED"):
+                resueltos += 1
+            if e['event'] == "ACCESSED":
+                otorgados[r].append(e['action'])
+                if escritura:
+                    escritores[r] += 1
+                else:
+                    lectores[r] += 1
+                # Un escritor excluye a todos; los lectores no superan la capacidad
+                assert escritores[r] <= 1 and not (escritores[r] and lectores[r])
+                assert lectores[r] <= recursos[r]
+            elif e['event'] == "RELEASE":
+                if escritura:
+                    escritores[r] -= 1
+                else:
+                    lectores[r] -= 1
+        assert resueltos == sum(map(len, pedidos.values()))
+        if not prefer_readers:
+            # Sin preferencia de lectores los accesos respetan el orden de llegada
+            assert all(otorgados[r] == pedidos[r] for r in recursos if recursos[r] > 0)
@@ -0,0 +1,51 @@
+# tests/util.py
+"""Generadores de trazas aleatorias y utilidades comunes de las pruebas."""
+
+import random
+from typing import Dict, List
+
+
+def random_processes(rng: random.Random, n: int, max_burst: int = 8, max_arrival: int = 15,
+                     zero_bursts: bool = False) -> List[Dict]:
+    """n procesos P0..Pn-1 con bursts, llegadas y prioridades al azar."""
+    return [
+        {
+            'pid': f"P{k}",
+            'burst_time': rng.randint(0 if zero_bursts and rng.random() < 0.1 else 1, max_burst),
+            'arrival_time': rng.randint(0, max_arrival),
+            'priority': rng.randint(0, 4)
+        }
+        for k in range(n)
+    ]
+
+
+def random_actions(rng: random.Random, pids: int, recursos: Dict[str, int], n: int,
+                   max_cycle: int = 20, min_cycle: int = 0, kinds=("READ",)) -> List[Dict]:
+    return [
+        {
+            'pid': f"P{rng.randrange(pids)}",
+            'accion': rng.choice(kinds),
+            'recurso': rng.choice(list(recursos)),
+            'ciclo': rng.randint(min_cycle, max_cycle),
+            'duracion': rng.randint(1, 4)
+        }
+        for _ in range(n)
+    ]
+
+
+def merged(timeline) -> List[Dict]:
+    """Tramos (pid, start, end) con los tramos contiguos del mismo pid fusionados."""
+    out = []
+    for s in timeline:
+        if out and out[-1]['pid'] == s['pid'] and out[-1]['end'] == s['start']:
+            out[-1]['end'] = s['end']
+        else:
+            out.append({'pid': s['pid'], 'start': s['start'], 'end': s['end']})
+    return out
+
+
+def busy_per_pid(timeline) -> Dict[str, int]:
+    total = {}
+    for s in timeline:
+        total[s['pid']] = total.get(s['pid'], 0) + s['end'] - s['start']
+    return total